@@ -0,0 +1,103 @@
+import json
+import os
+import zipfile
+
+from src.utilitybox.auxiliar.split_volumes import open_archive_file
+
+"""
+Archive manifest Params (name of the manifest member of the incremental archives and version of its format).
+"""
+MANIFEST_NAME = '.utilitybox_manifest.json'
+MANIFEST_VERSION = 1
+
+
+def read_manifest(archive_path: str) -> dict | None:
+    """
+    Reads the manifest of an incremental ZIP archive.
+
+    The manifest describes the changes stored in the archive since the previous archive of its chain:
+        'previous': the path of the previous archive, relative to the folder of the archive (empty for
+            the first archive of the chain);
+        'files': the files added or changed, by source path ('arcname', 'size', 'mtime_ns', 'hash' and 'stored',
+            False when only the modification time changed and the content is kept in an earlier archive);
+        'deleted': the source paths of the files removed since the previous archive (tombstones).
+
+    Params:
+        archive_path (str): The path of the archive or of the first volume of a split archive.
+
+    Returns:
+        dict | None: The manifest, or None if the archive isn't an incremental archive.
+    """
+    with open_archive_file(archive_path) as archive_file, zipfile.ZipFile(archive_file) as archive:
+        try:
+            return json.loads(archive.read(MANIFEST_NAME))
+        except KeyError:
+            return None
+
+
+def write_manifest(archive_path: str, files: dict[str, dict], deleted: list[str], previous_archive_path: str) -> None:
+    """
+    Adds the manifest to an incremental ZIP archive.
+
+    Params:
+        archive_path (str): The path of the archive.
+        files (dict[str, dict]): The files added or changed, by source path.
+        deleted (list[str]): The source paths of the files removed since the previous archive.
+        previous_archive_path (str): The path of the previous archive of the chain (empty for the first one).
+    """
+    if previous_archive_path:
+        try:
+            previous_archive_path = os.path.relpath(previous_archive_path, os.path.dirname(archive_path))
+        except ValueError:
+            # Archives on different drives can only be linked by absolute path
+            previous_archive_path = os.path.abspath(previous_archive_path)
+    manifest = {'version': MANIFEST_VERSION, 'previous': previous_archive_path, 'files': files, 'deleted': deleted}
+    with zipfile.ZipFile(archive_path, 'a', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(MANIFEST_NAME, json.dumps(manifest, sort_keys=True))
+
+
+def archive_chain(archive_path: str) -> list[tuple[str, dict]]:
+    """
+    Follows the links between incremental archives, from an archive back to the first archive of its chain.
+
+    Params:
+        archive_path (str): The path of the last archive of the chain.
+
+    Returns:
+        list[tuple[str, dict]]: The path and the manifest of every archive of the chain, the first archive first.
+    """
+    chain = []
+    current_archive_path = os.path.abspath(archive_path)
+    while current_archive_path:
+        if any(chain_archive_path == current_archive_path for chain_archive_path, _ in chain):
+            raise ValueError(f'The chain of {archive_path} links back to {current_archive_path}.')
+        manifest = read_manifest(current_archive_path)
+        if manifest is None:
+            raise ValueError(f'{current_archive_path} is not an incremental archive.')
+        chain.append((current_archive_path, manifest))
+        current_archive_path = os.path.normpath(os.path.join(os.path.dirname(current_archive_path),
+                                                             manifest['previous'])) if manifest['previous'] else ''
+    chain.reverse()
+    return chain
+
+
+def replay_manifests(archive_path: str) -> dict[str, dict]:
+    """
+    Provides the state of the files at the time an incremental archive was created, by replaying the
+    manifests of its chain (changed files replace the older versions, tombstones remove the files).
+
+    Params:
+        archive_path (str): The path of the last archive of the chain.
+
+    Returns:
+        dict[str, dict]: The latest entry of every file by source path, including the path of the
+            archive containing its content ('archive').
+    """
+    files_state = {}
+    for chain_archive_path, manifest in archive_chain(archive_path):
+        for deleted_path in manifest['deleted']:
+            files_state.pop(deleted_path, None)
+        for file_path, entry in manifest['files'].items():
+            content_archive_path = chain_archive_path if entry['stored'] else files_state[file_path]['archive']
+            files_state[file_path] = dict(entry, archive=content_archive_path)
+    return files_state
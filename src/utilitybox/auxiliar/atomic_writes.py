@@ -0,0 +1,132 @@
+import json
+import os
+import shutil
+import uuid
+from typing import Any, Callable
+
+from src.utilitybox.auxiliar.project_paths import get_project_journal_path
+
+"""
+Atomic writes Params (size of the buffers used for reading and writing the files, so large files are
+transferred with few large system calls, and prefix of the temporary files).
+"""
+IO_BUFFER_SIZE = 8 * 1024 * 1024
+TEMPORARY_FILE_PREFIX = '.ubtmp_'
+
+
+def _sync_folder(folder_path: str) -> None:
+    """
+    Flushes a folder to the disk, so the files created, renamed or removed in it survive a crash.
+
+    Params:
+        folder_path (str): The path of the folder.
+
+    Notes:
+        Folders can't be opened on Windows, where the renames are already durable once completed.
+    """
+    if os.name == 'nt':
+        return
+    folder_descriptor = os.open(folder_path, os.O_RDONLY)
+    try:
+        os.fsync(folder_descriptor)
+    finally:
+        os.close(folder_descriptor)
+
+
+def _write_journal_entry(journal_path: str, entry: dict[str, str]) -> None:
+    """
+    Writes a journal entry and flushes it to the disk.
+
+    Params:
+        journal_path (str): The path of the journal entry file.
+        entry (dict[str, str]): The details of the journaled rewrite.
+    """
+    with open(journal_path, 'w', encoding='utf-8') as journal_file:
+        json.dump(entry, journal_file)
+        journal_file.flush()
+        os.fsync(journal_file.fileno())
+    _sync_folder(os.path.dirname(journal_path))
+
+
+def replace_file_contents(file_path: str, transform: Callable, *args, operation_identifier: str = '',
+                          journal_folder: str = '') -> Any:
+    """
+    Rewrites a file through a temporary file of the same folder, replacing the original file only
+    once the new contents are complete and flushed to the disk.
+
+    The rewrite is journaled before the temporary file is created, so a rewrite interrupted by a crash
+    is found and rolled back by 'recover_interrupted_writes'. The original file is left intact until it
+    is atomically replaced, and is also left intact if the transform fails.
+
+    Params:
+        file_path (str): The path of the file.
+        transform (Callable): The function writing the new contents, called with the other
+            parameters, the opened original file and the opened temporary file.
+        *args: The other parameters of the transform.
+        operation_identifier (str, optional): The operation rewriting the file (e.g. 'Encryption'), stored in the journal.
+        journal_folder (str, optional): The folder of the journal. Defaults to the project's journal folder.
+
+    Returns:
+        Any: The value returned by the transform.
+    """
+    journal_folder = journal_folder or get_project_journal_path()
+    os.makedirs(journal_folder, exist_ok=True)
+    rewrite_id = uuid.uuid4().hex
+    file_path = os.path.abspath(file_path)
+    temporary_path = os.path.join(os.path.dirname(file_path), TEMPORARY_FILE_PREFIX + rewrite_id)
+    journal_path = os.path.join(journal_folder, rewrite_id + '.json')
+    _write_journal_entry(journal_path, {'file_path': file_path, 'temporary_path': temporary_path,
+                                        'operation': operation_identifier})
+    try:
+        with (open(file_path, 'rb', buffering=IO_BUFFER_SIZE) as source,
+              open(temporary_path, 'xb', buffering=IO_BUFFER_SIZE) as destination):
+            result = transform(*args, source, destination)
+            destination.flush()
+            os.fsync(destination.fileno())
+            # The written contents are not read again, so they don't need to stay in the page cache
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(destination.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        shutil.copymode(file_path, temporary_path)
+        os.replace(temporary_path, file_path)
+        _sync_folder(os.path.dirname(file_path))
+        return result
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+    finally:
+        os.remove(journal_path)
+
+
+def recover_interrupted_writes(journal_folder: str = '') -> list[tuple[str, str]]:
+    """
+    Rolls back the file rewrites interrupted by a crash (runs when the application starts).
+
+    The original file of an interrupted rewrite is still intact, so only its temporary file is removed.
+    A rewrite whose temporary file no longer exists was completed before the crash.
+
+    Params:
+        journal_folder (str, optional): The folder of the journal. Defaults to the project's journal folder.
+
+    Returns:
+        list[tuple[str, str]]: The operation and the path of the file of every rolled back rewrite.
+    """
+    journal_folder = journal_folder or get_project_journal_path()
+    if not os.path.isdir(journal_folder):
+        return []
+
+    rolled_back_writes = []
+    for journal_name in os.listdir(journal_folder):
+        journal_path = os.path.join(journal_folder, journal_name)
+        try:
+            with open(journal_path, encoding='utf-8') as journal_file:
+                entry = json.load(journal_file)
+            if os.path.exists(entry['temporary_path']):
+                os.remove(entry['temporary_path'])
+                rolled_back_writes.append((entry['operation'], entry['file_path']))
+        except (OSError, ValueError, KeyError) as e:
+            # An entry can only be incomplete if the crash happened before its temporary file was created
+            print('Recovering writes Error: \n\t' + str(e))
+        os.remove(journal_path)
+
+    return rolled_back_writes
@@ -0,0 +1,337 @@
+import hashlib
+import os
+import sqlite3
+import time
+import zlib
+from typing import BinaryIO, Iterable, Iterator
+
+from src.utilitybox.auxiliar.parallel_zip import member_target_path
+
+"""
+Content-defined chunking Params (bounds and average size of the chunks, bit patterns marking a boundary
+before and after the average size, and size of the reads).
+"""
+MIN_CHUNK_SIZE = 16 * 1024
+AVERAGE_CHUNK_SIZE = 64 * 1024
+MAX_CHUNK_SIZE = 256 * 1024
+STRICT_BOUNDARY_PATTERN = bytes(int(bit) for bit in '101100111000101101')
+LOOSE_BOUNDARY_PATTERN = bytes(int(bit) for bit in '10110011100010')
+READ_SIZE = 4 * 1024 * 1024
+
+"""
+Chunk store Params (size after which a new pack file is started, compression level of the chunks and
+size of the chunk digests).
+"""
+PACK_SIZE = 64 * 1024 * 1024
+CHUNK_COMPRESSION_LEVEL = 6
+DIGEST_SIZE = 32
+
+# One pseudo-random bit per byte value (as a translation table), the bits of the bytes form the rolling window
+BOUNDARY_BITS_TABLE = bytes(hashlib.blake2b(bytes([byte]), digest_size=1).digest()[0] & 1 for byte in range(256))
+
+
+def find_cut_point(data: bytes | bytearray, length: int) -> int:
+    """
+    Finds where the first chunk of the data ends, based on the content of the data.
+
+    Every byte is mapped to one pseudo-random bit and a boundary follows the bytes whose bits form the
+    boundary pattern, so a boundary only depends on the last 18 bytes (14 after the average size) and
+    inserting or removing bytes in a file only moves the boundaries near the change. The mapping and the
+    search are done by 'bytes.translate' and 'bytes.find', so the data isn't iterated byte by byte in Python.
+    The chunk is at least 'MIN_CHUNK_SIZE' long and at most 'MAX_CHUNK_SIZE' long; the longer pattern makes
+    a boundary harder to find before 'AVERAGE_CHUNK_SIZE' and the shorter one easier after it, so most
+    chunks are close to the average size.
+
+    Params:
+        data (bytes | bytearray): The data.
+        length (int): The length of the data to consider.
+
+    Returns:
+        int: The length of the first chunk.
+    """
+    if length <= MIN_CHUNK_SIZE:
+        return length
+    end = min(MAX_CHUNK_SIZE, length)
+    bits = data[MIN_CHUNK_SIZE:end].translate(BOUNDARY_BITS_TABLE)
+    position = bits.find(STRICT_BOUNDARY_PATTERN, 0, min(AVERAGE_CHUNK_SIZE, end) - MIN_CHUNK_SIZE)
+    if position >= 0:
+        return MIN_CHUNK_SIZE + position + len(STRICT_BOUNDARY_PATTERN)
+    # Only the boundaries past the average size are searched with the shorter pattern
+    position = bits.find(LOOSE_BOUNDARY_PATTERN,
+                         max(AVERAGE_CHUNK_SIZE - MIN_CHUNK_SIZE - len(LOOSE_BOUNDARY_PATTERN) + 1, 0))
+    if position >= 0:
+        return MIN_CHUNK_SIZE + position + len(LOOSE_BOUNDARY_PATTERN)
+    return end
+
+
+def iter_chunks(file: BinaryIO) -> Iterator[bytes]:
+    """
+    Splits the content of a file in content-defined chunks.
+
+    Params:
+        file (BinaryIO): The file, opened in binary mode.
+
+    Returns:
+        Iterator[bytes]: The chunks of the file, in order.
+    """
+    buffer = bytearray()
+    end_of_file = False
+    while not end_of_file:
+        data = file.read(READ_SIZE)
+        end_of_file = not data
+        buffer += data
+        while len(buffer) >= MAX_CHUNK_SIZE or (end_of_file and buffer):
+            cut_point = find_cut_point(buffer, len(buffer))
+            yield bytes(buffer[:cut_point])
+            del buffer[:cut_point]
+
+
+class ChunkStore:
+    """
+    Utility class for archiving snapshots of files while storing every distinct chunk of content only once.
+
+    The files are split in content-defined chunks. Every chunk not already in the store is compressed and
+    appended to a pack file, and the index (a SQLite database) records where each chunk is stored.
+    A snapshot only lists, for every file, the digests of its chunks, so archiving a new version of a
+    folder tree only writes the chunks that changed. The files whose size and modification time are
+    the same as in the latest snapshot containing them are not read at all.
+
+    Attributes:
+        self.store_path (str): The path of the index database; the packs are stored in the '.packs' folder
+            next to it.
+        self.packs_path (str): The folder containing the pack files.
+        self.connection (sqlite3.Connection): The connection to the index database.
+        self.pack_files (dict[int, BinaryIO]): The pack files opened for reading, by pack number.
+    """
+
+    def __init__(self, store_path: str):
+        """
+        Initialize the ChunkStore object, creating the store if it doesn't exist.
+
+        Params:
+            store_path (str): The path of the index database of the store.
+        """
+        self.store_path = os.path.abspath(store_path)
+        self.packs_path = self.store_path + '.packs'
+        os.makedirs(self.packs_path, exist_ok=True)
+        self.connection = sqlite3.connect(self.store_path)
+        self.connection.executescript('''
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS chunks (
+                digest BLOB PRIMARY KEY,
+                pack INTEGER NOT NULL,
+                offset INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                compressed INTEGER NOT NULL
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS snapshots (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE,
+                created_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS snapshot_files (
+                snapshot_id INTEGER NOT NULL REFERENCES snapshots (id),
+                arcname TEXT NOT NULL,
+                source_path TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                chunks BLOB NOT NULL,
+                PRIMARY KEY (snapshot_id, arcname)
+            );
+            CREATE INDEX IF NOT EXISTS snapshot_files_by_source ON snapshot_files (source_path, snapshot_id);
+        ''')
+        self.pack_files = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the pack files and the connection to the index database.
+        """
+        for pack_file in self.pack_files.values():
+            pack_file.close()
+        self.pack_files.clear()
+        self.connection.close()
+
+    def _pack_path(self, pack_number: int) -> str:
+        return os.path.join(self.packs_path, f'pack_{pack_number:06d}.pack')
+
+    def _open_writable_pack(self) -> tuple[int, BinaryIO]:
+        """
+        Opens the pack file where the new chunks are appended (a new pack once the last one is full).
+
+        Returns:
+            tuple[int, BinaryIO]: The number of the pack and the pack file, opened for appending.
+        """
+        pack_number = self.connection.execute('SELECT COALESCE(MAX(pack), 0) FROM chunks').fetchone()[0]
+        if os.path.exists(self._pack_path(pack_number)) and \
+                os.path.getsize(self._pack_path(pack_number)) >= PACK_SIZE:
+            pack_number += 1
+        return pack_number, open(self._pack_path(pack_number), 'ab')
+
+    def _finish_pack(self, pack_number: int, pack_file: BinaryIO) -> None:
+        """
+        Flushes a pack file to disk and closes it.
+
+        Params:
+            pack_number (int): The number of the pack.
+            pack_file (BinaryIO): The pack file, opened for appending.
+        """
+        try:
+            pack_file.flush()
+            os.fsync(pack_file.fileno())
+        finally:
+            pack_file.close()
+            # The appended chunks must be visible to the pack files already opened for reading
+            self.pack_files.pop(pack_number, None)
+
+    def _latest_file_version(self, source_path: str) -> tuple[int, int, bytes] | None:
+        """
+        Provides the size, modification time and chunks of a file in the latest snapshot containing it.
+
+        Params:
+            source_path (str): The absolute path of the file.
+
+        Returns:
+            tuple[int, int, bytes] | None: The size, the modification time and the concatenated digests
+                of the chunks of the file, or None if no snapshot contains it.
+        """
+        return self.connection.execute(
+            'SELECT size, mtime_ns, chunks FROM snapshot_files WHERE source_path = ? '
+            'ORDER BY snapshot_id DESC LIMIT 1', (source_path,)).fetchone()
+
+    def create_snapshot(self, name: str, files: Iterable[tuple[str, str]]) -> tuple[int, int]:
+        """
+        Archives the current content of files as a new snapshot.
+
+        The new chunks are appended to the last pack, and to a new pack every time the current one reaches
+        the pack size. The packs are flushed to disk before the index is committed, so the index never refers
+        to chunks that were lost; an interrupted snapshot leaves no trace in the index.
+
+        Params:
+            name (str): The name of the snapshot.
+            files (Iterable[tuple[str, str]]): The path of every file and its name inside the snapshot.
+
+        Returns:
+            tuple[int, int]: The number of chunks stored and the number of bytes appended to the packs.
+        """
+        stored_chunks, stored_bytes = 0, 0
+        pack_number, pack_file = self._open_writable_pack()
+        try:
+            with self.connection:
+                snapshot_id = self.connection.execute('INSERT INTO snapshots (name, created_at) VALUES (?, ?)',
+                                                      (name, time.time())).lastrowid
+                for file_path, arcname in files:
+                    source_path = os.path.abspath(file_path)
+                    file_stat = os.stat(source_path)
+                    latest_version = self._latest_file_version(source_path)
+                    if latest_version and latest_version[:2] == (file_stat.st_size, file_stat.st_mtime_ns):
+                        file_chunks = latest_version[2]
+                    else:
+                        digests = []
+                        with open(source_path, 'rb') as file:
+                            for chunk in iter_chunks(file):
+                                digest = hashlib.blake2b(chunk, digest_size=DIGEST_SIZE).digest()
+                                digests.append(digest)
+                                if self.connection.execute('SELECT 1 FROM chunks WHERE digest = ?',
+                                                           (digest,)).fetchone():
+                                    continue
+                                if pack_file.tell() >= PACK_SIZE:
+                                    self._finish_pack(pack_number, pack_file)
+                                    pack_number, pack_file = pack_number + 1, open(
+                                        self._pack_path(pack_number + 1), 'ab')
+                                compressed_chunk = zlib.compress(chunk, CHUNK_COMPRESSION_LEVEL)
+                                is_compressed = len(compressed_chunk) < len(chunk)
+                                stored_chunk = compressed_chunk if is_compressed else chunk
+                                self.connection.execute(
+                                    'INSERT INTO chunks (digest, pack, offset, length, compressed) '
+                                    'VALUES (?, ?, ?, ?, ?)',
+                                    (digest, pack_number, pack_file.tell(), len(stored_chunk), is_compressed))
+                                pack_file.write(stored_chunk)
+                                stored_chunks += 1
+                                stored_bytes += len(stored_chunk)
+                        file_chunks = b''.join(digests)
+                    self.connection.execute(
+                        'INSERT INTO snapshot_files (snapshot_id, arcname, source_path, size, mtime_ns, chunks) '
+                        'VALUES (?, ?, ?, ?, ?, ?)',
+                        (snapshot_id, arcname, source_path, file_stat.st_size, file_stat.st_mtime_ns, file_chunks))
+                self._finish_pack(pack_number, pack_file)
+        finally:
+            if not pack_file.closed:
+                pack_file.close()
+                self.pack_files.pop(pack_number, None)
+
+        return stored_chunks, stored_bytes
+
+    def list_snapshots(self) -> list[tuple[str, float]]:
+        """
+        Lists the snapshots of the store.
+
+        Returns:
+            list[tuple[str, float]]: The name and the creation time of every snapshot, the oldest first.
+        """
+        return self.connection.execute('SELECT name, created_at FROM snapshots ORDER BY id').fetchall()
+
+    def read_chunk(self, digest: bytes) -> bytes:
+        """
+        Reads a chunk from its pack file and checks its content.
+
+        Params:
+            digest (bytes): The digest of the chunk.
+
+        Returns:
+            bytes: The content of the chunk.
+        """
+        chunk_location = self.connection.execute(
+            'SELECT pack, offset, length, compressed FROM chunks WHERE digest = ?', (digest,)).fetchone()
+        if chunk_location is None:
+            raise KeyError(f'The chunk {digest.hex()} is missing from the store.')
+        pack_number, offset, length, is_compressed = chunk_location
+        if pack_number not in self.pack_files:
+            self.pack_files[pack_number] = open(self._pack_path(pack_number), 'rb')
+        pack_file = self.pack_files[pack_number]
+        pack_file.seek(offset)
+        chunk = pack_file.read(length)
+        if is_compressed:
+            try:
+                chunk = zlib.decompress(chunk)
+            except zlib.error:
+                raise ValueError(f'The chunk {digest.hex()} is corrupted.')
+        if hashlib.blake2b(chunk, digest_size=DIGEST_SIZE).digest() != digest:
+            raise ValueError(f'The chunk {digest.hex()} is corrupted.')
+        return chunk
+
+    def restore_snapshot(self, destination_path: str, name: str = '') -> list[str]:
+        """
+        Restores the files of a snapshot by reassembling their chunks.
+
+        Params:
+            destination_path (str): The destination folder for the restored files.
+            name (str, optional): The name of the snapshot. Defaults to the latest snapshot if not specified.
+
+        Returns:
+            list[str]: The names of the restored files.
+        """
+        if name:
+            snapshot = self.connection.execute('SELECT id FROM snapshots WHERE name = ?', (name,)).fetchone()
+        else:
+            snapshot = self.connection.execute('SELECT id FROM snapshots ORDER BY id DESC LIMIT 1').fetchone()
+        if snapshot is None:
+            raise KeyError(f'The snapshot {name or "(latest)"} is missing from the store.')
+
+        destination_path = os.path.abspath(destination_path)
+        restored_files = []
+        for arcname, file_chunks in self.connection.execute(
+                'SELECT arcname, chunks FROM snapshot_files WHERE snapshot_id = ? ORDER BY arcname',
+                (snapshot[0],)).fetchall():
+            target_path = member_target_path(destination_path, arcname)
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            with open(target_path, 'wb') as target:
+                for chunk_start in range(0, len(file_chunks), DIGEST_SIZE):
+                    target.write(self.read_chunk(file_chunks[chunk_start:chunk_start + DIGEST_SIZE]))
+            restored_files.append(arcname)
+        return restored_files
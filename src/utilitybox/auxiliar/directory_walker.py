@@ -0,0 +1,141 @@
+import fnmatch
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
+"""
+Default walking Params (number of listing threads, maximum number of entry batches waiting to be consumed
+and number of entries handed over to the consumer at once).
+"""
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_QUEUE_SIZE = 64
+ENTRIES_BATCH_SIZE = 256
+
+# Marks the end of the walk in the entries queue
+_WALK_FINISHED = object()
+
+
+def is_excluded(entry_name: str, exclude_patterns: list[str]) -> bool:
+    """
+    Checks if a file or folder name matches any of the exclude patterns.
+
+    Params:
+        entry_name (str): The name of the file or folder.
+        exclude_patterns (list[str]): Shell-style patterns (e.g. '.git', '*.tmp').
+    """
+    return any(fnmatch.fnmatch(entry_name, pattern) for pattern in exclude_patterns)
+
+
+def walk_files(folder_path: str, recursive: bool = True, max_depth: int | None = None,
+               exclude_patterns: list[str] | None = None, max_workers: int = DEFAULT_MAX_WORKERS,
+               queue_size: int = DEFAULT_QUEUE_SIZE) -> Iterator[os.DirEntry]:
+    """
+    Walks a folder tree and yields the files found in it.
+
+    The folders are listed with 'os.scandir' by a pool of threads, so the latency of listing
+    folders located on network mounts or cold caches is overlapped. The entries found are passed
+    to the caller in batches through a bounded queue, so the walk never gets far ahead of the consumer.
+
+    Params:
+        folder_path (str): The folder path where the walk starts.
+        recursive (bool, optional): Walk the subfolders as well. Defaults to True.
+        max_depth (int | None, optional): The maximum depth of the subfolders walked when recursive
+            (0 means only the folder itself). Defaults to no limit.
+        exclude_patterns (list[str] | None, optional): Shell-style patterns of file and folder names skipped.
+        max_workers (int, optional): The number of threads listing folders.
+        queue_size (int, optional): The maximum number of entry batches waiting to be consumed.
+
+    Returns:
+        Iterator[os.DirEntry]: The entries of the files found. Their cached type and stat information
+            can be reused by the caller. The order of the entries is not guaranteed when walking subfolders.
+
+    Notes:
+        Symbolic links to folders are not followed. Folders that can not be listed are skipped.
+        Closing the iterator before it is exhausted stops the walk.
+    """
+    exclude_patterns = exclude_patterns or []
+    entries_queue = queue.Queue(maxsize=queue_size)
+    stop_event = threading.Event()
+    pending_folders_lock = threading.Lock()
+    pending_folders = [1]
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def put_batch(item) -> bool:
+        while not stop_event.is_set():
+            try:
+                entries_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def scan_folder(current_folder: str, depth: int) -> None:
+        subfolders, entries_batch = [], []
+        try:
+            with os.scandir(current_folder) as entries:
+                for entry in entries:
+                    if exclude_patterns and is_excluded(entry.name, exclude_patterns):
+                        continue
+                    if entry.is_file():
+                        entries_batch.append(entry)
+                        if len(entries_batch) == ENTRIES_BATCH_SIZE:
+                            if not put_batch(entries_batch):
+                                return
+                            entries_batch = []
+                    elif (recursive and entry.is_dir(follow_symlinks=False)
+                          and (max_depth is None or depth < max_depth)):
+                        subfolders.append(entry.path)
+        except OSError as ose:
+            print('Scanning folder Error: \n\t' + str(ose))
+        finally:
+            if entries_batch:
+                put_batch(entries_batch)
+            with pending_folders_lock:
+                pending_folders[0] += len(subfolders) - 1
+                walk_finished = pending_folders[0] == 0
+            if walk_finished:
+                put_batch(_WALK_FINISHED)
+
+        for subfolder in subfolders:
+            if stop_event.is_set():
+                return
+            try:
+                executor.submit(scan_folder, subfolder, depth + 1)
+            except RuntimeError:
+                return
+
+    executor.submit(scan_folder, folder_path, 0)
+    try:
+        while True:
+            entries_batch = entries_queue.get()
+            if entries_batch is _WALK_FINISHED:
+                break
+            yield from entries_batch
+    finally:
+        stop_event.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def collect_files(path: str, file_extensions: list[str] | None = None, recursive: bool = True) -> Iterator[str]:
+    """
+    Provides the files designated by a path: the file itself, or the files of a folder tree.
+
+    Params:
+        path (str): The path of a file or of a folder.
+        file_extensions (list[str] | None, optional): Only provide the files of a folder having one of
+            these extensions (e.g. 'txt', 'tar.gz'). All the files are provided if not specified.
+        recursive (bool, optional): Provide the files of the subfolders as well. Defaults to True.
+
+    Returns:
+        Iterator[str]: The paths of the files.
+    """
+    if os.path.isfile(path):
+        yield path
+        return
+
+    extension_suffixes = tuple('.' + extension.lstrip('.') for extension in file_extensions or [] if extension)
+    for entry in walk_files(path, recursive):
+        if not extension_suffixes or entry.name.endswith(extension_suffixes):
+            yield entry.path
@@ -1,4 +1,6 @@
 import os
+from itertools import islice
+from typing import Iterable, Iterator
 
 
 def split_extensions(list_of_file_extensions: str) -> list[str]:
@@ -21,12 +23,12 @@ def split_extensions(list_of_file_extensions: str) -> list[str]:
     return cleaned_list_of_file_extensions
 
 
-def group_files_by_extensions(list_of_files) -> dict[str, list[str]]:
+def group_files_by_extensions(list_of_files: Iterable[str]) -> dict[str, list[str]]:
     """
     Group a list of file paths based on their extensions into a dictionary.
 
     Params:
-        list_of_files (list[str]): A list of file paths.
+        list_of_files (Iterable[str]): A list (or any iterable) of file paths.
     """
     grouped_list = {}
     for file in list_of_files:
@@ -37,3 +39,19 @@ def group_files_by_extensions(list_of_files) -> dict[str, list[str]]:
         grouped_list[file_extension].append(file_name)
 
     return grouped_list
+
+
+def iterate_in_batches(results: Iterable, batch_size: int) -> Iterator[list]:
+    """
+    Split an iterable of operation results (e.g. file paths) into consecutive lists of bounded size,
+    consuming it lazily.
+
+    Params:
+        results (Iterable): An iterable of operation results.
+        batch_size (int): The maximum number of results in each list.
+    """
+    results_iterator = iter(results)
+    batch = list(islice(results_iterator, batch_size))
+    while batch:
+        yield batch
+        batch = list(islice(results_iterator, batch_size))
@@ -0,0 +1,313 @@
+import os
+import sqlite3
+from typing import Iterable, Iterator
+
+from src.utilitybox.auxiliar.project_paths import get_project_index_path
+
+
+class FileIndex:
+    """
+    Utility class for keeping a persistent index of the files located in the searched folders.
+
+    The index is stored in a SQLite database and contains the name, extension, size, modification
+    time and parent folder of every indexed file. It is updated incrementally: a folder is listed
+    again only when its modification time differs from the one recorded in the index.
+
+    Optionally, the index also keeps a trigram inverted index of the file names (every sequence of
+    three consecutive characters of a name, lowercased, pointing to the files containing it). Substring
+    searches then only verify the files containing all the trigrams of the searched keyword.
+
+    Attributes:
+        self.index_path (str): The path of the database file containing the index.
+        self.connection (sqlite3.Connection): The connection to the index database.
+        self.use_trigrams (bool): Flag indicating whether the trigram index is maintained and used.
+    """
+
+    def __init__(self, index_path: str = '', use_trigrams: bool = False):
+        """
+        Initialize the FileIndex object.
+
+        Params:
+            index_path (str, optional): The path of the database file containing the index.
+                Defaults to the project's index path if not specified.
+            use_trigrams (bool, optional): Build and maintain the trigram index of the file names.
+                Once built, the trigram index is kept up to date by every later use of the database.
+        """
+        if not index_path:
+            index_path = get_project_index_path()
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        self.index_path = index_path
+        self.connection = sqlite3.connect(index_path)
+        self._create_tables()
+
+        trigrams_enabled = self.connection.execute(
+            "SELECT value FROM settings WHERE key = 'trigrams'").fetchone() is not None
+        self.use_trigrams = use_trigrams or trigrams_enabled
+        if self.use_trigrams and not trigrams_enabled:
+            self._build_trigrams()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the connection to the index database.
+        """
+        self.connection.close()
+
+    def _create_tables(self) -> None:
+        """
+        Creates the tables of the index if they don't exist.
+        """
+        self.connection.executescript('''
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS folders (
+                path TEXT PRIMARY KEY,
+                parent TEXT NOT NULL,
+                mtime_ns INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS files (
+                id INTEGER PRIMARY KEY,
+                parent TEXT NOT NULL,
+                name TEXT NOT NULL,
+                extension TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS trigrams (
+                gram TEXT NOT NULL,
+                file_id INTEGER NOT NULL,
+                PRIMARY KEY (gram, file_id)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS settings (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS folders_parent ON folders (parent);
+            CREATE INDEX IF NOT EXISTS files_parent ON files (parent);
+            CREATE INDEX IF NOT EXISTS files_extension ON files (extension);
+            CREATE INDEX IF NOT EXISTS trigrams_file_id ON trigrams (file_id);
+        ''')
+
+    @staticmethod
+    def generate_trigrams(text: str) -> set[str]:
+        """
+        Provides the trigrams (sequences of three consecutive characters) of a lowercased text.
+
+        Params:
+            text (str): The text, usually a file name or a searched keyword.
+        """
+        lowered_text = text.lower()
+        return {lowered_text[position:position + 3] for position in range(len(lowered_text) - 2)}
+
+    def _index_trigrams(self, files: Iterable[tuple[int, str]]) -> None:
+        """
+        Adds the trigrams of the file names to the trigram index.
+
+        Params:
+            files (Iterable[tuple[int, str]]): The id and name of every file.
+        """
+        self.connection.executemany('INSERT OR IGNORE INTO trigrams (gram, file_id) VALUES (?, ?)',
+                                    ((gram, file_id) for file_id, name in files
+                                     for gram in self.generate_trigrams(name)))
+
+    def _build_trigrams(self) -> None:
+        """
+        Builds the trigram index for all the files already indexed.
+        """
+        self.connection.execute('DELETE FROM trigrams')
+        self._index_trigrams(self.connection.execute('SELECT id, name FROM files').fetchall())
+        self.connection.execute("INSERT OR REPLACE INTO settings (key, value) VALUES ('trigrams', '1')")
+        self.connection.commit()
+
+    @staticmethod
+    def normalize_path(folder_path: str) -> str:
+        """
+        Provides the absolute and normalized form of a folder path, as stored in the index.
+
+        Params:
+            folder_path (str): The path of the folder.
+        """
+        return os.path.abspath(folder_path)
+
+    @staticmethod
+    def _subtree_bounds(folder_path: str) -> tuple[str, str]:
+        """
+        Provides the range of paths located under a folder, used for range queries on the index.
+
+        Params:
+            folder_path (str): The normalized path of the folder.
+        """
+        prefix = folder_path.rstrip(os.sep) + os.sep
+        return prefix, prefix[:-1] + chr(ord(os.sep) + 1)
+
+    def _remove_folder(self, folder_path: str) -> None:
+        """
+        Removes a folder, its subfolders and all their files from the index.
+
+        Params:
+            folder_path (str): The normalized path of the folder.
+        """
+        lower_bound, upper_bound = self._subtree_bounds(folder_path)
+        if self.use_trigrams:
+            self.connection.execute('DELETE FROM trigrams WHERE file_id IN (SELECT id FROM files WHERE parent = ? '
+                                    'OR (parent >= ? AND parent < ?))', (folder_path, lower_bound, upper_bound))
+        self.connection.execute('DELETE FROM files WHERE parent = ? OR (parent >= ? AND parent < ?)',
+                                (folder_path, lower_bound, upper_bound))
+        self.connection.execute('DELETE FROM folders WHERE path = ? OR (path >= ? AND path < ?)',
+                                (folder_path, lower_bound, upper_bound))
+
+    def _index_folder(self, folder_path: str, folder_mtime_ns: int) -> list[str]:
+        """
+        Lists a folder and replaces its indexed files with the current ones.
+
+        The subfolders found are recorded as well, with a null modification time until they are listed,
+        so a recursive refresh reaches them even when the folder itself doesn't change afterwards
+        (e.g. after a non-recursive refresh of the folder).
+
+        Params:
+            folder_path (str): The normalized path of the folder.
+            folder_mtime_ns (int): The current modification time of the folder (in nanoseconds).
+
+        Returns:
+            list[str]: The subfolders found in the folder.
+        """
+        files, subfolders = [], []
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    entry_stat = entry.stat()
+                    extension = os.path.splitext(entry.name)[1][1:]
+                    files.append((folder_path, entry.name, extension, entry_stat.st_size, entry_stat.st_mtime_ns))
+                elif entry.is_dir(follow_symlinks=False):
+                    subfolders.append(self.normalize_path(entry.path))
+
+        known_subfolders = {row[0] for row in self.connection.execute(
+            'SELECT path FROM folders WHERE parent = ?', (folder_path,))}
+        for removed_subfolder in known_subfolders.difference(subfolders):
+            self._remove_folder(removed_subfolder)
+
+        if self.use_trigrams:
+            self.connection.execute('DELETE FROM trigrams WHERE file_id IN (SELECT id FROM files WHERE parent = ?)',
+                                    (folder_path,))
+        self.connection.execute('DELETE FROM files WHERE parent = ?', (folder_path,))
+        self.connection.executemany(
+            'INSERT INTO files (parent, name, extension, size, mtime_ns) VALUES (?, ?, ?, ?, ?)', files)
+        if self.use_trigrams:
+            self._index_trigrams(self.connection.execute(
+                'SELECT id, name FROM files WHERE parent = ?', (folder_path,)).fetchall())
+        self.connection.execute('INSERT OR REPLACE INTO folders (path, parent, mtime_ns) VALUES (?, ?, ?)',
+                                (folder_path, os.path.dirname(folder_path), folder_mtime_ns))
+        self.connection.executemany('INSERT OR IGNORE INTO folders (path, parent, mtime_ns) VALUES (?, ?, 0)',
+                                    ((subfolder, folder_path) for subfolder in subfolders))
+        return subfolders
+
+    def refresh(self, folder_path: str, recursive: bool = True) -> None:
+        """
+        Brings the index of a folder up to date.
+
+        Params:
+            folder_path (str): The path of the folder.
+            recursive (bool, optional): Refresh the subfolders as well. Defaults to True.
+
+        Notes:
+            Only the folders whose modification time changed since the last refresh are listed again.
+            A folder's modification time changes when files are added, removed or renamed in it, but not
+            when the content of an existing file is modified, so the size and modification time of such a
+            file are updated the next time its folder changes.
+        """
+        pending_folders = [self.normalize_path(folder_path)]
+        while pending_folders:
+            current_folder = pending_folders.pop()
+            try:
+                current_mtime_ns = os.stat(current_folder).st_mtime_ns
+            except FileNotFoundError:
+                self._remove_folder(current_folder)
+                continue
+
+            indexed_folder = self.connection.execute(
+                'SELECT mtime_ns FROM folders WHERE path = ?', (current_folder,)).fetchone()
+            try:
+                if indexed_folder and indexed_folder[0] == current_mtime_ns:
+                    subfolders = [row[0] for row in self.connection.execute(
+                        'SELECT path FROM folders WHERE parent = ?', (current_folder,))]
+                else:
+                    subfolders = self._index_folder(current_folder, current_mtime_ns)
+            except PermissionError as pe:
+                print('Indexing folder Error: \n\t' + str(pe))
+                continue
+
+            if recursive:
+                pending_folders.extend(subfolders)
+        self.connection.commit()
+
+    def _query_files(self, folder_path: str, recursive: bool, condition: str, parameters: tuple) -> Iterator[str]:
+        """
+        Runs a query over the files indexed in a folder.
+
+        Params:
+            folder_path (str): The path of the folder.
+            recursive (bool): Include the files located in the subfolders.
+            condition (str): An additional SQL condition that the files must satisfy.
+            parameters (tuple): The parameters of the additional condition.
+
+        Returns:
+            Iterator[str]: The paths of the files, relative to the folder (read lazily from the database).
+        """
+        root = self.normalize_path(folder_path)
+        if recursive:
+            lower_bound, upper_bound = self._subtree_bounds(root)
+            scope, scope_parameters = '(parent = ? OR (parent >= ? AND parent < ?))', (root, lower_bound, upper_bound)
+        else:
+            scope, scope_parameters = 'parent = ?', (root,)
+
+        rows = self.connection.execute(f'SELECT parent, name FROM files WHERE {scope} AND {condition}',
+                                       scope_parameters + parameters)
+        prefix_length = len(root.rstrip(os.sep)) + 1
+        return (os.path.join(parent[prefix_length:], name) if parent != root else name for parent, name in rows)
+
+    def search_by_name(self, folder_path: str, file_name: str, file_extension: str = '',
+                       recursive: bool = False) -> Iterator[str]:
+        """
+        Finds the indexed files whose name contains a specific keyword.
+
+        Params:
+            folder_path (str): The path of the searched folder.
+            file_name (str): The keyword contained in the name of the file (without extension).
+            file_extension (str, optional): The extension of the file.
+            recursive (bool, optional): Include the files located in the subfolders. Defaults to False.
+
+        Returns:
+            Iterator[str]: The paths of the files found, relative to the searched folder.
+        """
+        keyword_trigrams = sorted(self.generate_trigrams(file_name))
+        if self.use_trigrams and keyword_trigrams:
+            # Only the files containing every trigram of the keyword can contain the keyword
+            trigrams_intersection = ' INTERSECT '.join(['SELECT file_id FROM trigrams WHERE gram = ?'] *
+                                                       len(keyword_trigrams))
+            candidates = self._query_files(folder_path, recursive, f'id IN ({trigrams_intersection})',
+                                           tuple(keyword_trigrams))
+        else:
+            candidates = self._query_files(folder_path, recursive, 'instr(name, ?) > 0', (file_name,))
+        return (file for file in candidates
+                if file_name in os.path.splitext(os.path.basename(file))[0]
+                and (not file_extension or file.endswith('.' + file_extension)))
+
+    def search_by_extension(self, folder_path: str, file_extension: str, recursive: bool = False) -> Iterator[str]:
+        """
+        Finds the indexed files with a specific extension.
+
+        Params:
+            folder_path (str): The path of the searched folder.
+            file_extension (str): The extension of the files (compound extensions such as 'tar.gz' are supported).
+            recursive (bool, optional): Include the files located in the subfolders. Defaults to False.
+
+        Returns:
+            Iterator[str]: The paths of the files found, relative to the searched folder.
+        """
+        last_extension = file_extension.rsplit('.', 1)[-1]
+        candidates = self._query_files(folder_path, recursive, 'extension = ?', (last_extension,))
+        return (file for file in candidates if file.endswith('.' + file_extension))
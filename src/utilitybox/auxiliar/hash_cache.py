@@ -0,0 +1,89 @@
+import os
+import sqlite3
+
+from src.utilitybox.auxiliar.project_paths import get_project_hash_cache_path
+
+
+class HashCache:
+    """
+    Utility class for caching the hashes computed for files, so unchanged files are not hashed again.
+
+    The hashes are stored in a SQLite database and are keyed by the path of the file and the kind
+    of hash (e.g. 'partial' or 'full'). A cached hash is only valid while the size and modification
+    time of the file are the same as when it was computed.
+
+    Attributes:
+        self.cache_path (str): The path of the database file containing the cached hashes.
+        self.connection (sqlite3.Connection): The connection to the cache database.
+    """
+
+    def __init__(self, cache_path: str = ''):
+        """
+        Initialize the HashCache object.
+
+        Params:
+            cache_path (str, optional): The path of the database file containing the cached hashes.
+                Defaults to the project's hash cache path if not specified.
+        """
+        if not cache_path:
+            cache_path = get_project_hash_cache_path()
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        self.cache_path = cache_path
+        self.connection = sqlite3.connect(cache_path)
+        self.connection.executescript('''
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS hashes (
+                path TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                digest TEXT NOT NULL,
+                PRIMARY KEY (path, kind)
+            );
+        ''')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Save the stored hashes and close the connection to the cache database.
+        """
+        self.connection.commit()
+        self.connection.close()
+
+    def load_hash(self, file_path: str, kind: str, size: int, mtime_ns: int) -> str | None:
+        """
+        Provides the cached hash of a file, if the file didn't change since it was computed.
+
+        Params:
+            file_path (str): The path of the file.
+            kind (str): The kind of hash (e.g. 'partial' or 'full').
+            size (int): The current size of the file.
+            mtime_ns (int): The current modification time of the file (in nanoseconds).
+
+        Returns:
+            str | None: The cached hash, or None if it is missing or outdated.
+        """
+        cached_hash = self.connection.execute(
+            'SELECT digest FROM hashes WHERE path = ? AND kind = ? AND size = ? AND mtime_ns = ?',
+            (os.path.abspath(file_path), kind, size, mtime_ns)).fetchone()
+        return cached_hash[0] if cached_hash else None
+
+    def store_hash(self, file_path: str, kind: str, size: int, mtime_ns: int, digest: str) -> None:
+        """
+        Stores the hash computed for a file, replacing any previous hash of the same kind.
+
+        Params:
+            file_path (str): The path of the file.
+            kind (str): The kind of hash (e.g. 'partial' or 'full').
+            size (int): The size of the file when the hash was computed.
+            mtime_ns (int): The modification time of the file when the hash was computed (in nanoseconds).
+            digest (str): The hash of the file.
+        """
+        self.connection.execute(
+            'INSERT OR REPLACE INTO hashes (path, kind, size, mtime_ns, digest) VALUES (?, ?, ?, ?, ?)',
+            (os.path.abspath(file_path), kind, size, mtime_ns, digest))
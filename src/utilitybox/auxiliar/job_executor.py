@@ -0,0 +1,133 @@
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+"""
+Job execution Params (number of jobs running at the same time and interval, in milliseconds,
+at which the main loop handles the messages sent by the jobs).
+"""
+DEFAULT_MAX_JOBS = 4
+MESSAGES_POLL_INTERVAL = 100
+
+
+class MainBoxProxy:
+    """
+    Stand-in for the MainBox passed to the operations running in the background.
+
+    Tkinter widgets may only be used from the thread running the main loop, so the calls made by
+    the operations are queued as messages and replayed on the MainBox by the main loop.
+
+    Attributes:
+        self.messages (queue.Queue): The queue of messages handled by the main loop.
+    """
+
+    def __init__(self, messages: queue.Queue):
+        """
+        Initialize the MainBoxProxy object.
+
+        Params:
+            messages (queue.Queue): The queue of messages handled by the main loop.
+        """
+        self.messages = messages
+
+    def update_log(self, *args) -> None:
+        """
+        Queues an update of the logging frame (same parameters as 'MainBox.update_log').
+        """
+        self.messages.put(('update_log', args))
+
+    def update_progress(self, *args) -> None:
+        """
+        Queues an update of the progress display (same parameters as 'MainBox.update_progress').
+        """
+        self.messages.put(('update_progress', args))
+
+
+class JobExecutor:
+    """
+    Utility class for running the operations in a pool of threads, so the main loop of the
+    application is never blocked and several operations can run at the same time.
+
+    Attributes:
+        self.mainbox (MainBox): An instance of the MainBox class that displays the results.
+        self.messages (queue.Queue): The queue of messages sent by the operations to the MainBox.
+        self.mainbox_proxy (MainBoxProxy): The stand-in for the MainBox passed to the operations.
+        self.executor (ThreadPoolExecutor): The pool of threads running the operations.
+        self.submitted_jobs (int): The number of operations submitted since the last time none was running.
+        self.completed_jobs (int): The number of these operations that are completed.
+    """
+
+    def __init__(self, mainbox, max_jobs: int = DEFAULT_MAX_JOBS):
+        """
+        Initialize the JobExecutor object and start handling the messages sent by the operations.
+
+        Params:
+            mainbox (MainBox): An instance of the MainBox class that displays the results.
+            max_jobs (int, optional): The number of operations running at the same time.
+        """
+        self.mainbox = mainbox
+        self.messages = queue.Queue()
+        self.mainbox_proxy = MainBoxProxy(self.messages)
+        self.executor = ThreadPoolExecutor(max_workers=max_jobs, thread_name_prefix='utilitybox_job')
+        self.jobs_lock = threading.Lock()
+        self.submitted_jobs = 0
+        self.completed_jobs = 0
+        self.mainbox.after(MESSAGES_POLL_INTERVAL, self.process_messages)
+
+    def submit(self, operation: Callable, *args) -> Future:
+        """
+        Runs an operation in the background.
+
+        Params:
+            operation (Callable): The operation, receiving the MainBox as its first parameter.
+            *args: The other parameters of the operation (read from the widgets before submitting).
+        """
+        with self.jobs_lock:
+            self.submitted_jobs += 1
+            self._queue_jobs_progress()
+        job = self.executor.submit(operation, self.mainbox_proxy, *args)
+        job.add_done_callback(self._complete_job)
+        return job
+
+    def _queue_jobs_progress(self) -> None:
+        """
+        Queues an update of the progress display with the state of the submitted operations.
+        """
+        running_jobs = self.submitted_jobs - self.completed_jobs
+        self.mainbox_proxy.update_progress(f'Running operations: {running_jobs}',
+                                           self.completed_jobs / self.submitted_jobs)
+
+    def _complete_job(self, job: Future) -> None:
+        """
+        Reports the failure of an operation, if any, and the progress of the submitted operations.
+
+        Params:
+            job (Future): The completed operation.
+        """
+        if not job.cancelled() and job.exception():
+            print(job.exception())
+
+        with self.jobs_lock:
+            self.completed_jobs += 1
+            self._queue_jobs_progress()
+            if self.completed_jobs == self.submitted_jobs:
+                self.submitted_jobs, self.completed_jobs = 0, 0
+
+    def process_messages(self) -> None:
+        """
+        Replays on the MainBox the messages sent by the operations (runs in the main loop).
+        """
+        while True:
+            try:
+                method_name, args = self.messages.get_nowait()
+            except queue.Empty:
+                break
+            getattr(self.mainbox, method_name)(*args)
+        self.mainbox.after(MESSAGES_POLL_INTERVAL, self.process_messages)
+
+    def shutdown(self) -> None:
+        """
+        Cancels the operations that didn't start. The running operations are completed.
+        """
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,67 @@
+import base64
+import os
+from functools import lru_cache
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
+
+"""
+Key derivation Params (scrypt cost, block size and parallelization, size of the salts and number of
+master keys kept in memory for the session).
+
+Deriving a master key from a passphrase is deliberately expensive (tens of milliseconds and 32 MiB of
+memory), so the master keys are cached and the key of every file is derived from the master key and
+the file identifier with HKDF, which is cheap.
+"""
+SCRYPT_LOG2_COST = 15
+SCRYPT_BLOCK_SIZE = 8
+SCRYPT_PARALLELIZATION = 1
+SALT_SIZE = 16
+MASTER_KEYS_CACHE_SIZE = 16
+
+
+def generate_kdf_params() -> tuple[bytes, int, int, int]:
+    """
+    Generates the parameters of a new passphrase derivation, with a random salt.
+
+    Returns:
+        tuple[bytes, int, int, int]: The salt, the log2 of the cost, the block size and the parallelization.
+    """
+    return os.urandom(SALT_SIZE), SCRYPT_LOG2_COST, SCRYPT_BLOCK_SIZE, SCRYPT_PARALLELIZATION
+
+
+@lru_cache(maxsize=MASTER_KEYS_CACHE_SIZE)
+def derive_master_key(passphrase: str, salt: bytes, log2_cost: int, block_size: int, parallelization: int) -> bytes:
+    """
+    Derives a master key from a passphrase with scrypt (cached for the session).
+
+    Params:
+        passphrase (str): The passphrase.
+        salt (bytes): The random salt of the derivation.
+        log2_cost (int): The log2 of the scrypt cost.
+        block_size (int): The scrypt block size.
+        parallelization (int): The scrypt parallelization.
+
+    Returns:
+        bytes: The 32-byte master key.
+    """
+    scrypt = Scrypt(salt=salt, length=32, n=2 ** log2_cost, r=block_size, p=parallelization)
+    return scrypt.derive(passphrase.encode('utf-8'))
+
+
+def derive_file_key(passphrase: str, kdf_params: tuple[bytes, int, int, int], file_id: bytes) -> bytes:
+    """
+    Derives the encryption key of a file from a passphrase.
+
+    Params:
+        passphrase (str): The passphrase.
+        kdf_params (tuple[bytes, int, int, int]): The parameters of the passphrase derivation.
+        file_id (bytes): The random identifier of the file, used as the salt of its key.
+
+    Returns:
+        bytes: The url-safe base64-encoded 32-byte key of the file (same format as 'Fernet.generate_key').
+    """
+    master_key = derive_master_key(passphrase, *kdf_params)
+    file_key = HKDF(algorithm=hashes.SHA256(), length=32, salt=file_id, info=b'utilitybox file key').derive(master_key)
+    return base64.urlsafe_b64encode(file_key)
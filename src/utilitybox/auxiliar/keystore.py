@@ -0,0 +1,161 @@
+import json
+import os
+import sqlite3
+import time
+
+from src.utilitybox.auxiliar.project_paths import get_project_keystore_path
+
+"""
+Keystore Params (fraction of unused database pages above which the keystore is compacted and
+number of keys read at once when exporting).
+"""
+COMPACTION_FREE_FRACTION = 0.25
+EXPORT_BATCH_SIZE = 1000
+
+
+class KeyStore:
+    """
+    Utility class for storing the encryption keys of the encrypted files in a single database.
+
+    The keys are stored in a SQLite database and are keyed by the random identifier written in the
+    header of every encrypted file, so files with the same name don't collide and a key is found
+    with a single primary key lookup.
+
+    Attributes:
+        self.keystore_path (str): The path of the database file containing the keys.
+        self.connection (sqlite3.Connection): The connection to the keystore database.
+    """
+
+    def __init__(self, keystore_path: str = ''):
+        """
+        Initialize the KeyStore object.
+
+        Params:
+            keystore_path (str, optional): The path of the database file containing the keys.
+                Defaults to the project's keystore path if not specified.
+        """
+        if not keystore_path:
+            keystore_path = get_project_keystore_path()
+        os.makedirs(os.path.dirname(keystore_path), exist_ok=True)
+        self.keystore_path = keystore_path
+        # The keys of a batch are stored concurrently by several processes
+        self.connection = sqlite3.connect(keystore_path, timeout=60)
+        self.connection.executescript('''
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS keys (
+                file_id BLOB PRIMARY KEY,
+                key BLOB NOT NULL,
+                file_name TEXT NOT NULL,
+                created_at INTEGER NOT NULL
+            ) WITHOUT ROWID;
+        ''')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Save the stored keys and close the connection to the keystore database.
+        """
+        self.connection.commit()
+        self.connection.close()
+
+    def store_key(self, file_id: bytes, key: bytes, file_name: str) -> None:
+        """
+        Stores the key of an encrypted file.
+
+        Params:
+            file_id (bytes): The identifier written in the header of the encrypted file.
+            key (bytes): The encryption key of the file.
+            file_name (str): The name of the file when it was encrypted (kept for reference).
+        """
+        with self.connection:
+            self.connection.execute('INSERT OR REPLACE INTO keys (file_id, key, file_name, created_at) '
+                                    'VALUES (?, ?, ?, ?)', (file_id, key, file_name, int(time.time())))
+
+    def load_key(self, file_id: bytes) -> bytes | None:
+        """
+        Provides the key of an encrypted file.
+
+        Params:
+            file_id (bytes): The identifier written in the header of the encrypted file.
+
+        Returns:
+            bytes | None: The encryption key of the file, or None if the keystore doesn't contain it.
+        """
+        stored_key = self.connection.execute('SELECT key FROM keys WHERE file_id = ?', (file_id,)).fetchone()
+        return stored_key[0] if stored_key else None
+
+    def remove_key(self, file_id: bytes) -> None:
+        """
+        Removes the key of a file that is no longer encrypted.
+
+        Params:
+            file_id (bytes): The identifier written in the header of the encrypted file.
+        """
+        with self.connection:
+            self.connection.execute('DELETE FROM keys WHERE file_id = ?', (file_id,))
+
+    def export_keys(self, export_path: str) -> int:
+        """
+        Exports all the keys to a file containing one JSON object per line (used for backups or
+        for moving the keys to another installation).
+
+        Params:
+            export_path (str): The path of the export file.
+
+        Returns:
+            int: The number of exported keys.
+        """
+        exported_keys = 0
+        cursor = self.connection.execute('SELECT file_id, key, file_name, created_at FROM keys')
+        with open(export_path, 'w', encoding='utf-8') as export_file:
+            for stored_keys in iter(lambda: cursor.fetchmany(EXPORT_BATCH_SIZE), []):
+                for file_id, key, file_name, created_at in stored_keys:
+                    export_file.write(json.dumps({'file_id': file_id.hex(), 'key': key.decode(),
+                                                  'file_name': file_name, 'created_at': created_at}) + '\n')
+                exported_keys += len(stored_keys)
+
+        return exported_keys
+
+    def import_keys(self, import_path: str) -> int:
+        """
+        Imports the keys of a file created by 'export_keys', in a single transaction.
+
+        Params:
+            import_path (str): The path of the export file.
+
+        Returns:
+            int: The number of imported keys (the keys already stored are replaced).
+        """
+        with open(import_path, encoding='utf-8') as import_file, self.connection:
+            imported_keys = self.connection.executemany(
+                'INSERT OR REPLACE INTO keys (file_id, key, file_name, created_at) VALUES (?, ?, ?, ?)',
+                ((bytes.fromhex(stored_key['file_id']), stored_key['key'].encode(), stored_key['file_name'],
+                  stored_key['created_at'])
+                 for stored_key in (json.loads(line) for line in import_file if line.strip())))
+
+        return imported_keys.rowcount
+
+    def compact(self, min_free_fraction: float = COMPACTION_FREE_FRACTION) -> bool:
+        """
+        Rebuilds the keystore database when enough space was left unused by the removed keys.
+
+        Params:
+            min_free_fraction (float, optional): The fraction of unused pages above which the database is rebuilt.
+
+        Returns:
+            bool: True if the database was rebuilt, False otherwise.
+        """
+        self.connection.commit()
+        page_count = self.connection.execute('PRAGMA page_count').fetchone()[0]
+        free_pages = self.connection.execute('PRAGMA freelist_count').fetchone()[0]
+        if not page_count or free_pages / page_count < min_free_fraction:
+            return False
+
+        self.connection.execute('VACUUM')
+        self.connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        return True
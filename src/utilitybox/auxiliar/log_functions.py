@@ -1,19 +1,95 @@
 import os.path
 import logging
+import threading
+from datetime import date
 
 from src.utilitybox.auxiliar.folders_configure import FoldersConfigure
 
+"""
+Logging Params (format of the logged information and format of the logged date).
+"""
+LOG_FORMAT = '%(asctime)s %(levelname)s: %(message)s'
+LOG_DATE_FORMAT = '%d/%m/%Y %H:%M:%S'
 
-def formatting_log(file_path: str, provided_format: str) -> None:
+"""
+Loggers of the operation categories, kept open for the current day (the folders setup is only
+checked and the log files are only opened again when the date changes).
+"""
+_category_loggers: dict[str, logging.Logger] = {}
+_category_loggers_date: date | None = None
+_category_loggers_lock = threading.Lock()
+
+
+def formatting_log(file_path: str, provided_format: str) -> logging.FileHandler:
     """
     Formatting the logging details and deciding what information to store and in which manner.
 
     Params:
         file_path (str): The path to the log file.
         provided_format (str): The format of the logged information.
+
+    Returns:
+        logging.FileHandler: The handler appending the formatted information to the log file.
+    """
+    file_handler = logging.FileHandler(file_path)
+    file_handler.setFormatter(logging.Formatter(provided_format, datefmt=LOG_DATE_FORMAT))
+    file_handler.setLevel(logging.INFO)
+    return file_handler
+
+
+def close_file_logs() -> None:
+    """
+    Closes the log files of all the operation categories (they are opened again when needed).
     """
-    logging.basicConfig(force=True, filename=file_path, format=provided_format, level=logging.INFO,
-                        datefmt='%d/%m/%Y %H:%M:%S')
+    with _category_loggers_lock:
+        _close_category_loggers()
+
+
+def _close_category_loggers() -> None:
+    """
+    Removes and closes the file handlers of the cached category loggers.
+    """
+    for category_logger in _category_loggers.values():
+        for handler in list(category_logger.handlers):
+            if isinstance(handler, logging.FileHandler):
+                category_logger.removeHandler(handler)
+                handler.close()
+    _category_loggers.clear()
+
+
+def _get_category_logger(operation_specific_identifier: str) -> logging.Logger:
+    """
+    Provides the logger of an operation category, rolling over to new log files when the date changed.
+
+    Params:
+        operation_specific_identifier (str): The operation identifier that specifies the type of operation.
+
+    Returns:
+        logging.Logger: The logger writing in the current log file of the operation category.
+    """
+    global _category_loggers_date
+
+    today = date.today()
+    if _category_loggers_date != today:
+        _close_category_loggers()
+        FoldersConfigure().check_folders_setup()
+        _category_loggers_date = today
+
+    category_logger = _category_loggers.get(operation_specific_identifier)
+    if category_logger is None:
+        folders_configure = FoldersConfigure()
+        category_folder_path = os.path.join(folders_configure.generate_default_month_folder_path(),
+                                            operation_specific_identifier)
+        os.makedirs(category_folder_path, exist_ok=True)
+        file_path = os.path.join(category_folder_path, folders_configure.give_log_name())
+
+        category_logger = logging.getLogger('utilitybox.' + operation_specific_identifier)
+        category_logger.setLevel(logging.INFO)
+        category_logger.propagate = False
+        category_logger.addHandler(formatting_log(file_path, LOG_FORMAT))
+        _category_loggers[operation_specific_identifier] = category_logger
+
+    return category_logger
 
 
 def update_file_log(log_message: str, operation_specific_identifier: str) -> None:
@@ -29,12 +105,5 @@ def update_file_log(log_message: str, operation_specific_identifier: str) -> Non
             - Example 2: operation identifier = "Rename"
               File destination: Year => Month => Rename => DD_ublog.log
     """
-    folders_configure = FoldersConfigure()
-    folders_configure.check_folders_setup()
-
-    file_name = folders_configure.give_log_name()
-    months_folder_path = folders_configure.generate_default_month_folder_path()
-    file_path = os.path.join(months_folder_path, operation_specific_identifier, file_name)
-
-    formatting_log(file_path, '%(asctime)s %(levelname)s: %(message)s')
-    logging.info(log_message)
+    with _category_loggers_lock:
+        _get_category_logger(operation_specific_identifier).info(log_message)
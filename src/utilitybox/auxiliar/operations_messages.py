@@ -1,8 +1,15 @@
 import os
+from typing import Callable, Iterable
 
+from src.utilitybox.auxiliar.extension_operations import group_files_by_extensions
 from src.utilitybox.auxiliar.log_functions import update_file_log
 from src.utilitybox.auxiliar.project_paths import get_system_path
 
+"""
+Results logging Params (maximum number of files grouped in a single log entry).
+"""
+RESULTS_BATCH_SIZE = 1000
+
 
 def log_basic_operation_results(operation_specific_identifier: str, results_id: int,
                                 list_of_files: dict[str, list[str]]) -> None:
@@ -34,6 +41,98 @@ def log_basic_operation_results(operation_specific_identifier: str, results_id:
     update_file_log(log_file_message, operation_specific_identifier)
 
 
+def _log_in_batches(operation_specific_identifier: str, results: Iterable, batch_size: int,
+                    log_batch: Callable[[int, list], None]) -> int:
+    """
+    Consume the results of an operation that are produced lazily, logging them in bounded batches.
+
+    The files are deleted or moved as the results are produced, so an error stopping the operation
+    midway doesn't discard the results already produced: they are logged and reported with the success
+    status code, like the files of an operation that completed.
+
+    Params:
+        operation_specific_identifier (str): The operation identifier that specifies the type of operation.
+        results (Iterable): The results of the operation.
+        batch_size (int): The maximum number of results grouped in a single log entry.
+        log_batch (Callable[[int, list], None]): The function logging a batch with the status code.
+
+    Returns:
+        int: The operation's status code (200 if any result was produced, 204 otherwise).
+    """
+    results_id = 204
+    batch = []
+    logged_batches = 0
+    try:
+        for result in results:
+            results_id = 200
+            batch.append(result)
+            if len(batch) == batch_size:
+                log_batch(results_id, batch)
+                logged_batches += 1
+                batch = []
+    except Exception as e:
+        print(f'{operation_specific_identifier.capitalize()} Error: \n\t' + str(e))
+
+    if batch or not logged_batches:
+        log_batch(results_id, batch)
+    return results_id
+
+
+def log_streamed_operation_results(operation_specific_identifier: str, files: Iterable[str],
+                                   batch_size: int = RESULTS_BATCH_SIZE) -> int:
+    """
+    Log the results of an operation that are produced lazily (e.g. by a search, sort or delete
+    iterator), consuming them in bounded batches so the memory used doesn't grow with the number of files.
+
+    Params:
+        operation_specific_identifier (str): The operation identifier that specifies the type of operation.
+        files (Iterable[str]): The files resulting from the operation.
+        batch_size (int, optional): The maximum number of files grouped in a single log entry.
+
+    Returns:
+        int: The operation's status code (200 if any file resulted from the operation, 204 otherwise).
+
+    Notes:
+        Each batch is logged as a separate entry, so the files of an extension can be spread
+        over multiple entries when the results don't fit in a single batch.
+        An error stopping the operation is printed and the files produced until then are still logged.
+    """
+    def log_files_batch(results_id: int, batch: list[str]) -> None:
+        log_basic_operation_results(operation_specific_identifier, results_id, group_files_by_extensions(batch))
+
+    return _log_in_batches(operation_specific_identifier, files, batch_size, log_files_batch)
+
+
+def log_content_search_results(operation_specific_identifier: str, matches: Iterable[tuple[str, int, int]],
+                               batch_size: int = RESULTS_BATCH_SIZE) -> int:
+    """
+    Log the results of a content search, consuming them in bounded batches.
+
+    Params:
+        operation_specific_identifier (str): The operation identifier that specifies the type of operation.
+        matches (Iterable[tuple[str, int, int]]): The file, line number and byte offset of every occurrence found.
+        batch_size (int, optional): The maximum number of occurrences grouped in a single log entry.
+
+    Returns:
+        int: The operation's status code (200 if any occurrence was found, 204 otherwise).
+    """
+    def log_matches_batch(results_id: int, batch: list[tuple[str, int, int]]) -> None:
+        log_file_message = f'[{operation_specific_identifier.upper()}: {results_id}]:\n\tFound the following matches:'
+        if not batch:
+            log_file_message += '\n\t\tNone'
+
+        previous_file = None
+        for file, line_number, offset in batch:
+            if file != previous_file:
+                log_file_message += f'\n\t\t{file}'
+                previous_file = file
+            log_file_message += f'\n\t\t\tLine {line_number} (offset {offset})'
+
+        update_file_log(log_file_message, operation_specific_identifier)
+
+    return _log_in_batches(operation_specific_identifier, matches, batch_size, log_matches_batch)
+
+
 def log_compressing_results(operation_specific_identifier: str, operation_id: int, destination_path: str) -> None:
     """
     Log the results of a compression operation.
@@ -68,39 +167,97 @@ def log_decompressing_results(operation_unique_identifier: str, operation_id: in
     update_file_log(log_file_message, operation_unique_identifier)
 
 
-def log_encryption_result(operation_specific_identifier: str, operation_id: int, file_key_pair: dict[str, str]) -> None:
+def log_encryption_result(operation_specific_identifier: str, operation_id: int, file_key_pair: dict[str, str],
+                          failed_files: list[str] | None = None) -> None:
     """
-    Log the result of an encryption operation.
+    Log the result of an encryption operation, covering all the files of a batch.
 
     Params:
         operation_specific_identifier (str): The operation identifier that specifies the type of operation.
         operation_id (int): The operation's status code (200 for success, 204 for no content, 404 for error).
         file_key_pair (dict[str, str]): A dictionary containing file names as keys and key paths as values.
+        failed_files (list[str] | None, optional): The files of the batch that could not be processed.
     """
     log_file_message = (f'[{operation_specific_identifier.upper()}: {operation_id}]:'
                         f'\n\tEncrypted the following file:')
+    if not file_key_pair:
+        log_file_message += '\n\t\tNone'
     for file_name, key_path in file_key_pair.items():
         log_file_message += f'\n\t\t{file_name}'
         log_file_message += '\n\tKey saved in the following location:'
         log_file_message += f'\n\t\t{key_path}'
+    if failed_files:
+        log_file_message += '\n\tFailed to process the following files:'
+        for file_path in failed_files:
+            log_file_message += f'\n\t\t{file_path}'
 
     update_file_log(log_file_message, operation_specific_identifier)
 
 
-def log_decryption_result(operation_specific_identifier: str, operation_id: int, file_key_pair: dict[str, str]) -> None:
+def log_decryption_result(operation_specific_identifier: str, operation_id: int, file_key_pair: dict[str, str],
+                          failed_files: list[str] | None = None) -> None:
     """
-    Log the result of a decryption operation.
+    Log the result of a decryption operation, covering all the files of a batch.
 
     Params:
         operation_specific_identifier (str): The operation identifier that specifies the type of operation.
         operation_id (int): The operation's status code (200 for success, 204 for no content, 404 for error).
         file_key_pair (dict[str, str]): A dictionary containing file names as keys and key paths as values.
+        failed_files (list[str] | None, optional): The files of the batch that could not be processed.
     """
     log_file_message = (f'[{operation_specific_identifier.upper()}: {operation_id}]:'
                         f'\n\tDecrypted the following file:')
+    if not file_key_pair:
+        log_file_message += '\n\t\tNone'
     for file_name, key_path in file_key_pair.items():
         log_file_message += f'\n\t\t{file_name}'
         log_file_message += '\n\tKey from the following location deleted:'
         log_file_message += f'\n\t\t{key_path}'
+    if failed_files:
+        log_file_message += '\n\tFailed to process the following files:'
+        for file_path in failed_files:
+            log_file_message += f'\n\t\t{file_path}'
+
+    update_file_log(log_file_message, operation_specific_identifier)
+
+
+def log_verification_result(operation_specific_identifier: str, operation_id: int, file_key_pair: dict[str, str],
+                            failed_files: list[str] | None = None) -> None:
+    """
+    Log the result of a verification operation, covering all the files of a batch.
+
+    Params:
+        operation_specific_identifier (str): The operation identifier that specifies the type of operation.
+        operation_id (int): The operation's status code (200 for success, 204 for no content, 404 for error).
+        file_key_pair (dict[str, str]): A dictionary containing file names as keys and key paths as values.
+        failed_files (list[str] | None, optional): The files of the batch that failed the verification.
+    """
+    log_file_message = (f'[{operation_specific_identifier.upper()}: {operation_id}]:'
+                        f'\n\tVerified the following file:')
+    if not file_key_pair:
+        log_file_message += '\n\t\tNone'
+    for file_name, key_path in file_key_pair.items():
+        log_file_message += f'\n\t\t{file_name}'
+        log_file_message += '\n\tMatching key from the following location:'
+        log_file_message += f'\n\t\t{key_path}'
+    if failed_files:
+        log_file_message += '\n\tThe following files failed the verification (altered or missing key):'
+        for file_path in failed_files:
+            log_file_message += f'\n\t\t{file_path}'
 
     update_file_log(log_file_message, operation_specific_identifier)
+
+
+def log_rolled_back_writes(rolled_back_writes: list[tuple[str, str]]) -> None:
+    """
+    Log the file rewrites interrupted by a crash and rolled back when the application started.
+
+    Params:
+        rolled_back_writes (list[tuple[str, str]]): The operation identifier and the path of the file of
+            every rolled back rewrite.
+    """
+    for operation_specific_identifier, file_path in rolled_back_writes:
+        log_file_message = (f'[{operation_specific_identifier.upper()}: 404]:'
+                            f'\n\tInterrupted operation rolled back, the following file was left unchanged:'
+                            f'\n\t\t{file_path}')
+        update_file_log(log_file_message, operation_specific_identifier)
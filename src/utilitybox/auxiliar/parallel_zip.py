@@ -0,0 +1,556 @@
+import bz2
+import os
+import shutil
+import struct
+import tempfile
+import threading
+import time
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import BinaryIO, Callable, Iterable, Iterator
+
+from src.utilitybox.auxiliar.split_volumes import SplitVolumeWriter, open_archive_file
+
+"""
+Parallel ZIP Params (size of the chunks of a file deflated separately, size of the window shared between
+consecutive chunks, number of chunks compressed ahead of the writer by every thread and size of the
+compressed members kept in memory before being spooled to disk).
+"""
+CHUNK_SIZE = 1024 * 1024
+DEFLATE_WINDOW_SIZE = 32 * 1024
+CHUNKS_AHEAD_PER_WORKER = 4
+SPOOLED_MEMBER_SIZE = 8 * 1024 * 1024
+
+"""
+Parallel extraction Params (memory shared by the copy buffers of the extracting threads and bounds of
+the buffer of a thread).
+"""
+EXTRACTION_MEMORY_BUDGET = 64 * 1024 * 1024
+MIN_COPY_BUFFER_SIZE = 64 * 1024
+MAX_COPY_BUFFER_SIZE = 1024 * 1024
+WINDOWS_INVALID_CHARACTERS = str.maketrans(':<>|"?*', '_______')
+
+"""
+ZIP format Params (supported compression methods, signatures and layouts of the records).
+"""
+COMPRESSION_METHODS = {'stored': zipfile.ZIP_STORED, 'deflated': zipfile.ZIP_DEFLATED, 'bzip2': zipfile.ZIP_BZIP2}
+ZIP64_LIMIT = 0xFFFFFFFF
+ZIP64_COUNT_LIMIT = 0xFFFF
+LOCAL_HEADER_FORMAT = '<4sHHHHHIIIHH'
+LOCAL_HEADER_SIGNATURE = b'PK\x03\x04'
+CENTRAL_HEADER_FORMAT = '<4sBBHHHHHIIIHHHHHII'
+CENTRAL_HEADER_SIGNATURE = b'PK\x01\x02'
+ZIP64_END_FORMAT = '<4sQHHIIQQQQ'
+ZIP64_END_SIGNATURE = b'PK\x06\x06'
+ZIP64_LOCATOR_FORMAT = '<4sIQI'
+ZIP64_LOCATOR_SIGNATURE = b'PK\x06\x07'
+END_FORMAT = '<4sHHHHIIH'
+END_SIGNATURE = b'PK\x05\x06'
+DATA_DESCRIPTOR_SIGNATURE = b'PK\x07\x08'
+
+
+class _ZipMember:
+    """
+    The information written about a file in its local header and in the central directory.
+
+    Attributes:
+        self.arcname (str): The name of the file inside the archive.
+        self.compress_type (int): The compression method of the file.
+        self.file_size (int): The size of the content compressed so far (the file may change while it is read).
+        self.mode (int): The permissions and type of the file.
+        self.dos_time (int): The modification time of the file (MS-DOS format).
+        self.dos_date (int): The modification date of the file (MS-DOS format).
+        self.header_offset (int): The position of the local header in the archive.
+        self.crc (int): The CRC-32 of the file's content.
+        self.compress_size (int): The size of the compressed content.
+        self.has_data_descriptor (bool): Flag indicating whether the CRC-32 and the sizes follow the content
+            instead of being patched in the local header (archives that can't be seeked back).
+        self.requires_zip64 (bool): Flag indicating whether the sizes are stored in a ZIP64 extra field, decided
+            from the size of the file before it is compressed (the local header can't change length afterwards).
+    """
+
+    def __init__(self, file_path: str, arcname: str, compress_type: int, has_data_descriptor: bool = False):
+        """
+        Initialize the _ZipMember object.
+
+        Params:
+            file_path (str): The path of the file.
+            arcname (str): The name of the file inside the archive.
+            compress_type (int): The compression method of the file.
+            has_data_descriptor (bool, optional): Flag indicating whether the CRC-32 and the sizes follow the content.
+        """
+        file_stat = os.stat(file_path)
+        self.arcname = arcname.replace(os.sep, '/')
+        self.compress_type = compress_type
+        self.file_size = 0
+        self.mode = file_stat.st_mode
+        modification_time = time.localtime(file_stat.st_mtime)
+        if modification_time.tm_year < 1980:
+            modification_time = time.localtime(time.mktime((1980, 1, 1, 0, 0, 0, 0, 0, -1)))
+        self.dos_date = ((modification_time.tm_year - 1980) << 9 | modification_time.tm_mon << 5
+                         | modification_time.tm_mday)
+        self.dos_time = (modification_time.tm_hour << 11 | modification_time.tm_min << 5
+                         | modification_time.tm_sec // 2)
+        self.header_offset = 0
+        self.crc = 0
+        self.compress_size = 0
+        self.has_data_descriptor = has_data_descriptor
+        # The compressed content may be slightly larger than the file, like 'zipfile' the margin is 5%
+        self.requires_zip64 = file_stat.st_size * 1.05 > ZIP64_LIMIT
+
+    @property
+    def encoded_name(self) -> bytes:
+        return self.arcname.encode('utf-8')
+
+    @property
+    def flag_bits(self) -> int:
+        # Bit 11 marks the names encoded in UTF-8, bit 3 the data descriptors
+        return (0x800 if not self.arcname.isascii() else 0) | (0x08 if self.has_data_descriptor else 0)
+
+    @property
+    def extract_version(self) -> int:
+        return max(46 if self.compress_type == zipfile.ZIP_BZIP2 else 20, 45 if self.requires_zip64 else 20)
+
+
+@lru_cache(maxsize=8)
+def _crc32_zeros_operator(length: int) -> tuple[int, ...]:
+    """
+    Provides the operator that updates a CRC-32 as if the given number of zero bytes were appended
+    to the data (matrix over GF(2), every entry being the image of one bit of the CRC).
+
+    Params:
+        length (int): The number of zero bytes.
+
+    Returns:
+        tuple[int, ...]: The 32 columns of the operator.
+    """
+    def times(matrix, vector):
+        result, bit = 0, 0
+        while vector:
+            if vector & 1:
+                result ^= matrix[bit]
+            vector >>= 1
+            bit += 1
+        return result
+
+    # Operator for one zero bit, squared three times to get the operator for one zero byte
+    power = [0xEDB88320] + [1 << bit for bit in range(31)]
+    for _ in range(3):
+        power = [times(power, column) for column in power]
+    operator = [1 << bit for bit in range(32)]
+    while length:
+        if length & 1:
+            operator = [times(power, column) for column in operator]
+        power = [times(power, column) for column in power]
+        length >>= 1
+    return tuple(operator)
+
+
+def crc32_combine(first_crc: int, second_crc: int, second_length: int) -> int:
+    """
+    Combines the CRC-32 of two consecutive blocks of data into the CRC-32 of their concatenation.
+
+    Params:
+        first_crc (int): The CRC-32 of the first block.
+        second_crc (int): The CRC-32 of the second block.
+        second_length (int): The length of the second block.
+
+    Returns:
+        int: The CRC-32 of the first block followed by the second block.
+    """
+    if not first_crc:
+        # The zero bytes don't change a zero CRC-32 (e.g. before the first chunk of a file)
+        return second_crc
+    operator = _crc32_zeros_operator(second_length)
+    combined_crc, bit = 0, 0
+    while first_crc:
+        if first_crc & 1:
+            combined_crc ^= operator[bit]
+        first_crc >>= 1
+        bit += 1
+    return combined_crc ^ second_crc
+
+
+def _compress_chunk(data: bytes, preset_window: bytes, is_last_chunk: bool, compress_type: int,
+                    compresslevel: int) -> tuple[int, int, bytes]:
+    """
+    Compresses a chunk of a file so that the compressed chunks of the file can be concatenated.
+
+    A deflated chunk uses the end of the previous chunk as its window (no ratio lost at the boundaries)
+    and ends on a byte boundary; only the last chunk of the file ends the deflate stream.
+
+    Params:
+        data (bytes): The content of the chunk.
+        preset_window (bytes): The end of the previous chunk of the file (empty for the first chunk).
+        is_last_chunk (bool): Flag indicating whether the chunk is the last one of the file.
+        compress_type (int): The compression method (stored or deflated).
+        compresslevel (int): The compression level.
+
+    Returns:
+        tuple[int, int, bytes]: The CRC-32 and the size of the chunk, and the compressed chunk.
+    """
+    if compress_type == zipfile.ZIP_STORED:
+        return zlib.crc32(data), len(data), data
+
+    compressor_options = {'zdict': preset_window} if preset_window else {}
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -15, **compressor_options)
+    compressed_data = compressor.compress(data) + compressor.flush(
+        zlib.Z_FINISH if is_last_chunk else zlib.Z_SYNC_FLUSH)
+    return zlib.crc32(data), len(data), compressed_data
+
+
+def _compress_whole_file(file_path: str, compresslevel: int) -> tuple[int, int, BinaryIO]:
+    """
+    Compresses a whole file with bzip2 (a bzip2 member can't be split in concatenated streams).
+
+    Params:
+        file_path (str): The path of the file.
+        compresslevel (int): The compression level.
+
+    Returns:
+        tuple[int, int, BinaryIO]: The CRC-32 and the size of the file, and the compressed file (spooled
+            to disk when large), positioned at its start.
+    """
+    compressor = bz2.BZ2Compressor(compresslevel)
+    compressed_file = tempfile.SpooledTemporaryFile(max_size=SPOOLED_MEMBER_SIZE)
+    crc, file_size = 0, 0
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b''):
+            crc = zlib.crc32(chunk, crc)
+            file_size += len(chunk)
+            compressed_file.write(compressor.compress(chunk))
+    compressed_file.write(compressor.flush())
+    compressed_file.seek(0)
+    return crc, file_size, compressed_file
+
+
+def _member_jobs(executor: ThreadPoolExecutor, file_path: str, compress_type: int,
+                 compresslevel: int) -> Iterator:
+    """
+    Submits the compression of a file, split in chunks when the compression method allows it.
+
+    Params:
+        executor (ThreadPoolExecutor): The pool of threads compressing the chunks.
+        file_path (str): The path of the file.
+        compress_type (int): The compression method.
+        compresslevel (int): The compression level.
+
+    Returns:
+        Iterator[Future]: The compression jobs of the file, in order (submitted lazily).
+    """
+    if compress_type == zipfile.ZIP_BZIP2:
+        yield executor.submit(_compress_whole_file, file_path, compresslevel)
+        return
+
+    with open(file_path, 'rb') as file:
+        preset_window = b''
+        chunk = file.read(CHUNK_SIZE)
+        while True:
+            next_chunk = file.read(CHUNK_SIZE)
+            yield executor.submit(_compress_chunk, chunk, preset_window, not next_chunk, compress_type,
+                                  compresslevel)
+            if not next_chunk:
+                return
+            preset_window = chunk[-DEFLATE_WINDOW_SIZE:]
+            chunk = next_chunk
+
+
+def _write_local_header(archive: BinaryIO, member: _ZipMember) -> None:
+    """
+    Writes the local header of a member (the CRC-32 and the sizes are patched once it is compressed).
+
+    Params:
+        archive (BinaryIO): The archive being written.
+        member (_ZipMember): The member.
+    """
+    member.header_offset = archive.tell()
+    extra = b''
+    crc, compress_size, file_size = member.crc, member.compress_size, member.file_size
+    if member.has_data_descriptor:
+        crc, compress_size, file_size = 0, 0, 0
+    if member.requires_zip64:
+        extra = struct.pack('<HHQQ', 1, 16, file_size, compress_size)
+        compress_size, file_size = ZIP64_LIMIT, ZIP64_LIMIT
+    archive.write(struct.pack(LOCAL_HEADER_FORMAT, LOCAL_HEADER_SIGNATURE, member.extract_version,
+                              member.flag_bits, member.compress_type, member.dos_time, member.dos_date,
+                              crc, compress_size, file_size, len(member.encoded_name), len(extra)))
+    archive.write(member.encoded_name)
+    archive.write(extra)
+
+
+def _finish_member(archive: BinaryIO, member: _ZipMember) -> None:
+    """
+    Records the CRC-32 and sizes of a compressed member, in its local header or in its data descriptor.
+
+    Params:
+        archive (BinaryIO): The archive being written.
+        member (_ZipMember): The compressed member.
+    """
+    if not member.requires_zip64 and max(member.compress_size, member.file_size) > ZIP64_LIMIT:
+        raise zipfile.LargeZipFile(f'{member.arcname} grew over the ZIP64 limit while being compressed.')
+    if member.has_data_descriptor:
+        sizes_format = 'QQ' if member.requires_zip64 else 'II'
+        archive.write(struct.pack(f'<4sI{sizes_format}', DATA_DESCRIPTOR_SIGNATURE, member.crc,
+                                  member.compress_size, member.file_size))
+        return
+    end_offset = archive.tell()
+    archive.seek(member.header_offset)
+    _write_local_header(archive, member)
+    archive.seek(end_offset)
+
+
+def _write_central_directory(archive: BinaryIO, members: list[_ZipMember]) -> None:
+    """
+    Writes the central directory and the end records of the archive.
+
+    Params:
+        archive (BinaryIO): The archive being written.
+        members (list[_ZipMember]): The members of the archive, in order.
+    """
+    central_directory_offset = archive.tell()
+    for member in members:
+        zip64_fields = []
+        file_size, compress_size, header_offset = member.file_size, member.compress_size, member.header_offset
+        if file_size > ZIP64_LIMIT or member.requires_zip64:
+            zip64_fields.append(file_size)
+            file_size = ZIP64_LIMIT
+        if compress_size > ZIP64_LIMIT or member.requires_zip64:
+            zip64_fields.append(compress_size)
+            compress_size = ZIP64_LIMIT
+        if header_offset > ZIP64_LIMIT:
+            zip64_fields.append(header_offset)
+            header_offset = ZIP64_LIMIT
+        extra = struct.pack(f'<HH{len(zip64_fields)}Q', 1, 8 * len(zip64_fields), *zip64_fields) \
+            if zip64_fields else b''
+        extract_version = max(member.extract_version, 45 if zip64_fields else 20)
+        archive.write(struct.pack(CENTRAL_HEADER_FORMAT, CENTRAL_HEADER_SIGNATURE, extract_version, 3,
+                                  extract_version, member.flag_bits, member.compress_type, member.dos_time,
+                                  member.dos_date, member.crc, compress_size, file_size,
+                                  len(member.encoded_name), len(extra), 0, 0, 0, (member.mode & 0xFFFF) << 16,
+                                  header_offset))
+        archive.write(member.encoded_name)
+        archive.write(extra)
+
+    central_directory_size = archive.tell() - central_directory_offset
+    members_count = len(members)
+    if (members_count > ZIP64_COUNT_LIMIT or central_directory_offset > ZIP64_LIMIT
+            or central_directory_size > ZIP64_LIMIT):
+        zip64_end_offset = archive.tell()
+        archive.write(struct.pack(ZIP64_END_FORMAT, ZIP64_END_SIGNATURE, 44, 45, 45, 0, 0, members_count,
+                                  members_count, central_directory_size, central_directory_offset))
+        archive.write(struct.pack(ZIP64_LOCATOR_FORMAT, ZIP64_LOCATOR_SIGNATURE, 0, zip64_end_offset, 1))
+    archive.write(struct.pack(END_FORMAT, END_SIGNATURE, 0, 0, min(members_count, ZIP64_COUNT_LIMIT),
+                              min(members_count, ZIP64_COUNT_LIMIT), min(central_directory_size, ZIP64_LIMIT),
+                              min(central_directory_offset, ZIP64_LIMIT), 0))
+
+
+def write_parallel_zip(archive_path: str, members: Iterable[tuple[str, str]], compression: str = 'deflated',
+                       compresslevel: int | None = None, max_workers: int | None = None,
+                       volume_size: int | None = None,
+                       on_volume_finalized: Callable[[str], None] | None = None) -> list[str]:
+    """
+    Writes a ZIP archive whose members are compressed by a pool of threads.
+
+    The files are split in chunks compressed independently (one job per file for bzip2), so both many
+    small files and a few large files keep all the threads busy. The compressed chunks are written in
+    order by a single writer, which then assembles the central directory. The chunks compressed ahead
+    of the writer are limited, so the memory used doesn't depend on the size of the files.
+
+    Params:
+        archive_path (str): The path of the archive.
+        members (Iterable[tuple[str, str]]): The path of every file and its name inside the archive.
+        compression (str, optional): The compression method ('stored', 'deflated' or 'bzip2').
+        compresslevel (int | None, optional): The compression level (1 to 9). Defaults to the default
+            level of the compression method.
+        max_workers (int | None, optional): The number of compressing threads. Defaults to the number of CPUs.
+        volume_size (int | None, optional): The size of the volumes the archive is split in ('<archive>.001',
+            '<archive>.002', ...). Defaults to a single file if not specified. The volumes are written
+            sequentially, so the CRC-32 and sizes of the members are stored in data descriptors.
+        on_volume_finalized (Callable[[str], None] | None, optional): The function called with the path of
+            every complete volume.
+
+    Returns:
+        list[str]: The paths of the files written (the archive, or its volumes).
+    """
+    compress_type = COMPRESSION_METHODS[compression]
+    if compresslevel is None:
+        compresslevel = 9 if compress_type == zipfile.ZIP_BZIP2 else zlib.Z_DEFAULT_COMPRESSION
+    max_workers = max_workers or os.cpu_count() or 1
+    max_pending_jobs = max_workers * CHUNKS_AHEAD_PER_WORKER
+
+    written_members = []
+    if volume_size:
+        archive = SplitVolumeWriter(archive_path, volume_size, on_volume_finalized)
+    else:
+        archive = open(archive_path, 'wb')
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # The queue holds members (starting a new local header) and compression jobs, in archive order
+            pending = deque()
+            pending_jobs = 0
+
+            def write_next() -> None:
+                nonlocal pending_jobs
+                item = pending.popleft()
+                if isinstance(item, _ZipMember):
+                    if written_members:
+                        _finish_member(archive, written_members[-1])
+                    _write_local_header(archive, item)
+                    written_members.append(item)
+                    return
+                pending_jobs -= 1
+                member = written_members[-1]
+                crc, data_size, compressed_data = item.result()
+                member.crc = crc32_combine(member.crc, crc, data_size)
+                member.file_size += data_size
+                if isinstance(compressed_data, bytes):
+                    archive.write(compressed_data)
+                    member.compress_size += len(compressed_data)
+                else:
+                    with compressed_data:
+                        shutil.copyfileobj(compressed_data, archive)
+                        member.compress_size += compressed_data.tell()
+
+            for file_path, arcname in members:
+                pending.append(_ZipMember(file_path, arcname, compress_type, has_data_descriptor=bool(volume_size)))
+                for job in _member_jobs(executor, file_path, compress_type, compresslevel):
+                    pending.append(job)
+                    pending_jobs += 1
+                    while pending_jobs > max_pending_jobs:
+                        write_next()
+            while pending:
+                write_next()
+            if written_members:
+                _finish_member(archive, written_members[-1])
+            _write_central_directory(archive, written_members)
+        # Closing finalizes the last volume
+        archive.close()
+    except BaseException:
+        if volume_size:
+            archive.remove_volumes()
+        else:
+            archive.close()
+            os.remove(archive_path)
+        raise
+
+    return archive.volume_paths if volume_size else [archive_path]
+
+
+def member_target_path(destination_path: str, member_name: str) -> str:
+    """
+    Provides the path where a member of a ZIP archive is extracted, sanitized like 'zipfile' does.
+
+    Absolute paths, drive letters and '.' or '..' components are dropped from the member name, so the
+    member is always extracted inside the destination folder.
+
+    Params:
+        destination_path (str): The absolute path of the destination folder.
+        member_name (str): The name of the member inside the archive.
+
+    Returns:
+        str: The path of the extracted member.
+    """
+    relative_path = member_name.replace('/', os.sep)
+    if os.altsep:
+        relative_path = relative_path.replace(os.altsep, os.sep)
+    relative_path = os.path.splitdrive(relative_path)[1]
+    path_parts = [part for part in relative_path.split(os.sep) if part not in ('', os.curdir, os.pardir)]
+    if os.sep == '\\':
+        path_parts = [part.translate(WINDOWS_INVALID_CHARACTERS).rstrip('. ') for part in path_parts]
+        path_parts = [part for part in path_parts if part]
+    return os.path.join(destination_path, *path_parts)
+
+
+def _plan_extraction(archive: zipfile.ZipFile, destination_path: str,
+                     member_names: Iterable[str] | None) -> list[tuple[zipfile.ZipInfo, str]]:
+    """
+    Validates the paths of the extracted members and creates their folders, before any member is extracted.
+
+    Params:
+        archive (zipfile.ZipFile): The archive.
+        destination_path (str): The absolute path of the destination folder.
+        member_names (Iterable[str] | None): The names of the extracted members (all the members if None).
+
+    Returns:
+        list[tuple[zipfile.ZipInfo, str]]: The extracted files and their paths, the largest files first.
+    """
+    selected_names = set(member_names) if member_names is not None else None
+    real_destination_path = os.path.realpath(destination_path)
+    targets = {}
+    for info in archive.infolist():
+        if selected_names is not None and info.filename not in selected_names:
+            continue
+        target_path = member_target_path(destination_path, info.filename)
+        # A folder of the destination may be a link leading outside of it
+        real_target_path = os.path.realpath(target_path)
+        if os.path.commonpath([real_destination_path, real_target_path]) != real_destination_path:
+            raise ValueError(f'{info.filename} would be extracted outside of {destination_path}.')
+        # Like 'extractall', a later member with the same path replaces an earlier one
+        targets[target_path] = info
+
+    folders = {destination_path}
+    files = []
+    for target_path, info in targets.items():
+        if info.is_dir():
+            folders.add(target_path)
+        else:
+            folders.add(os.path.dirname(target_path))
+            files.append((info, target_path))
+    for folder in sorted(folders):
+        os.makedirs(folder, exist_ok=True)
+    return sorted(files, key=lambda file: file[0].compress_size, reverse=True)
+
+
+def extract_parallel_zip(archive_path: str, destination_path: str, member_names: Iterable[str] | None = None,
+                         max_workers: int | None = None) -> list[str]:
+    """
+    Extracts the members of a ZIP archive with a pool of threads.
+
+    The paths of all the members are validated and their folders are created up front. Every thread then
+    opens the archive once (independent file handles, so the threads don't wait for each other's reads)
+    and streams the members it is given to disk, the largest ones first. Each thread copies through a
+    buffer taken from a fixed memory budget, so the memory used doesn't depend on the size of the members.
+
+    Params:
+        archive_path (str): The path of the archive (or of the first volume of a split archive).
+        destination_path (str): The destination folder for the extracted members.
+        member_names (Iterable[str] | None, optional): The names of the extracted members.
+            Defaults to all the members if not specified.
+        max_workers (int | None, optional): The number of extracting threads. Defaults to the number of CPUs.
+
+    Returns:
+        list[str]: The names inside the archive of the extracted files.
+    """
+    destination_path = os.path.abspath(destination_path)
+    with open_archive_file(archive_path) as archive_file, zipfile.ZipFile(archive_file) as archive:
+        files = _plan_extraction(archive, destination_path, member_names)
+    max_workers = max(1, min(max_workers or os.cpu_count() or 1, len(files)))
+    copy_buffer_size = min(max(EXTRACTION_MEMORY_BUDGET // max_workers, MIN_COPY_BUFFER_SIZE), MAX_COPY_BUFFER_SIZE)
+
+    thread_archives = threading.local()
+    opened_archives = []
+    opened_archives_lock = threading.Lock()
+
+    def extract_member(file: tuple[zipfile.ZipInfo, str]) -> str:
+        info, target_path = file
+        if not hasattr(thread_archives, 'archive'):
+            archive_file = open_archive_file(archive_path)
+            thread_archives.archive = zipfile.ZipFile(archive_file)
+            with opened_archives_lock:
+                opened_archives.extend([thread_archives.archive, archive_file])
+        with thread_archives.archive.open(info) as source, open(target_path, 'wb') as target:
+            shutil.copyfileobj(source, target, copy_buffer_size)
+        return info.filename
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            extracted_members = set(executor.map(extract_member, files))
+    finally:
+        for opened_archive in opened_archives:
+            opened_archive.close()
+
+    return [info.filename for info, _ in sorted(files, key=lambda file: file[0].header_offset)
+            if info.filename in extracted_members]
@@ -23,6 +23,34 @@ def get_project_keys_path() -> str:
     return os.path.join(get_project_folder(), 'resources', 'results', 'keys')
 
 
+def get_project_index_path() -> str:
+    """
+    Get the path of the database file where the file index of the searched folders is stored.
+    """
+    return os.path.join(get_project_folder(), 'resources', 'results', 'file_index.db')
+
+
+def get_project_hash_cache_path() -> str:
+    """
+    Get the path of the database file where the hashes computed for the compared files are cached.
+    """
+    return os.path.join(get_project_folder(), 'resources', 'results', 'hash_cache.db')
+
+
+def get_project_keystore_path() -> str:
+    """
+    Get the path of the database file where the encryption keys are stored.
+    """
+    return os.path.join(get_project_folder(), 'resources', 'results', 'keys', 'keystore.db')
+
+
+def get_project_journal_path() -> str:
+    """
+    Get the path of the folder where the in-progress file rewrites are journaled.
+    """
+    return os.path.join(get_project_folder(), 'resources', 'results', 'journal')
+
+
 def get_project_icons_path() -> str:
     """
     Get the root path of the project where this script is located for icon files.
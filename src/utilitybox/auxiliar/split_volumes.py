@@ -0,0 +1,271 @@
+import io
+import os
+from typing import BinaryIO, Callable
+
+"""
+Split volumes Params (number of digits of the volume numbers, the volumes of 'archive.zip' being
+'archive.zip.001', 'archive.zip.002', ...).
+"""
+VOLUME_NUMBER_DIGITS = 3
+FIRST_VOLUME_SUFFIX = '.' + '1'.zfill(VOLUME_NUMBER_DIGITS)
+
+
+def volume_path(archive_path: str, volume_number: int) -> str:
+    """
+    Provides the path of a volume of a split archive.
+
+    Params:
+        archive_path (str): The path of the archive, without volume number.
+        volume_number (int): The number of the volume (starting at 1).
+
+    Returns:
+        str: The path of the volume.
+    """
+    return f'{archive_path}.{str(volume_number).zfill(VOLUME_NUMBER_DIGITS)}'
+
+
+def is_split_archive(archive_file_path: str) -> bool:
+    """
+    Checks whether a path is the first volume of a split archive.
+
+    Params:
+        archive_file_path (str): The path of the archive.
+
+    Returns:
+        bool: True if the path ends with the suffix of the first volume, False otherwise.
+    """
+    return archive_file_path.endswith(FIRST_VOLUME_SUFFIX)
+
+
+def base_archive_path(archive_file_path: str) -> str:
+    """
+    Provides the path of an archive without its volume number (e.g. 'archive.zip' for 'archive.zip.001').
+
+    Params:
+        archive_file_path (str): The path of the archive or of its first volume.
+
+    Returns:
+        str: The path of the archive, without volume number.
+    """
+    return archive_file_path[:-len(FIRST_VOLUME_SUFFIX)] if is_split_archive(archive_file_path) \
+        else archive_file_path
+
+
+def open_archive_file(archive_file_path: str) -> BinaryIO:
+    """
+    Opens an archive for reading, the volumes of a split archive being read as a single file.
+
+    Params:
+        archive_file_path (str): The path of the archive or of its first volume.
+
+    Returns:
+        BinaryIO: The content of the archive, opened in binary mode.
+    """
+    if is_split_archive(archive_file_path):
+        return io.BufferedReader(SplitVolumeReader(base_archive_path(archive_file_path)))
+    return open(archive_file_path, 'rb')
+
+
+def remove_volumes(archive_path: str) -> None:
+    """
+    Removes the consecutive volumes of a split archive, if any.
+
+    Params:
+        archive_path (str): The path of the archive, without volume number.
+    """
+    volume_number = 1
+    while os.path.exists(volume_path(archive_path, volume_number)):
+        os.remove(volume_path(archive_path, volume_number))
+        volume_number += 1
+
+
+class SplitVolumeWriter(io.RawIOBase):
+    """
+    Write-only file splitting its content in volumes of a fixed size.
+
+    A volume is flushed to disk and closed as soon as it is full, before the next one is created, so the
+    finished volumes can be copied while the archive is still being written. Writing the volumes one after
+    the other (e.g. 'cat archive.zip.* > archive.zip') gives the whole archive.
+
+    The volumes of an earlier archive with the same path are removed first, so a shorter archive never
+    gets chained with the remaining volumes of a longer one when it is read.
+
+    Attributes:
+        self.archive_path (str): The path of the archive, without volume number.
+        self.volume_size (int): The size of every volume but the last one.
+        self.on_volume_finalized (Callable[[str], None] | None): The function called with the path of
+            every volume once it is complete.
+        self.volume_paths (list[str]): The paths of the volumes created.
+        self.volume_file (BinaryIO | None): The volume being written.
+        self.volume_written (int): The number of bytes written in the current volume.
+        self.position (int): The number of bytes written in all the volumes.
+    """
+
+    def __init__(self, archive_path: str, volume_size: int, on_volume_finalized: Callable[[str], None] | None = None):
+        """
+        Initialize the SplitVolumeWriter object.
+
+        Params:
+            archive_path (str): The path of the archive, without volume number.
+            volume_size (int): The size of every volume but the last one.
+            on_volume_finalized (Callable[[str], None] | None, optional): The function called with the path
+                of every volume once it is complete.
+        """
+        super().__init__()
+        if volume_size <= 0:
+            raise ValueError('The size of the volumes must be positive.')
+        self.archive_path = archive_path
+        self.volume_size = volume_size
+        self.on_volume_finalized = on_volume_finalized
+        self.volume_paths = []
+        self.volume_file = None
+        self.volume_written = 0
+        self.position = 0
+        remove_volumes(archive_path)
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.position
+
+    def _open_next_volume(self) -> None:
+        self.volume_paths.append(volume_path(self.archive_path, len(self.volume_paths) + 1))
+        self.volume_file = open(self.volume_paths[-1], 'wb')
+        self.volume_written = 0
+
+    def _finalize_volume(self) -> None:
+        self.volume_file.flush()
+        os.fsync(self.volume_file.fileno())
+        self.volume_file.close()
+        self.volume_file = None
+        if self.on_volume_finalized:
+            self.on_volume_finalized(self.volume_paths[-1])
+
+    def write(self, data) -> int:
+        """
+        Writes data at the end of the archive, starting new volumes as needed.
+
+        Params:
+            data (bytes-like): The data.
+
+        Returns:
+            int: The number of bytes written (all the data).
+        """
+        data = memoryview(data).cast('B')
+        written = 0
+        while written < len(data):
+            # A volume is only created when there is data for it, so the last volume is never empty
+            if self.volume_file is None:
+                self._open_next_volume()
+            part_size = min(self.volume_size - self.volume_written, len(data) - written)
+            self.volume_file.write(data[written:written + part_size])
+            self.volume_written += part_size
+            written += part_size
+            if self.volume_written == self.volume_size:
+                self._finalize_volume()
+        self.position += written
+        return written
+
+    def close(self) -> None:
+        """
+        Finalizes the last volume (an empty archive still gets its first volume).
+        """
+        if not self.closed:
+            if not self.volume_paths:
+                self._open_next_volume()
+            if self.volume_file is not None:
+                self._finalize_volume()
+        super().close()
+
+    def remove_volumes(self) -> None:
+        """
+        Removes the volumes created (used when the archive can't be completed).
+        """
+        if self.volume_file is not None:
+            self.volume_file.close()
+            self.volume_file = None
+        for created_volume_path in self.volume_paths:
+            if os.path.exists(created_volume_path):
+                os.remove(created_volume_path)
+        super().close()
+
+
+class SplitVolumeReader(io.RawIOBase):
+    """
+    Read-only, seekable file reading the volumes of a split archive as a single file.
+
+    Attributes:
+        self.volume_paths (list[str]): The paths of the volumes, in order.
+        self.volume_offsets (list[int]): The position in the archive of the start of every volume.
+        self.size (int): The size of the archive.
+        self.position (int): The current position in the archive.
+        self.volume_files (dict[int, BinaryIO]): The volumes opened, by index.
+    """
+
+    def __init__(self, archive_path: str):
+        """
+        Initialize the SplitVolumeReader object with all the consecutive volumes of the archive.
+
+        Params:
+            archive_path (str): The path of the archive, without volume number.
+        """
+        super().__init__()
+        self.volume_paths = []
+        self.volume_offsets = []
+        self.size = 0
+        while os.path.exists(volume_path(archive_path, len(self.volume_paths) + 1)):
+            self.volume_paths.append(volume_path(archive_path, len(self.volume_paths) + 1))
+            self.volume_offsets.append(self.size)
+            self.size += os.path.getsize(self.volume_paths[-1])
+        if not self.volume_paths:
+            raise FileNotFoundError(f'{volume_path(archive_path, 1)} doesn\'t exist.')
+        self.position = 0
+        self.volume_files = {}
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self.position
+        elif whence == os.SEEK_END:
+            offset += self.size
+        if offset < 0:
+            raise ValueError('Negative seek position.')
+        self.position = offset
+        return self.position
+
+    def readinto(self, buffer) -> int:
+        """
+        Reads data from the current position, within a single volume.
+
+        Params:
+            buffer (bytes-like): The buffer receiving the data.
+
+        Returns:
+            int: The number of bytes read (0 at the end of the archive).
+        """
+        if self.position >= self.size:
+            return 0
+        volume_index = next(index for index in range(len(self.volume_offsets) - 1, -1, -1)
+                            if self.volume_offsets[index] <= self.position)
+        if volume_index not in self.volume_files:
+            self.volume_files[volume_index] = open(self.volume_paths[volume_index], 'rb')
+        volume_file = self.volume_files[volume_index]
+        volume_file.seek(self.position - self.volume_offsets[volume_index])
+        read_size = volume_file.readinto(memoryview(buffer)[:self.size - self.position])
+        self.position += read_size
+        return read_size
+
+    def close(self) -> None:
+        for volume_file in self.volume_files.values():
+            volume_file.close()
+        self.volume_files.clear()
+        super().close()
@@ -0,0 +1,226 @@
+import base64
+import os
+import struct
+from typing import BinaryIO
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+"""
+Stream encryption Params (identification of the format, size of the encrypted chunks and sizes of
+the nonce prefix, file identifier and authentication tag).
+
+Format of an encrypted file:
+    header: magic (4 bytes) | version (1 byte) | chunk size (4 bytes) | nonce prefix (7 bytes) | file id (16 bytes)
+        followed, for the files encrypted with a key derived from a passphrase (version 2), by the key derivation
+        parameters: salt (16 bytes) | log2 of the cost (1 byte) | block size (1 byte) | parallelization (1 byte)
+    chunks: AES-256-GCM ciphertext of every chunk of the file, followed by its authentication tag (16 bytes)
+
+The nonce of a chunk is made of the nonce prefix, the index of the chunk and a flag marking the last
+chunk, so the chunks can't be reordered, duplicated or truncated without failing the authentication.
+The header is authenticated with every chunk.
+"""
+STREAM_MAGIC = b'UBSC'
+STREAM_VERSION = 1
+DERIVED_KEY_STREAM_VERSION = 2
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+NONCE_PREFIX_SIZE = 7
+FILE_ID_SIZE = 16
+TAG_SIZE = 16
+HEADER_FORMAT = f'>4sBI{NONCE_PREFIX_SIZE}s{FILE_ID_SIZE}s'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+KDF_PARAMS_FORMAT = '>16sBBB'
+KDF_PARAMS_SIZE = struct.calcsize(KDF_PARAMS_FORMAT)
+
+
+def _create_cipher(key: bytes) -> AESGCM:
+    """
+    Creates the AES-256-GCM cipher for a key generated by 'Fernet.generate_key'.
+
+    Params:
+        key (bytes): The url-safe base64-encoded 32-byte key.
+
+    Returns:
+        AESGCM: The cipher using the decoded key.
+    """
+    decoded_key = base64.urlsafe_b64decode(key)
+    if len(decoded_key) != 32:
+        raise ValueError('The encryption key must be 32 url-safe base64-encoded bytes.')
+    return AESGCM(decoded_key)
+
+
+def _chunk_nonce(nonce_prefix: bytes, chunk_index: int, last_chunk: bool) -> bytes:
+    """
+    Builds the nonce of a chunk.
+
+    Params:
+        nonce_prefix (bytes): The random nonce prefix of the file.
+        chunk_index (int): The index of the chunk in the file.
+        last_chunk (bool): Flag indicating whether the chunk is the last one of the file.
+
+    Returns:
+        bytes: The 12-byte nonce of the chunk.
+    """
+    return nonce_prefix + struct.pack('>I?', chunk_index, last_chunk)
+
+
+def read_stream_header(source: BinaryIO) -> tuple[bytes, int, bytes, bytes, tuple | None] | None:
+    """
+    Reads the header of a stream encrypted file.
+
+    Params:
+        source (BinaryIO): The encrypted file, positioned at its start.
+
+    Returns:
+        tuple[bytes, int, bytes, bytes, tuple | None] | None: The raw header, the chunk size, the nonce prefix,
+            the file identifier and the key derivation parameters (None if the key was not derived from a
+            passphrase), or None if the file doesn't start with a stream encryption header.
+    """
+    header = source.read(HEADER_SIZE)
+    if len(header) < HEADER_SIZE:
+        return None
+    magic, version, chunk_size, nonce_prefix, file_id = struct.unpack(HEADER_FORMAT, header)
+    if magic != STREAM_MAGIC or version not in (STREAM_VERSION, DERIVED_KEY_STREAM_VERSION):
+        return None
+
+    kdf_params = None
+    if version == DERIVED_KEY_STREAM_VERSION:
+        packed_kdf_params = source.read(KDF_PARAMS_SIZE)
+        if len(packed_kdf_params) < KDF_PARAMS_SIZE:
+            return None
+        header += packed_kdf_params
+        kdf_params = struct.unpack(KDF_PARAMS_FORMAT, packed_kdf_params)
+    return header, chunk_size, nonce_prefix, file_id, kdf_params
+
+
+def is_stream_encrypted(file_path: str) -> bool:
+    """
+    Checks if a file was encrypted with the stream encryption format.
+
+    Params:
+        file_path (str): The path of the file.
+
+    Returns:
+        bool: True if the file starts with a stream encryption header, False otherwise.
+    """
+    with open(file_path, 'rb') as file:
+        return read_stream_header(file) is not None
+
+
+def read_file_id(file_path: str) -> bytes | None:
+    """
+    Provides the identifier stored in the header of a stream encrypted file.
+
+    Params:
+        file_path (str): The path of the file.
+
+    Returns:
+        bytes | None: The identifier of the file, or None if the file is not stream encrypted.
+    """
+    with open(file_path, 'rb') as file:
+        stream_header = read_stream_header(file)
+    return stream_header[3] if stream_header else None
+
+
+def read_kdf_params(file_path: str) -> tuple[bytes, int, int, int] | None:
+    """
+    Provides the key derivation parameters stored in the header of a stream encrypted file.
+
+    Params:
+        file_path (str): The path of the file.
+
+    Returns:
+        tuple[bytes, int, int, int] | None: The salt, the log2 of the cost, the block size and the parallelization
+            of the key derivation, or None if the key of the file was not derived from a passphrase.
+    """
+    with open(file_path, 'rb') as file:
+        stream_header = read_stream_header(file)
+    return stream_header[4] if stream_header else None
+
+
+def encrypt_stream(key: bytes, source: BinaryIO, destination: BinaryIO,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE, file_id: bytes | None = None,
+                   kdf_params: tuple[bytes, int, int, int] | None = None) -> bytes:
+    """
+    Encrypts a stream chunk by chunk, so the memory used doesn't depend on its size.
+
+    Params:
+        key (bytes): The url-safe base64-encoded 32-byte key.
+        source (BinaryIO): The stream to encrypt.
+        destination (BinaryIO): The stream receiving the header and the encrypted chunks.
+        chunk_size (int, optional): The size of the encrypted chunks.
+        file_id (bytes | None, optional): The identifier of the encrypted file, stored in its header.
+            A random identifier is generated if not specified.
+        kdf_params (tuple[bytes, int, int, int] | None, optional): The parameters of the derivation of the
+            key from a passphrase (salt, log2 of the cost, block size and parallelization), stored in the header.
+
+    Returns:
+        bytes: The identifier of the encrypted file.
+    """
+    cipher = _create_cipher(key)
+    nonce_prefix = os.urandom(NONCE_PREFIX_SIZE)
+    file_id = file_id or os.urandom(FILE_ID_SIZE)
+    if kdf_params is None:
+        header = struct.pack(HEADER_FORMAT, STREAM_MAGIC, STREAM_VERSION, chunk_size, nonce_prefix, file_id)
+    else:
+        header = (struct.pack(HEADER_FORMAT, STREAM_MAGIC, DERIVED_KEY_STREAM_VERSION, chunk_size, nonce_prefix,
+                              file_id) + struct.pack(KDF_PARAMS_FORMAT, *kdf_params))
+    destination.write(header)
+
+    chunk_index = 0
+    chunk = source.read(chunk_size)
+    while True:
+        next_chunk = source.read(chunk_size)
+        last_chunk = not next_chunk
+        destination.write(cipher.encrypt(_chunk_nonce(nonce_prefix, chunk_index, last_chunk), chunk, header))
+        if last_chunk:
+            return file_id
+        chunk = next_chunk
+        chunk_index += 1
+
+
+def decrypt_stream(key: bytes, source: BinaryIO, destination: BinaryIO | None) -> None:
+    """
+    Decrypts a stream encrypted by 'encrypt_stream', chunk by chunk.
+
+    Params:
+        key (bytes): The url-safe base64-encoded 32-byte key used for the encryption.
+        source (BinaryIO): The encrypted stream, positioned at its start.
+        destination (BinaryIO | None): The stream receiving the decrypted chunks (the decrypted chunks are
+            discarded if None, which only verifies the stream).
+
+    Notes:
+        cryptography.exceptions.InvalidTag is raised if the key is wrong or the stream was altered.
+    """
+    cipher = _create_cipher(key)
+    stream_header = read_stream_header(source)
+    if stream_header is None:
+        raise ValueError('The file was not encrypted with the stream encryption format.')
+    header, chunk_size, nonce_prefix, _, _ = stream_header
+
+    chunk_index = 0
+    chunk = source.read(chunk_size + TAG_SIZE)
+    while True:
+        next_chunk = source.read(chunk_size + TAG_SIZE)
+        last_chunk = not next_chunk
+        decrypted_chunk = cipher.decrypt(_chunk_nonce(nonce_prefix, chunk_index, last_chunk), chunk, header)
+        if destination is not None:
+            destination.write(decrypted_chunk)
+        if last_chunk:
+            return
+        chunk = next_chunk
+        chunk_index += 1
+
+
+def verify_stream(key: bytes, source: BinaryIO) -> None:
+    """
+    Verifies that a stream encrypted by 'encrypt_stream' matches a key and was not altered, checking
+    the authentication tags chunk by chunk without writing anything.
+
+    Params:
+        key (bytes): The url-safe base64-encoded 32-byte key used for the encryption.
+        source (BinaryIO): The encrypted stream, positioned at its start.
+
+    Notes:
+        cryptography.exceptions.InvalidTag is raised if the key is wrong or the stream was altered.
+    """
+    decrypt_stream(key, source, None)
@@ -8,7 +8,8 @@ from src.utilitybox.auxiliar.log_functions import update_file_log
 from src.utilitybox.auxiliar.operations_messages import log_compressing_results, log_decompressing_results
 from src.utilitybox.auxiliar.log_messages import path_invalid_message, update_display_log
 from src.utilitybox.auxiliar.project_paths import get_project_icons_path
-from src.utilitybox.functionalities.archive import Archive
+from src.utilitybox.auxiliar.split_volumes import base_archive_path
+from src.utilitybox.functionalities.archive import TAR_FORMATS, Archive
 
 """
 File archieving Params (used for radio buttons).
@@ -16,20 +17,34 @@ File archieving Params (used for radio buttons).
 COMPRESS_OPTION = 1
 DECOMPRESS_OPTION = 2
 
+"""
+Split archives Params (unit of the volume size entered by the user).
+"""
+VOLUME_SIZE_UNIT = 1024 * 1024
+
 
 def _compress_files(mainbox, operation_specific_identifier: str, archive_format: str, archive_name: str,
-                    file_list: list[str], file_list_basename: list[str], destination_path: str) -> None:
+                    file_list: list[str], destination_path: str, compression_method: str = 'deflated',
+                    compression_level: str = 'Default', incremental: bool = False,
+                    previous_archive_path: str = '', volume_size: str = '') -> None:
     """
     Compress files into an archive.
 
     Params:
         mainbox (MainBox): An instance of the MainBox class.
         operation_specific_identifier (str): A unique identifier for the compression operation.
-        archive_format (str): The format of the archive ('zip' or 'rar').
+        archive_format (str): The format of the archive ('zip', 'rar', 'tar.gz', 'tar.xz', 'tar.zst' or 'ubstore',
+            a deduplicating store where the archive is added as a snapshot).
         archive_name (str): The name of the archive.
         file_list (list[str]): List of file paths to be compressed.
-        file_list_basename (list[str]): List of file basenames to be compressed.
         destination_path (str): The destination path for the archive.
+        compression_method (str, optional): The compression method of ZIP archives ('deflated', 'bzip2' or 'stored').
+        compression_level (str, optional): The compression level of ZIP and tar archives ('Default' or '1' to '9').
+        incremental (bool, optional): Flag indicating whether only the files changed since the previous
+            archive are compressed (ZIP archives only).
+        previous_archive_path (str, optional): The previous incremental archive (a new chain is started if empty).
+        volume_size (str, optional): The size in MB of the volumes the ZIP and tar archives are split in
+            (a single archive file if empty).
 
     Notes:
         This function handles the compression of files into an archive.
@@ -49,11 +64,22 @@ def _compress_files(mainbox, operation_specific_identifier: str, archive_format:
     archive = Archive()
     operation_id = operation_code['OK']
     try:
+        compresslevel = int(compression_level) if compression_level.isdigit() else None
+        volume_size = int(float(volume_size) * VOLUME_SIZE_UNIT) if volume_size else None
         if archive_format == 'rar':
-            archive.compress_rar_files(archive_name, file_list_basename, destination_path)
+            archive.compress_rar_files(archive_name, file_list, destination_path)
+        elif archive_format == 'ubstore':
+            archive.compress_deduplicated(archive_name, file_list, destination_path)
+        elif archive_format in TAR_FORMATS:
+            archive.compress_tar_files(archive_name, file_list, destination_path, archive_format,
+                                       compresslevel=compresslevel, volume_size=volume_size)
+        elif incremental:
+            archive.compress_incremental_zip(archive_name, file_list, destination_path, previous_archive_path,
+                                             compression=compression_method, compresslevel=compresslevel)
         else:
-            archive.compress_zip_files(archive_name, file_list, destination_path)
-        archive.clean_files(file_list_basename, destination_path)
+            archive.compress_zip_files(archive_name, file_list, destination_path,
+                                       compression=compression_method, compresslevel=compresslevel,
+                                       volume_size=volume_size)
         update_display_log(mainbox, operation_specific_identifier, operation_id)
         log_compressing_results(operation_specific_identifier, operation_id, destination_path)
     except Exception as e:
@@ -61,7 +87,7 @@ def _compress_files(mainbox, operation_specific_identifier: str, archive_format:
 
 
 def _decompress_files(mainbox, operation_specific_identifier: str, compressed_archive_location: str,
-                      destination_path: str) -> None:
+                      destination_path: str, members_pattern: str = '', use_regex: bool = False) -> None:
     """
     Decompress files from an archive.
 
@@ -70,6 +96,8 @@ def _decompress_files(mainbox, operation_specific_identifier: str, compressed_ar
         operation_specific_identifier (str): A unique identifier for the decompression operation.
         compressed_archive_location (str): The location of the compressed archive file.
         destination_path (str): The destination path for decompressed files.
+        members_pattern (str, optional): The pattern selecting the files to extract (all the files if empty).
+        use_regex (bool, optional): Flag indicating whether the pattern is a regular expression.
 
     Notes:
         This function handles the decompression of files from an archive.
@@ -86,9 +114,18 @@ def _decompress_files(mainbox, operation_specific_identifier: str, compressed_ar
 
     operation_id = operation_code['OK']
     try:
-        archive_type = os.path.splitext(os.path.basename(compressed_archive_location))[1]
-        if archive_type == '.rar':
+        # The first volume of a split archive ('archive.zip.001') is handled like the whole archive
+        archive_type = os.path.splitext(base_archive_path(compressed_archive_location))[1].lower()
+        if members_pattern:
+            archive.extract_members(compressed_archive_location, members_pattern, destination_path, use_regex)
+        elif Archive.tar_format(compressed_archive_location):
+            archive.decompress_tar_files(compressed_archive_location, destination_path)
+        elif archive_type == '.ubstore':
+            archive.restore_deduplicated(compressed_archive_location, destination_path)
+        elif archive_type == '.rar':
             archive.decompress_rar_files(compressed_archive_location, destination_path)
+        elif archive_type == '.zip' and Archive.is_incremental_archive(compressed_archive_location):
+            archive.restore_incremental_zip(compressed_archive_location, destination_path)
         elif archive_type == '.zip':
             archive.decompress_zip_files(compressed_archive_location, destination_path)
         update_display_log(mainbox, operation_specific_identifier, operation_id)
@@ -100,7 +137,9 @@ def _decompress_files(mainbox, operation_specific_identifier: str, compressed_ar
 def _determine_operation_type(mainbox, operation_specific_identifier: list[str], radio_button: int,
                               dropdown_current_option: str,
                               archive_name: str, file_list: list[str], compressed_archive_location: str,
-                              destination_path: str, ) -> None:
+                              destination_path: str, compression_method: str = 'deflated',
+                              compression_level: str = 'Default', members_pattern: str = '',
+                              use_regex: bool = False, incremental: bool = False, volume_size: str = '') -> None:
     """
     Start the archiving process based on user input.
 
@@ -113,15 +152,21 @@ def _determine_operation_type(mainbox, operation_specific_identifier: list[str],
         compressed_archive_location (str): The location of the compressed archive file.
         archive_name (str): The name of the archive.
         file_list (list[str]): List of selected files for the archive.
+        compression_method (str, optional): The compression method of ZIP archives.
+        compression_level (str, optional): The compression level of ZIP archives.
+        members_pattern (str, optional): The pattern selecting the files to extract (all the files if empty).
+        use_regex (bool, optional): Flag indicating whether the pattern is a regular expression.
+        incremental (bool, optional): Flag indicating whether only the files changed since the archive
+            at the compressed archive location are compressed.
+        volume_size (str, optional): The size in MB of the volumes the archive is split in (a single file if empty).
     """
-    archive = Archive()
-    file_list_basename = [os.path.basename(file) for file in file_list]
     if radio_button == COMPRESS_OPTION:
-        archive.transfer_to_temporary_folder(file_list, destination_path)
         _compress_files(mainbox, operation_specific_identifier[0], dropdown_current_option, archive_name, file_list,
-                        file_list_basename, destination_path)
+                        destination_path, compression_method, compression_level, incremental,
+                        compressed_archive_location, volume_size)
     elif radio_button == DECOMPRESS_OPTION:
-        _decompress_files(mainbox, operation_specific_identifier[1], compressed_archive_location, destination_path)
+        _decompress_files(mainbox, operation_specific_identifier[1], compressed_archive_location, destination_path,
+                          members_pattern, use_regex)
 
 
 class ArchiveWindow(ctk.CTkToplevel):
@@ -144,7 +189,7 @@ class ArchiveWindow(ctk.CTkToplevel):
         """
         super().__init__()
         self.title(' Archives')
-        self.geometry('252x630')
+        self.geometry('252x960')
         self.resizable(False, False)
         self.configure(bg='#222629')
         self.operation_specific_identifier = ['Compress', 'Decompress']
@@ -162,10 +207,15 @@ class ArchiveWindow(ctk.CTkToplevel):
             self.dropdown_current_option = choice
 
         # The most common compression types are usually used
+        # ('ubstore' adds the files as a snapshot of a store keeping every distinct chunk of content once)
         archive_types = [
-            'zip', 'rar'
+            'zip', 'rar', 'tar.gz', 'tar.xz', 'tar.zst', 'ubstore'
         ]
 
+        # Compression of the ZIP and tar archives (RAR archives always use the best compression)
+        compression_methods = ['deflated', 'bzip2', 'stored']
+        compression_levels = ['Default'] + [str(level) for level in range(1, 10)]
+
         radio_var = tk.IntVar(value=0)
 
         # Widgets implementation
@@ -180,6 +230,18 @@ class ArchiveWindow(ctk.CTkToplevel):
             command=archive_type_menu_callback,
             variable=self.archive_type_option_menu)
 
+        self.compression_method_option_menu = ctk.CTkOptionMenu(
+            master=self, values=compression_methods, variable=ctk.StringVar(value='deflated'))
+        self.compression_level_option_menu = ctk.CTkOptionMenu(
+            master=self, values=compression_levels, variable=ctk.StringVar(value='Default'))
+
+        # The previous archive of an incremental archive is the one entered in the archive file path
+        self.incremental_checkbox = ctk.CTkCheckBox(master=self, text='Incremental (since the archive below)')
+
+        # ZIP and tar archives can be split in volumes of a fixed size ('archive.zip.001', 'archive.zip.002', ...)
+        self.volume_size_text = ctk.CTkLabel(master=self, text='Volume size in MB (empty for one file): ')
+        self.volume_size_entry = ctk.CTkEntry(master=self, width=220)
+
         self.files_selection_button = ctk.CTkButton(
             master=self, text='Select files', font=('Helvetica', 12, 'bold'), fg_color='#00539C', text_color='white',
             command=lambda: self.update_file_list())
@@ -198,6 +260,11 @@ class ArchiveWindow(ctk.CTkToplevel):
             master=self, text='Browse archive', font=('Helvetica', 12, 'bold'), fg_color='#00539C', text_color='white',
             command=lambda: browse_file(self.encrypted_file_path_entry))
 
+        # Selective extraction (e.g. 'logs/*.txt'), the whole archive is extracted if empty
+        self.members_pattern_text = ctk.CTkLabel(master=self, text='Extract only the files matching: ')
+        self.members_pattern_entry = ctk.CTkEntry(master=self, width=220)
+        self.regex_checkbox = ctk.CTkCheckBox(master=self, text='Regular expression')
+
         # Action buttons
         # Saving location:
         #   for compress -> location where the archive is stored
@@ -210,30 +277,44 @@ class ArchiveWindow(ctk.CTkToplevel):
 
         self.start_process_button = ctk.CTkButton(
             master=self, text='Start process', font=('Helvetica', 12, 'bold'), fg_color='green', text_color='white',
-            command=lambda: _determine_operation_type(mainbox, self.operation_specific_identifier,
-                                                      self.radio_current_option,
-                                                      self.dropdown_current_option, self.archive_name_entry.get(),
-                                                      self.file_list,
-                                                      self.encrypted_file_path_entry.get(),
-                                                      self.saving_file_path_entry.get()))
+            command=lambda: mainbox.job_executor.submit(_determine_operation_type, self.operation_specific_identifier,
+                                                        self.radio_current_option, self.dropdown_current_option,
+                                                        self.archive_name_entry.get(), self.file_list,
+                                                        self.encrypted_file_path_entry.get(),
+                                                        self.saving_file_path_entry.get(),
+                                                        self.compression_method_option_menu.get(),
+                                                        self.compression_level_option_menu.get(),
+                                                        self.members_pattern_entry.get().strip(),
+                                                        bool(self.regex_checkbox.get()),
+                                                        bool(self.incremental_checkbox.get()),
+                                                        self.volume_size_entry.get().strip()))
 
         # Widgets placement
         self.encryption_radiobutton.grid(row=1, column=0, padx=(15, 0), pady=(15, 0), sticky='nw')
         self.archive_type_option_menu.grid(row=2, column=0, padx=(15, 0), pady=(15, 0), sticky='nw')
-        self.archive_name_text.grid(row=3, column=0, padx=(15, 0), pady=(15, 0), sticky='nw')
-        self.archive_name_entry.grid(row=4, column=0, padx=(15, 0), pady=(15, 0), sticky='nw')
-        self.files_selection_button.grid(row=5, column=0, padx=(15, 0), pady=(15, 0), sticky='nw')
-
-        self.decryption_radiobutton.grid(row=6, column=0, padx=(15, 0), pady=(35, 0), sticky='nw')
-        self.encrypted_file_path_text.grid(row=7, column=0, padx=(15, 0), pady=(15, 0), sticky='nw')
-        self.encrypted_file_path_entry.grid(row=8, column=0, padx=(15, 0), pady=(15, 0), sticky='nw')
-        self.encrypted_file_path_button.grid(row=9, column=0, padx=(15, 0), pady=(15, 0))
-
-        self.saving_file_path_text.grid(row=10, column=0, padx=(15, 0), pady=(35, 0))
-        self.saving_file_path_entry.grid(row=11, column=0, padx=(15, 0), pady=(15, 0))
-        self.saving_file_path_button.grid(row=12, column=0, padx=(15, 0), pady=(15, 0))
-
-        self.start_process_button.grid(row=13, column=0, padx=(15, 0), pady=(40, 0))
+        self.compression_method_option_menu.grid(row=3, column=0, padx=(15, 0), pady=(15, 0), sticky='nw')
+        self.compression_level_option_menu.grid(row=4, column=0, padx=(15, 0), pady=(15, 0), sticky='nw')
+        self.archive_name_text.grid(row=5, column=0, padx=(15, 0), pady=(15, 0), sticky='nw')
+        self.archive_name_entry.grid(row=6, column=0, padx=(15, 0), pady=(15, 0), sticky='nw')
+        self.incremental_checkbox.grid(row=7, column=0, padx=(15, 0), pady=(15, 0), sticky='nw')
+        self.volume_size_text.grid(row=8, column=0, padx=(15, 0), pady=(15, 0), sticky='nw')
+        self.volume_size_entry.grid(row=9, column=0, padx=(15, 0), pady=(15, 0), sticky='nw')
+        self.files_selection_button.grid(row=10, column=0, padx=(15, 0), pady=(15, 0), sticky='nw')
+
+        self.decryption_radiobutton.grid(row=11, column=0, padx=(15, 0), pady=(35, 0), sticky='nw')
+        self.encrypted_file_path_text.grid(row=12, column=0, padx=(15, 0), pady=(15, 0), sticky='nw')
+        self.encrypted_file_path_entry.grid(row=13, column=0, padx=(15, 0), pady=(15, 0), sticky='nw')
+        self.encrypted_file_path_button.grid(row=14, column=0, padx=(15, 0), pady=(15, 0))
+
+        self.members_pattern_text.grid(row=15, column=0, padx=(15, 0), pady=(15, 0), sticky='nw')
+        self.members_pattern_entry.grid(row=16, column=0, padx=(15, 0), pady=(15, 0), sticky='nw')
+        self.regex_checkbox.grid(row=17, column=0, padx=(15, 0), pady=(15, 0), sticky='nw')
+
+        self.saving_file_path_text.grid(row=18, column=0, padx=(15, 0), pady=(35, 0))
+        self.saving_file_path_entry.grid(row=19, column=0, padx=(15, 0), pady=(15, 0))
+        self.saving_file_path_button.grid(row=20, column=0, padx=(15, 0), pady=(15, 0))
+
+        self.start_process_button.grid(row=21, column=0, padx=(15, 0), pady=(40, 0))
 
     def update_file_list(self) -> None:
         """
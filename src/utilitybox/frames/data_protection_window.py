@@ -1,11 +1,15 @@
 import os
 import tkinter as tk
+from typing import Iterator
 
 import customtkinter as ctk
 
-from src.utilitybox.auxiliar.file_operations import browse_file
+from src.utilitybox.auxiliar.directory_walker import collect_files
+from src.utilitybox.auxiliar.extension_operations import split_extensions
+from src.utilitybox.auxiliar.file_operations import browse_file, browse_folder
 from src.utilitybox.auxiliar.log_functions import update_file_log
-from src.utilitybox.auxiliar.operations_messages import log_encryption_result, log_decryption_result
+from src.utilitybox.auxiliar.operations_messages import (log_encryption_result, log_decryption_result,
+                                                         log_verification_result)
 from src.utilitybox.auxiliar.log_messages import path_invalid_message, update_display_log
 from src.utilitybox.auxiliar.project_paths import get_project_icons_path
 from src.utilitybox.functionalities.decryption import Decryption
@@ -16,18 +20,94 @@ File encryption Params (used for radio buttons).
 """
 ENCRYPTION_OPTION = 1
 DECRYPTION_OPTION = 2
+VERIFICATION_OPTION = 3
 
+"""
+Batch progress Params (number of progress updates displayed for a batch of files).
+"""
+PROGRESS_UPDATES = 100
+
+
+def _collect_batch_results(mainbox, batch_results: Iterator[tuple[str, str | None]], files_count: int,
+                           progress_message: str) -> tuple[dict[str, str], list[str]]:
+    """
+    Collects the results of a batch of files, displaying the progress of the batch.
+
+    Params:
+        mainbox (MainBox): An instance of the MainBox class.
+        batch_results (Iterator[tuple[str, str | None]]): The path of every processed file and the path
+            of its key (None if the file could not be processed).
+        files_count (int): The number of files of the batch.
+        progress_message (str): The message displayed with the number of processed files.
+
+    Returns:
+        tuple[dict[str, str], list[str]]: The processed files with their key paths and the files that
+            could not be processed.
+    """
+    file_key_pair, failed_files = {}, []
+    progress_step = max(1, files_count // PROGRESS_UPDATES)
+    for processed_files, (file_path, key_path) in enumerate(batch_results, 1):
+        if key_path:
+            file_key_pair[file_path] = key_path
+        else:
+            failed_files.append(file_path)
+        if processed_files % progress_step == 0 or processed_files == files_count:
+            mainbox.update_progress(f'{progress_message}: {processed_files}/{files_count}',
+                                    processed_files / files_count)
+
+    return file_key_pair, failed_files
+
+
+def _perform_encryption(mainbox, operation_specific_identifier: str, file_path: str, file_extensions: str = '',
+                        recursive: bool = False, passphrase: str = '') -> None:
+    """
+    Perform the encryption of a file or of the files of a folder.
+
+    Params:
+        mainbox (MainBox): An instance of the MainBox class.
+        operation_specific_identifier (list): A list of operation identifiers for logging.
+        file_path (str): The path of the file (or folder) to be encrypted.
+        file_extensions (str, optional): The extensions of the files of a folder to be encrypted, separated
+            by commas. All the files are encrypted if not specified.
+        recursive (bool, optional): Encrypt the files of the subfolders as well.
+        passphrase (str, optional): The passphrase the keys are derived from (random keys are stored if empty).
+    """
+    operation_code = {'OK': 200, 'NO CONTENT': 204, 'BAD REQUEST': 404}
+
+    operation_id = operation_code['BAD REQUEST']
+    if not os.path.exists(file_path):
+        log_message = path_invalid_message(operation_specific_identifier, operation_id, file_path)
+        update_file_log(log_message, operation_specific_identifier)
+        update_display_log(mainbox, operation_specific_identifier, operation_id)
+        return
+
+    try:
+        file_paths = list(collect_files(file_path, split_extensions(file_extensions), recursive))
+        batch_results = Encryption.encrypt_files(file_paths, passphrase=passphrase)
+        file_key_pair, failed_files = _collect_batch_results(mainbox, batch_results, len(file_paths), 'Encrypted files')
+
+        operation_id = operation_code['OK'] if file_key_pair else operation_code['NO CONTENT']
+        update_display_log(mainbox, operation_specific_identifier, operation_id)
+        log_encryption_result(operation_specific_identifier, operation_id, file_key_pair, failed_files)
+    except Exception as e:
+        print(e)
 
-def _perform_encryption(mainbox, operation_specific_identifier: str, file_path: str) -> None:
+
+def _perform_decryption(mainbox, operation_specific_identifier: str, file_path: str, file_extensions: str = '',
+                        recursive: bool = False, passphrase: str = '') -> None:
     """
-    Perform file encryption.
+    Perform the decryption of a file or of the files of a folder.
 
     Params:
         mainbox (MainBox): An instance of the MainBox class.
         operation_specific_identifier (list): A list of operation identifiers for logging.
-        file_path (str): The path of the file to be encrypted.
+        file_path (str): The path of the file (or folder) to be decrypted.
+        file_extensions (str, optional): The extensions of the files of a folder to be decrypted, separated
+            by commas. All the files are decrypted if not specified.
+        recursive (bool, optional): Decrypt the files of the subfolders as well.
+        passphrase (str, optional): The passphrase the keys of the files encrypted with a passphrase are derived from.
     """
-    operation_code = {'OK': 200, 'BAD REQUEST': 404}
+    operation_code = {'OK': 200, 'NO CONTENT': 204, 'BAD REQUEST': 404}
 
     operation_id = operation_code['BAD REQUEST']
     if not os.path.exists(file_path):
@@ -36,29 +116,34 @@ def _perform_encryption(mainbox, operation_specific_identifier: str, file_path:
         update_display_log(mainbox, operation_specific_identifier, operation_id)
         return
 
-    operation_id = operation_code['OK']
     try:
-        encryption = Encryption(file_path)
-        encryption.generate_key()
-        key = encryption.load_key()
-        encryption.encrypt_file(key)
+        file_paths = list(collect_files(file_path, split_extensions(file_extensions), recursive))
+        batch_results = Decryption.decrypt_files(file_paths, passphrase=passphrase)
+        file_key_pair, failed_files = _collect_batch_results(mainbox, batch_results, len(file_paths), 'Decrypted files')
 
+        operation_id = operation_code['OK'] if file_key_pair else operation_code['NO CONTENT']
         update_display_log(mainbox, operation_specific_identifier, operation_id)
-        log_encryption_result(operation_specific_identifier, operation_id, encryption.file_key_pair)
+        log_decryption_result(operation_specific_identifier, operation_id, file_key_pair, failed_files)
     except Exception as e:
         print(e)
 
 
-def _perform_decryption(mainbox, operation_specific_identifier: str, file_path: str) -> None:
+def _perform_verification(mainbox, operation_specific_identifier: str, file_path: str, file_extensions: str = '',
+                          recursive: bool = False, passphrase: str = '') -> None:
     """
-    Perform file decryption.
+    Perform the verification of a file or of the files of a folder against their keys, without
+    modifying the files or the keys.
 
     Params:
         mainbox (MainBox): An instance of the MainBox class.
         operation_specific_identifier (list): A list of operation identifiers for logging.
-        file_path (str): The path of the file to be encrypted.
+        file_path (str): The path of the file (or folder) to be verified.
+        file_extensions (str, optional): The extensions of the files of a folder to be verified, separated
+            by commas. All the files are verified if not specified.
+        recursive (bool, optional): Verify the files of the subfolders as well.
+        passphrase (str, optional): The passphrase the keys of the files encrypted with a passphrase are derived from.
     """
-    operation_code = {'OK': 200, 'BAD REQUEST': 404}
+    operation_code = {'OK': 200, 'NO CONTENT': 204, 'BAD REQUEST': 404}
 
     operation_id = operation_code['BAD REQUEST']
     if not os.path.exists(file_path):
@@ -67,33 +152,43 @@ def _perform_decryption(mainbox, operation_specific_identifier: str, file_path:
         update_display_log(mainbox, operation_specific_identifier, operation_id)
         return
 
-    operation_id = operation_code['OK']
     try:
-        decryption = Decryption(file_path)
-        key = decryption.load_key()
-        decryption.decrypt_file(key)
+        file_paths = list(collect_files(file_path, split_extensions(file_extensions), recursive))
+        batch_results = Decryption.verify_files(file_paths, passphrase=passphrase)
+        file_key_pair, failed_files = _collect_batch_results(mainbox, batch_results, len(file_paths), 'Verified files')
 
+        operation_id = operation_code['OK'] if file_key_pair else operation_code['NO CONTENT']
         update_display_log(mainbox, operation_specific_identifier, operation_id)
-        log_decryption_result(operation_specific_identifier, operation_id, decryption.file_key_pair)
+        log_verification_result(operation_specific_identifier, operation_id, file_key_pair, failed_files)
     except Exception as e:
         print(e)
 
 
 def _determine_operation_type(mainbox, operation_specific_identifier: list[str], radio_option: int,
-                              file_path: str) -> None:
+                              file_path: str, file_extensions: str = '', recursive: bool = False,
+                              passphrase: str = '') -> None:
     """
     Start the encryption or decryption process based on the user selection.
 
     Params:
         mainbox (MainBox): An instance of the MainBox class.
         operation_specific_identifier (str): The operation identifier that specifies the type of operation(s).
-        radio_option (int): An integer representing the selected option (1 for Encryption, 2 for Decryption).
-        file_path (str): The path of the file to be processed.
+        radio_option (int): An integer representing the selected option (1 for Encryption, 2 for Decryption,
+            3 for Verification).
+        file_path (str): The path of the file (or folder) to be processed.
+        file_extensions (str, optional): The extensions of the files of a folder to be processed, separated by commas.
+        recursive (bool, optional): Process the files of the subfolders as well.
+        passphrase (str, optional): The passphrase the keys are derived from (random keys are stored if empty).
     """
     if radio_option == ENCRYPTION_OPTION:
-        _perform_encryption(mainbox, operation_specific_identifier[0], file_path)
+        _perform_encryption(mainbox, operation_specific_identifier[0], file_path, file_extensions, recursive,
+                            passphrase)
     elif radio_option == DECRYPTION_OPTION:
-        _perform_decryption(mainbox, operation_specific_identifier[1], file_path)
+        _perform_decryption(mainbox, operation_specific_identifier[1], file_path, file_extensions, recursive,
+                            passphrase)
+    elif radio_option == VERIFICATION_OPTION:
+        _perform_verification(mainbox, operation_specific_identifier[2], file_path, file_extensions, recursive,
+                              passphrase)
 
 
 class DataProtectionWindow(ctk.CTkToplevel):
@@ -116,10 +211,10 @@ class DataProtectionWindow(ctk.CTkToplevel):
         """
         super().__init__()
         self.title(' Data protection')
-        self.geometry('254x354')
+        self.geometry('254x690')
         self.resizable(False, False)
         self.configure(bg='#222629')
-        self.operation_specific_identifier = ['Encryption', 'Decryption']
+        self.operation_specific_identifier = ['Encryption', 'Decryption', 'Verification']
         self.radio_current_option = 0
         self.after(250, lambda: self.iconbitmap(
             (os.path.join(get_project_icons_path(), 'DataProtection.ico'))))
@@ -141,24 +236,50 @@ class DataProtectionWindow(ctk.CTkToplevel):
             master=self, text='Decryption',
             command=radiobutton_event, variable=radio_var, value=2)
 
-        self.file_path_text = ctk.CTkLabel(master=self, text='Enter the file path: ')
+        # Verification
+        self.verification_radiobutton = ctk.CTkRadioButton(
+            master=self, text='Verification',
+            command=radiobutton_event, variable=radio_var, value=3)
+
+        self.file_path_text = ctk.CTkLabel(master=self, text='Enter the file or folder path: ')
         self.file_path_entry = ctk.CTkEntry(master=self, width=220)
         self.file_path_button = ctk.CTkButton(
             master=self, text='Browse file', font=('Helvetica', 12, 'bold'), fg_color='#00539C', text_color='white',
             command=lambda: browse_file(self.file_path_entry))
+        self.folder_path_button = ctk.CTkButton(
+            master=self, text='Browse folder', font=('Helvetica', 12, 'bold'), fg_color='#00539C', text_color='white',
+            command=lambda: browse_folder(self.file_path_entry))
+
+        # Folder options
+        self.file_extensions_text = ctk.CTkLabel(master=self, text='Folder files extensions (optional): ')
+        self.file_extensions_entry = ctk.CTkEntry(master=self, width=220)
+        self.recursive_checkbox = ctk.CTkCheckBox(master=self, text='Include subfolders')
+
+        # Passphrase (keys are derived from it instead of being stored)
+        self.passphrase_text = ctk.CTkLabel(master=self, text='Passphrase (optional): ')
+        self.passphrase_entry = ctk.CTkEntry(master=self, width=220, show='*')
 
         # Action button
         self.start_process_button = ctk.CTkButton(
             master=self, text='Start process', font=('Helvetica', 12, 'bold'), fg_color='green', text_color='white',
-            command=lambda: _determine_operation_type(mainbox, self.operation_specific_identifier,
-                                                      self.radio_current_option,
-                                                      self.file_path_entry.get()))
+            command=lambda: mainbox.job_executor.submit(_determine_operation_type, self.operation_specific_identifier,
+                                                        self.radio_current_option, self.file_path_entry.get(),
+                                                        self.file_extensions_entry.get(),
+                                                        bool(self.recursive_checkbox.get()),
+                                                        self.passphrase_entry.get()))
 
         # Widgets placement
         self.encryption_radiobutton.grid(row=1, column=0, padx=(16, 0), pady=(15, 0), sticky='nw')
         self.decryption_radiobutton.grid(row=2, column=0, padx=(16, 0), pady=(20, 0), sticky='nw')
-        self.file_path_text.grid(row=3, column=0, padx=(16, 0), pady=(35, 0))
-        self.file_path_entry.grid(row=4, column=0, padx=(16, 0), pady=(35, 0))
-        self.file_path_button.grid(row=5, column=0, padx=(16, 0), pady=(35, 0))
+        self.verification_radiobutton.grid(row=3, column=0, padx=(16, 0), pady=(20, 0), sticky='nw')
+        self.file_path_text.grid(row=4, column=0, padx=(16, 0), pady=(35, 0))
+        self.file_path_entry.grid(row=5, column=0, padx=(16, 0), pady=(35, 0))
+        self.file_path_button.grid(row=6, column=0, padx=(16, 0), pady=(35, 0))
+        self.folder_path_button.grid(row=7, column=0, padx=(16, 0), pady=(15, 0))
+        self.file_extensions_text.grid(row=8, column=0, padx=(16, 0), pady=(25, 0))
+        self.file_extensions_entry.grid(row=9, column=0, padx=(16, 0), pady=(10, 0))
+        self.recursive_checkbox.grid(row=10, column=0, padx=(16, 0), pady=(20, 0), sticky='nw')
+        self.passphrase_text.grid(row=11, column=0, padx=(16, 0), pady=(25, 0))
+        self.passphrase_entry.grid(row=12, column=0, padx=(16, 0), pady=(10, 0))
 
-        self.start_process_button.grid(row=6, column=0, padx=(16, 0), pady=(40, 0))
+        self.start_process_button.grid(row=13, column=0, padx=(16, 0), pady=(40, 0))
@@ -3,13 +3,13 @@ import tkinter as tk
 
 import customtkinter as ctk
 
-from src.utilitybox.auxiliar.extension_operations import group_files_by_extensions
 from src.utilitybox.auxiliar.file_operations import browse_folder
 from src.utilitybox.auxiliar.log_functions import update_file_log
-from src.utilitybox.auxiliar.operations_messages import log_basic_operation_results
+from src.utilitybox.auxiliar.operations_messages import log_streamed_operation_results
 from src.utilitybox.auxiliar.log_messages import path_invalid_message, update_display_log
 from src.utilitybox.auxiliar.project_paths import get_project_icons_path
 from src.utilitybox.functionalities.delete import Delete
+from src.utilitybox.functionalities.duplicates import Duplicates
 
 """
 File deletion Params (used for radio buttons).
@@ -17,6 +17,7 @@ File deletion Params (used for radio buttons).
 DELETE_SINGLE_EXTENSION = 1
 DELETE_MULTIPLE_EXTENSIONS = 2
 DELETE_BY_KEYWORD = 3
+DELETE_DUPLICATES = 4
 
 
 def _perform_deletion(mainbox, operation_specific_identifier: str, radio_option: int,
@@ -28,7 +29,7 @@ def _perform_deletion(mainbox, operation_specific_identifier: str, radio_option:
     Params:
         mainbox (MainBox): An instance of the MainBox class (parent).
         operation_specific_identifier (str): The identifier for the deletion operation.
-        radio_option (int): The selected radio button option for deletion (1, 2, or 3).
+        radio_option (int): The selected radio button option for deletion (1, 2, 3 or 4).
         folder_path (str): The file path where the deletion takes place.
         file_extension (str): The extension of the file to delete (for single extension deletion).
         list_of_file_extensions (str): A comma-separated list of extensions (for multiple extensions deletion).
@@ -47,26 +48,26 @@ def _perform_deletion(mainbox, operation_specific_identifier: str, radio_option:
 
     delete = Delete(folder_path)
 
+    results_id = operation_code['NO CONTENT']
     try:
         if radio_option == DELETE_SINGLE_EXTENSION:
-            delete.delete_by_single_extension(file_extension_lower)
+            files_deleted = delete.delete_by_single_extension(file_extension_lower)
         elif radio_option == DELETE_MULTIPLE_EXTENSIONS:
-            delete.delete_by_multiple_extensions(list_of_file_extensions)
+            files_deleted = delete.delete_by_multiple_extensions(list_of_file_extensions)
         elif radio_option == DELETE_BY_KEYWORD:
-            delete.delete_by_keyword(keyword, keyword_extension)
+            files_deleted = delete.delete_by_keyword(keyword, keyword_extension)
+        elif radio_option == DELETE_DUPLICATES:
+            # Keeps the oldest copy of every group of duplicates located in the folder tree
+            duplicate_groups = Duplicates(folder_path).find_duplicates()
+            files_deleted = delete.delete_files(Duplicates.redundant_files(duplicate_groups))
+        else:
+            files_deleted = []
+        results_id = log_streamed_operation_results(operation_specific_identifier, files_deleted)
     except Exception as e:
         print(e)
 
-    results_id = operation_code['OK']
-    if not delete.files_deleted:
-        results_id = operation_code['NO CONTENT']
-
     update_display_log(mainbox, operation_specific_identifier, results_id)
 
-    grouped_files = group_files_by_extensions(delete.files_deleted)
-
-    log_basic_operation_results(operation_specific_identifier, results_id, grouped_files)
-
 
 class DeleteWindow(ctk.CTkToplevel):
     """
@@ -88,7 +89,7 @@ class DeleteWindow(ctk.CTkToplevel):
         """
         super().__init__()
         self.title(' Delete')
-        self.geometry('252x695')
+        self.geometry('252x735')
         self.resizable(False, False)
         self.configure(bg='#222629')
         self.operation_specific_identifier = 'Delete'
@@ -149,14 +150,20 @@ class DeleteWindow(ctk.CTkToplevel):
         self.delete_by_keyword_extension_text = ctk.CTkLabel(master=self, text='Enter the extension: ')
         self.delete_by_keyword_extension_entry = ctk.CTkEntry(master=self, width=220)
 
+        # Duplicates deleting
+        self.delete_duplicates_button = ctk.CTkRadioButton(
+            master=self, text='Delete duplicates (subfolders included)',
+            command=radiobutton_event, variable=radio_var, value=4)
+
         # Action buttons
         self.start_deleting_button = ctk.CTkButton(
             master=self, text='Start deleting', font=('Helvetica', 12, 'bold'), fg_color='green', text_color='white',
-            command=lambda: _perform_deletion(mainbox, self.operation_specific_identifier, self.radio_current_option,
-                                              self.folder_path_entry.get(), self.dropdown_current_option,
-                                              self.delete_by_multiple_extension_entry.get(),
-                                              self.delete_by_keyword_entry.get(),
-                                              self.delete_by_keyword_extension_entry.get()))
+            command=lambda: mainbox.job_executor.submit(_perform_deletion, self.operation_specific_identifier,
+                                                        self.radio_current_option, self.folder_path_entry.get(),
+                                                        self.dropdown_current_option,
+                                                        self.delete_by_multiple_extension_entry.get(),
+                                                        self.delete_by_keyword_entry.get(),
+                                                        self.delete_by_keyword_extension_entry.get()))
 
         # Widgets placement
         self.folder_path_text.grid(row=0, column=0, padx=(15, 0), pady=(15, 0))
@@ -176,4 +183,6 @@ class DeleteWindow(ctk.CTkToplevel):
         self.delete_by_keyword_extension_text.grid(row=11, column=0, padx=(20, 0), pady=(15, 0), sticky='nw')
         self.delete_by_keyword_extension_entry.grid(row=12, column=0, padx=(15, 0), pady=(15, 0))
 
-        self.start_deleting_button.grid(row=13, column=0, padx=(15, 0), pady=(40, 0))
+        self.delete_duplicates_button.grid(row=13, column=0, padx=(15, 0), pady=(35, 0), sticky='nw')
+
+        self.start_deleting_button.grid(row=14, column=0, padx=(15, 0), pady=(40, 0))
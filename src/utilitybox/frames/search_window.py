@@ -2,17 +2,18 @@ import os
 
 import customtkinter as ctk
 
-from src.utilitybox.auxiliar.extension_operations import group_files_by_extensions
 from src.utilitybox.auxiliar.file_operations import browse_folder
 from src.utilitybox.auxiliar.log_functions import update_file_log
-from src.utilitybox.auxiliar.operations_messages import log_basic_operation_results
+from src.utilitybox.auxiliar.operations_messages import log_content_search_results, log_streamed_operation_results
 from src.utilitybox.auxiliar.log_messages import path_invalid_message, update_display_log
 from src.utilitybox.auxiliar.project_paths import get_project_icons_path
 from src.utilitybox.functionalities.search import Search
 
 
 def _perform_search(mainbox, operation_specific_identifier: str, folder_path: str, file_name: str,
-                    file_extension: str = '') -> None:
+                    file_extension: str = '', recursive: bool = False, max_depth: str = '',
+                    exclude_patterns: str = '', use_index: bool = False, content_text: str = '',
+                    content_is_regex: bool = False) -> None:
     """
     Perform file search based on different criteria based on provided Params and ask the log function
     to write the results in a text file.
@@ -23,6 +24,12 @@ def _perform_search(mainbox, operation_specific_identifier: str, folder_path: st
         folder_path (str): The file path where the search takes place.
         file_name (str): The name of the file.
         file_extension (str): The extension of the file/files (optional).
+        recursive (bool): Search the subfolders as well (optional).
+        max_depth (str): The maximum depth of the searched subfolders (optional, no limit if empty).
+        exclude_patterns (str): Comma-separated patterns of file and folder names to skip (optional).
+        use_index (bool): Answer the search from the persistent file index (optional).
+        content_text (str): A text to find inside the files instead of matching their names (optional).
+        content_is_regex (bool): Treat the content text as a regular expression (optional).
     """
     file_extension_lower = file_extension.lower()
     operation_code = {'OK': 200, 'NO CONTENT': 204, 'BAD REQUEST': 404}
@@ -34,26 +41,26 @@ def _perform_search(mainbox, operation_specific_identifier: str, folder_path: st
         update_display_log(mainbox, operation_specific_identifier, results_id)
         return
 
-    search = Search(folder_path)
+    search_max_depth = int(max_depth) if max_depth.strip().isdigit() else None
+    search_exclude_patterns = [pattern.strip() for pattern in exclude_patterns.split(',') if pattern.strip()]
+    search = Search(folder_path, recursive, search_max_depth, search_exclude_patterns, use_index)
 
+    results_id = operation_code['NO CONTENT']
     try:
-        if not file_name:
-            search.search_by_extension(file_extension_lower)
+        if content_text:
+            matches = search.search_by_content(content_text, content_is_regex, file_extension_lower)
+            results_id = log_content_search_results(operation_specific_identifier, matches)
+        elif not file_name:
+            files_found = search.search_by_extension(file_extension_lower)
+            results_id = log_streamed_operation_results(operation_specific_identifier, files_found)
         else:
-            search.search_by_name(file_name, file_extension_lower)
+            files_found = search.search_by_name(file_name, file_extension_lower)
+            results_id = log_streamed_operation_results(operation_specific_identifier, files_found)
     except Exception as e:
         print(e)
 
-    results_id = operation_code['OK']
-    if not search.files_found:
-        results_id = operation_code['NO CONTENT']
-
     update_display_log(mainbox, operation_specific_identifier, results_id)
 
-    grouped_files = group_files_by_extensions(search.files_found)
-
-    log_basic_operation_results(operation_specific_identifier, results_id, grouped_files)
-
 
 class SearchWindow(ctk.CTkToplevel):
     """
@@ -75,7 +82,7 @@ class SearchWindow(ctk.CTkToplevel):
         """
         super().__init__()
         self.title(' Search')
-        self.geometry('252x385')
+        self.geometry('252x850')
         self.resizable(False, False)
         self.configure(bg='#222629')
         self.operation_specific_identifier = 'Search'
@@ -96,12 +103,28 @@ class SearchWindow(ctk.CTkToplevel):
         self.file_ext_text = ctk.CTkLabel(master=self, text='Enter the file extension (optional): ')
         self.file_ext_entry = ctk.CTkEntry(master=self, width=220)
 
+        # File content information
+        self.content_text = ctk.CTkLabel(master=self, text='Enter the text inside the files (optional): ')
+        self.content_entry = ctk.CTkEntry(master=self, width=220)
+        self.content_regex_checkbox = ctk.CTkCheckBox(master=self, text='Regular expression')
+
+        # Subfolders information
+        self.recursive_checkbox = ctk.CTkCheckBox(master=self, text='Include subfolders')
+        self.use_index_checkbox = ctk.CTkCheckBox(master=self, text='Use the file index')
+        self.max_depth_text = ctk.CTkLabel(master=self, text='Enter the maximum depth (optional): ')
+        self.max_depth_entry = ctk.CTkEntry(master=self, width=220)
+        self.exclude_text = ctk.CTkLabel(master=self, text='Enter the names to exclude (optional): ')
+        self.exclude_entry = ctk.CTkEntry(master=self, width=220, placeholder_text='.git, *.tmp')
+
         # Action buttons
         self.start_searching_button = ctk.CTkButton(
             master=self, text='Start searching', font=('Helvetica', 12, 'bold'), fg_color='green', text_color='white',
-            command=lambda: _perform_search(mainbox, self.operation_specific_identifier,
-                                            self.file_path_entry.get(), self.file_name_entry.get(),
-                                            self.file_ext_entry.get()))
+            command=lambda: mainbox.job_executor.submit(_perform_search, self.operation_specific_identifier,
+                                                        self.file_path_entry.get(), self.file_name_entry.get(),
+                                                        self.file_ext_entry.get(), bool(self.recursive_checkbox.get()),
+                                                        self.max_depth_entry.get(), self.exclude_entry.get(),
+                                                        bool(self.use_index_checkbox.get()), self.content_entry.get(),
+                                                        bool(self.content_regex_checkbox.get())))
 
         # Widgets placement
         self.file_path_text.grid(row=0, column=0, padx=(15, 0), pady=(15, 0))
@@ -112,4 +135,15 @@ class SearchWindow(ctk.CTkToplevel):
         self.file_ext_text.grid(row=5, column=0, padx=(15, 0), pady=(15, 0))
         self.file_ext_entry.grid(row=6, column=0, padx=(15, 0), pady=(15, 0))
 
-        self.start_searching_button.grid(row=7, column=0, padx=(15, 0), pady=(40, 0))
+        self.content_text.grid(row=7, column=0, padx=(15, 0), pady=(15, 0))
+        self.content_entry.grid(row=8, column=0, padx=(15, 0), pady=(15, 0))
+        self.content_regex_checkbox.grid(row=9, column=0, padx=(15, 0), pady=(15, 0), sticky='nw')
+
+        self.recursive_checkbox.grid(row=10, column=0, padx=(15, 0), pady=(25, 0), sticky='nw')
+        self.use_index_checkbox.grid(row=11, column=0, padx=(15, 0), pady=(15, 0), sticky='nw')
+        self.max_depth_text.grid(row=12, column=0, padx=(15, 0), pady=(15, 0))
+        self.max_depth_entry.grid(row=13, column=0, padx=(15, 0), pady=(15, 0))
+        self.exclude_text.grid(row=14, column=0, padx=(15, 0), pady=(15, 0))
+        self.exclude_entry.grid(row=15, column=0, padx=(15, 0), pady=(15, 0))
+
+        self.start_searching_button.grid(row=16, column=0, padx=(15, 0), pady=(40, 0))
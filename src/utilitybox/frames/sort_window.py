@@ -3,10 +3,9 @@ import tkinter as tk
 
 import customtkinter as ctk
 
-from src.utilitybox.auxiliar.extension_operations import group_files_by_extensions
 from src.utilitybox.auxiliar.file_operations import browse_folder
 from src.utilitybox.auxiliar.log_functions import update_file_log
-from src.utilitybox.auxiliar.operations_messages import log_basic_operation_results
+from src.utilitybox.auxiliar.operations_messages import log_streamed_operation_results
 from src.utilitybox.auxiliar.log_messages import path_invalid_message, update_display_log
 from src.utilitybox.auxiliar.project_paths import get_project_icons_path
 from src.utilitybox.functionalities.sort import Sort
@@ -51,26 +50,20 @@ def _perform_sort(mainbox, operation_specific_identifier: str, radio_option: int
 
     sort = Sort(folder_path)
 
+    results_id = operation_code['NO CONTENT']
     try:
         if radio_option == SORT_SINGLE_EXTENSION:
-            sort.index_single_extension(file_extension_lower)
+            files_moved = sort.index_single_extension(file_extension_lower)
         elif radio_option == SORT_MULTIPLE_EXTENSIONS:
-            sort.index_multiple_extensions(list_of_file_extensions)
+            files_moved = sort.index_multiple_extensions(list_of_file_extensions)
         else:
-            sort.sort_and_index_by_keyword(keyword, keyword_extension, new_name)
+            files_moved = sort.sort_and_index_by_keyword(keyword, keyword_extension, new_name)
+        results_id = log_streamed_operation_results(operation_specific_identifier, files_moved)
     except Exception as e:
         print(e)
 
-    results_id = operation_code['OK']
-    if not sort.files_moved:
-        results_id = operation_code['NO CONTENT']
-
     update_display_log(mainbox, operation_specific_identifier, results_id)
 
-    grouped_files = group_files_by_extensions(sort.files_moved)
-
-    log_basic_operation_results(operation_specific_identifier, results_id, grouped_files)
-
 
 class SortWindow(ctk.CTkToplevel):
     """
@@ -157,11 +150,13 @@ class SortWindow(ctk.CTkToplevel):
         # Action buttons
         self.start_sorting_button = ctk.CTkButton(
             master=self, text='Start sorting', font=('Helvetica', 12, 'bold'), fg_color='green', text_color='white',
-            command=lambda: _perform_sort(mainbox, self.operation_unique_identifier, self.radio_current_option,
-                                          self.folder_path_entry.get(), self.dropdown_current_option,
-                                          self.sort_by_multiple_extension_entry.get(), self.sort_by_keyword_entry.get(),
-                                          self.sort_by_keyword_extension_entry.get(),
-                                          self.sort_by_keyword_new_name_entry.get()))
+            command=lambda: mainbox.job_executor.submit(_perform_sort, self.operation_unique_identifier,
+                                                        self.radio_current_option, self.folder_path_entry.get(),
+                                                        self.dropdown_current_option,
+                                                        self.sort_by_multiple_extension_entry.get(),
+                                                        self.sort_by_keyword_entry.get(),
+                                                        self.sort_by_keyword_extension_entry.get(),
+                                                        self.sort_by_keyword_new_name_entry.get()))
 
         # Widgets placement
         self.folder_path_text.grid(row=0, column=0, padx=(15, 0), pady=(15, 0))
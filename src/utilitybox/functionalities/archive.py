@@ -1,10 +1,39 @@
+import contextlib
+import copy
+import fnmatch
 import os
+import re
 import shutil
+import subprocess
+import tarfile
 import zipfile
+from datetime import datetime
+from typing import Callable, Iterator
 
 import patoolib
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from src.utilitybox.auxiliar.archive_manifest import read_manifest, replay_manifests, write_manifest
+from src.utilitybox.auxiliar.chunk_store import ChunkStore
+from src.utilitybox.auxiliar.parallel_zip import extract_parallel_zip, write_parallel_zip
 from src.utilitybox.auxiliar.project_paths import get_system_path
+from src.utilitybox.auxiliar.split_volumes import SplitVolumeWriter, base_archive_path, open_archive_file
+from src.utilitybox.functionalities.duplicates import full_file_hash
+
+"""
+Tar archives Params (supported formats with their extensions and default compression levels).
+"""
+TAR_FORMATS = {'tar.gz': ('.tar.gz', '.tgz'), 'tar.xz': ('.tar.xz', '.txz'), 'tar.zst': ('.tar.zst', '.tzst')}
+TAR_DEFAULT_LEVELS = {'tar.gz': 6, 'tar.xz': 6, 'tar.zst': 3}
+
+"""
+Tar extraction Params (the extraction filters only exist since Python 3.11.4).
+"""
+TAR_FILTERS_SUPPORTED = hasattr(tarfile, 'data_filter')
 
 
 class Archive:
@@ -22,55 +51,278 @@ class Archive:
         """
         self.default_path = get_system_path()
 
-    def compress_zip_files(self, archive_name: str, files_list: list[str], destination_path: str = '') -> None:
+    def _resolve_destination(self, destination_path: str) -> str:
+        """
+        Provides the absolute path of the destination folder of an operation.
+
+        The working directory is never changed (it is shared by all the operations running at the same
+        time), so every path given to the archivers is resolved once, when the operation starts.
+
+        Params:
+            destination_path (str): The destination folder (the default path if empty).
+
+        Returns:
+            str: The absolute path of the destination folder.
+        """
+        return os.path.abspath(destination_path or self.default_path)
+
+    @staticmethod
+    def build_arcnames(files_list: list[str], reserved_arcnames: set[str] | None = None) -> dict[str, str]:
+        """
+        Maps the files to be compressed to their names inside the archive, so the archive doesn't contain
+        the folders leading to the files.
+
+        Params:
+            files_list (list[str]): The list of files to be compressed (full path files).
+            reserved_arcnames (set[str] | None, optional): The names already used by other files.
+
+        Returns:
+            dict[str, str]: The name inside the archive of every file (its base name, suffixed with a counter
+                if another file of the list has the same base name).
+        """
+        arcnames = {}
+        used_arcnames = set(reserved_arcnames or ())
+        for file in files_list:
+            file_name, file_extension = os.path.splitext(os.path.basename(file))
+            arcname = file_name + file_extension
+            duplicate_counter = 1
+            while arcname in used_arcnames:
+                arcname = f'{file_name} ({duplicate_counter}){file_extension}'
+                duplicate_counter += 1
+            used_arcnames.add(arcname)
+            arcnames[file] = arcname
+
+        return arcnames
+
+    def compress_zip_files(self, archive_name: str, files_list: list[str], destination_path: str = '',
+                           arcnames: dict[str, str] | None = None, compression: str = 'deflated',
+                           compresslevel: int | None = None, max_workers: int | None = None,
+                           volume_size: int | None = None,
+                           on_volume_finalized: Callable[[str], None] | None = None) -> list[str]:
         """
         Compress a list of files into a ZIP archive.
 
+        The files are streamed directly from their location into the archive, without intermediate copies,
+        and are compressed by a pool of threads (see 'write_parallel_zip').
+
         Params:
             archive_name (str): The name of the ZIP archive.
             files_list (list[str]): The list of files to be compressed (full path files).
             destination_path (str, optional): The destination folder for the archive.
                 Defaults to the default path if not specified.
+            arcnames (dict[str, str] | None, optional): The name inside the archive of every file.
+                Defaults to the mapping provided by 'build_arcnames' if not specified.
+            compression (str, optional): The compression method ('stored', 'deflated' or 'bzip2').
+            compresslevel (int | None, optional): The compression level (1 to 9).
+                Defaults to the default level of the compression method.
+            max_workers (int | None, optional): The number of compressing threads. Defaults to the number of CPUs.
+            volume_size (int | None, optional): The size in bytes of the volumes ('archive.zip.001', ...) the
+                archive is split in. Defaults to a single archive file if not specified.
+            on_volume_finalized (Callable[[str], None] | None, optional): The function called with the path of
+                every volume as soon as it is complete.
+
+        Returns:
+            list[str]: The paths of the files written (the volumes of a split archive).
         """
-        if not destination_path:
-            destination_path = self.default_path
-        os.chdir(os.path.join(destination_path, 'archives'))
-        with zipfile.ZipFile(archive_name + '.zip', 'w') as zipf:
-            for file in files_list:
-                zipf.write(file, arcname=os.path.basename(file))
-        os.chdir(self.default_path)
+        destination_path = self._resolve_destination(destination_path)
+        if arcnames is None:
+            arcnames = self.build_arcnames(files_list)
+        return write_parallel_zip(os.path.join(destination_path, archive_name + '.zip'),
+                                  [(file, arcnames[file]) for file in files_list],
+                                  compression, compresslevel, max_workers, volume_size, on_volume_finalized)
 
-    def decompress_zip_files(self, archive_file_path: str, destination_path: str = '') -> None:
+    def decompress_zip_files(self, archive_file_path: str, destination_path: str = '',
+                             max_workers: int | None = None) -> None:
         """
         Decompress a ZIP archive.
 
+        The members are extracted by a pool of threads (see 'extract_parallel_zip').
+
         Params:
             archive_file_path (str): The path of the ZIP archive.
             destination_path (str, optional): The destination folder for the content of the archive.
                 Defaults to the default path if none is specified.
+            max_workers (int | None, optional): The number of extracting threads. Defaults to the number of CPUs.
+        """
+        destination_path = self._resolve_destination(destination_path)
+        extract_parallel_zip(archive_file_path, destination_path, max_workers=max_workers)
+
+    def compress_incremental_zip(self, archive_name: str, files_list: list[str], destination_path: str = '',
+                                 previous_archive_path: str = '', compression: str = 'deflated',
+                                 compresslevel: int | None = None) -> tuple[list[str], list[str]]:
+        """
+        Compress into a ZIP archive only the files that changed since the previous archive of a chain.
+
+        The state of the files at the time of the previous archive is rebuilt from the manifests of its chain.
+        A file whose size and modification time didn't change is skipped without being read, a file whose
+        modification time only changed is hashed and skipped if its content is the same. The files of the
+        previous state missing from the list are recorded as deleted (tombstones). The manifest of the new
+        archive links it to the previous archive.
+
+        Params:
+            archive_name (str): The name of the ZIP archive.
+            files_list (list[str]): The list of files to be archived (full path files).
+            destination_path (str, optional): The destination folder for the archive.
+                Defaults to the default path if not specified.
+            previous_archive_path (str, optional): The previous archive of the chain.
+                Defaults to starting a new chain (all the files are compressed) if not specified.
+            compression (str, optional): The compression method ('stored', 'deflated' or 'bzip2').
+            compresslevel (int | None, optional): The compression level (1 to 9).
+
+        Returns:
+            tuple[list[str], list[str]]: The source paths of the files compressed and of the files deleted.
+        """
+        destination_path = self._resolve_destination(destination_path)
+        archive_file_path = os.path.join(destination_path, archive_name + '.zip')
+        if previous_archive_path and os.path.abspath(previous_archive_path) == archive_file_path:
+            raise ValueError('An incremental archive can\'t replace the previous archive of its chain.')
+        previous_state = replay_manifests(previous_archive_path) if previous_archive_path else {}
+
+        current_files = {}
+        for file in files_list:
+            file_path = os.path.abspath(file)
+            file_stat = os.stat(file_path)
+            current_files[file_path] = {'size': file_stat.st_size, 'mtime_ns': file_stat.st_mtime_ns}
+        deleted_files = sorted(set(previous_state) - set(current_files))
+
+        manifest_files = {}
+        new_files = []
+        for file_path, entry in current_files.items():
+            previous_entry = previous_state.get(file_path)
+            if previous_entry and (previous_entry['size'], previous_entry['mtime_ns']) == (entry['size'],
+                                                                                         entry['mtime_ns']):
+                continue
+            entry['hash'] = full_file_hash(file_path)
+            if entry['hash'] is None:
+                raise OSError(f'{file_path} can\'t be read.')
+            if previous_entry:
+                entry['arcname'] = previous_entry['arcname']
+                entry['stored'] = previous_entry['hash'] != entry['hash']
+            else:
+                entry['stored'] = True
+                new_files.append(file_path)
+            manifest_files[file_path] = entry
+
+        # The new files get names that are not used by the files still present in the chain
+        reserved_arcnames = {entry['arcname'] for file_path, entry in previous_state.items()
+                             if file_path not in deleted_files}
+        for file_path, arcname in self.build_arcnames(new_files, reserved_arcnames).items():
+            manifest_files[file_path]['arcname'] = arcname
+
+        stored_files = [file_path for file_path, entry in manifest_files.items() if entry['stored']]
+        write_parallel_zip(archive_file_path, [(file_path, manifest_files[file_path]['arcname'])
+                                               for file_path in stored_files], compression, compresslevel)
+        write_manifest(archive_file_path, manifest_files, deleted_files, previous_archive_path)
+        return stored_files, deleted_files
+
+    def restore_incremental_zip(self, archive_file_path: str, destination_path: str = '',
+                                is_selected: Callable[[str], bool] | None = None) -> list[str]:
+        """
+        Restores the files as they were when an incremental archive was created.
+
+        The manifests of the chain are replayed to find the latest version of every file that wasn't
+        deleted, and every file is extracted once, from the archive holding that version.
+
+        Params:
+            archive_file_path (str): The path of the last archive of the chain.
+            destination_path (str, optional): The destination folder for the restored files.
+                Defaults to the default path if none is specified.
+            is_selected (Callable[[str], bool] | None, optional): The function selecting the files to restore
+                by their name inside the archive (see 'member_matcher'). Defaults to all the files.
+
+        Returns:
+            list[str]: The names of the restored files.
+        """
+        destination_path = self._resolve_destination(destination_path)
+        arcnames_by_archive = {}
+        for entry in replay_manifests(archive_file_path).values():
+            if is_selected is None or is_selected(entry['arcname']):
+                arcnames_by_archive.setdefault(entry['archive'], []).append(entry['arcname'])
+
+        restored_files = []
+        for chain_archive_path, arcnames in arcnames_by_archive.items():
+            restored_files.extend(extract_parallel_zip(chain_archive_path, destination_path, arcnames))
+        return restored_files
+
+    @staticmethod
+    def is_incremental_archive(archive_file_path: str) -> bool:
+        """
+        Checks whether a ZIP archive was created by 'compress_incremental_zip'.
+
+        Params:
+            archive_file_path (str): The path of the archive.
+
+        Returns:
+            bool: True if the archive contains a manifest, False otherwise.
+        """
+        return read_manifest(archive_file_path) is not None
+
+    def compress_deduplicated(self, store_name: str, files_list: list[str], destination_path: str = '',
+                              snapshot_name: str = '') -> tuple[int, int]:
+        """
+        Archive a list of files as a snapshot of a deduplicating chunk store (see 'ChunkStore').
+
+        Archiving the same files again (e.g. new versions of a project folder) into the same store only
+        stores the chunks of content that changed.
+
+        Params:
+            store_name (str): The name of the store (the index is '<store_name>.ubstore').
+            files_list (list[str]): The list of files to be archived (full path files).
+            destination_path (str, optional): The folder of the store.
+                Defaults to the default path if not specified.
+            snapshot_name (str, optional): The name of the snapshot. Defaults to the current date and time.
+
+        Returns:
+            tuple[int, int]: The number of chunks stored and the number of bytes written.
+        """
+        destination_path = self._resolve_destination(destination_path)
+        snapshot_name = snapshot_name or datetime.now().isoformat(sep=' ', timespec='microseconds')
+        with ChunkStore(os.path.join(destination_path, store_name + '.ubstore')) as store:
+            return store.create_snapshot(snapshot_name, self.build_arcnames(files_list).items())
+
+    def restore_deduplicated(self, store_file_path: str, destination_path: str = '',
+                             snapshot_name: str = '') -> list[str]:
+        """
+        Restore the files of a snapshot of a deduplicating chunk store.
+
+        Params:
+            store_file_path (str): The path of the index of the store ('.ubstore' file).
+            destination_path (str, optional): The destination folder for the restored files.
+                Defaults to the default path if none is specified.
+            snapshot_name (str, optional): The name of the snapshot. Defaults to the latest snapshot.
+
+        Returns:
+            list[str]: The names of the restored files.
         """
-        if not destination_path:
-            destination_path = self.default_path
-        os.chdir(destination_path)
-        with zipfile.ZipFile(archive_file_path, 'r') as zipf:
-            zipf.extractall()
-        os.chdir(self.default_path)
+        destination_path = self._resolve_destination(destination_path)
+        with ChunkStore(store_file_path) as store:
+            return store.restore_snapshot(destination_path, snapshot_name)
 
     def compress_rar_files(self, archive_name: str, files_list: list[str], destination_path: str = '') -> None:
         """
         Compress a list of files into a RAR archive.
 
+        The files are read directly from their location, without intermediate copies, and are stored
+        under their base names ('-ep1' switch of the RAR command line).
+
         Params:
             archive_name (str): The name of the RAR archive.
             files_list (list[str]): The list of files to be compressed (full path files).
             destination_path (str, optional): The destination folder for the archive.
                 Defaults to the default path if not specified.
+
+        Notes:
+            RAR archives can't store files under other names, so the base names of the files must be unique.
         """
-        if not destination_path:
-            destination_path = self.default_path
-        os.chdir(os.path.join(destination_path, 'archives'))
-        patoolib.create_archive(archive_name + '.rar', files_list)
-        os.chdir(self.default_path)
+        destination_path = self._resolve_destination(destination_path)
+        if len({os.path.basename(file) for file in files_list}) != len(files_list):
+            raise ValueError('The files compressed into a RAR archive must have different names.')
+        rar_program = shutil.which('rar')
+        if rar_program is None:
+            raise FileNotFoundError('The RAR program is required for creating RAR archives.')
+        subprocess.run([rar_program, 'a', '-y', '-ep1', '-m5', '--',
+                        os.path.join(destination_path, archive_name + '.rar'), *files_list],
+                       check=True, stdout=subprocess.DEVNULL)
 
     def decompress_rar_files(self, archive_file_path: str, destination_path: str = '') -> None:
         """
@@ -81,67 +333,290 @@ class Archive:
             destination_path (str, optional): The destination folder for the content of the archive.
                 Defaults to the default path if none is specified.
         """
-        if not destination_path:
-            destination_path = self.default_path
-        patoolib.extract_archive(archive_file_path, outdir=destination_path, interactive=False)
-        os.chdir(self.default_path)
+        destination_path = self._resolve_destination(destination_path)
+        patoolib.extract_archive(os.path.abspath(archive_file_path), outdir=destination_path, interactive=False)
 
-    def transfer_to_temporary_folder(self, files_list: list[str], destination_path: str = '') -> None:
+    @staticmethod
+    def tar_format(archive_file_path: str) -> str | None:
         """
-        Creates copies of files in a temporary folder to avoid the creation of a subtree style
-        structure containing all the folders leading to a file.
+        Provides the tar format of an archive based on its extension.
 
         Params:
-            files_list (list[str]): The list of files to be moved.
-            destination_path (str, optional): The destination folder for the files.
+            archive_file_path (str): The path of the archive or of the first volume of a split archive.
+
+        Returns:
+            str | None: The tar format ('tar.gz', 'tar.xz' or 'tar.zst'), or None if the archive isn't a tar archive.
+        """
+        for archive_format, extensions in TAR_FORMATS.items():
+            if base_archive_path(archive_file_path).lower().endswith(extensions):
+                return archive_format
+        return None
+
+    @staticmethod
+    def _require_zstandard() -> None:
+        """
+        Checks that the 'zstandard' package, used for the tar.zst archives, is installed.
+        """
+        if zstandard is None:
+            raise ModuleNotFoundError('The zstandard package is required for tar.zst archives.')
+
+    def compress_tar_files(self, archive_name: str, files_list: list[str], destination_path: str = '',
+                           archive_format: str = 'tar.gz', arcnames: dict[str, str] | None = None,
+                           compresslevel: int | None = None, volume_size: int | None = None,
+                           on_volume_finalized: Callable[[str], None] | None = None) -> list[str]:
+        """
+        Compress a list of files into a compressed tar archive.
+
+        The files are streamed from their location through the compressor, without intermediate copies.
+        The tar.zst archives are compressed by all the CPUs (zstd worker threads).
+
+        Params:
+            archive_name (str): The name of the archive (without extension).
+            files_list (list[str]): The list of files to be compressed (full path files).
+            destination_path (str, optional): The destination folder for the archive.
+                Defaults to the default path if not specified.
+            archive_format (str, optional): The format of the archive ('tar.gz', 'tar.xz' or 'tar.zst').
+            arcnames (dict[str, str] | None, optional): The name inside the archive of every file.
+                Defaults to the mapping provided by 'build_arcnames' if not specified.
+            compresslevel (int | None, optional): The compression level (1 to 9 for gz and xz, 1 to 22 for zst).
+                Defaults to the default level of the format.
+            volume_size (int | None, optional): The size in bytes of the volumes ('archive.tar.gz.001', ...) the
+                archive is split in. Defaults to a single archive file if not specified.
+            on_volume_finalized (Callable[[str], None] | None, optional): The function called with the path of
+                every volume as soon as it is complete.
+
+        Returns:
+            list[str]: The paths of the files written (the volumes of a split archive).
+        """
+        destination_path = self._resolve_destination(destination_path)
+        if arcnames is None:
+            arcnames = self.build_arcnames(files_list)
+        if compresslevel is None:
+            compresslevel = TAR_DEFAULT_LEVELS[archive_format]
+        archive_file_path = os.path.join(destination_path, archive_name + TAR_FORMATS[archive_format][0])
+        if archive_format == 'tar.zst':
+            self._require_zstandard()
+
+        if volume_size:
+            archive_file = SplitVolumeWriter(archive_file_path, volume_size, on_volume_finalized)
+        else:
+            archive_file = open(archive_file_path, 'wb')
+        try:
+            with archive_file:
+                if archive_format == 'tar.zst':
+                    compressor = zstandard.ZstdCompressor(level=compresslevel, threads=-1)
+                    with compressor.stream_writer(archive_file, closefd=False) as compressed_stream, \
+                            tarfile.open(fileobj=compressed_stream, mode='w|') as tar:
+                        for file in files_list:
+                            tar.add(file, arcname=arcnames[file])
+                else:
+                    if archive_format == 'tar.xz':
+                        tar = tarfile.open(fileobj=archive_file, mode='w:xz', preset=compresslevel)
+                    else:
+                        tar = tarfile.open(fileobj=archive_file, mode='w:gz', compresslevel=compresslevel)
+                    with tar:
+                        for file in files_list:
+                            tar.add(file, arcname=arcnames[file])
+        except BaseException:
+            # No partial archive is left, like for the ZIP archives
+            if volume_size:
+                archive_file.remove_volumes()
+            elif os.path.exists(archive_file_path):
+                os.remove(archive_file_path)
+            raise
+        return archive_file.volume_paths if volume_size else [archive_file_path]
+
+    def decompress_tar_files(self, archive_file_path: str, destination_path: str = '') -> None:
+        """
+        Decompress a compressed tar archive (format chosen by extension).
+
+        The archive is read as a stream and every member is checked before being extracted (see
+        '_extract_tar_member'), so members with absolute paths, links outside of the destination or
+        special files are rejected.
+
+        Params:
+            archive_file_path (str): The path of the archive or of the first volume of a split archive.
+            destination_path (str, optional): The destination folder for the content of the archive.
                 Defaults to the default path if none is specified.
         """
-        if not destination_path:
-            destination_path = self.default_path
-        temp_dir = os.path.join(destination_path, 'archives')
-        os.makedirs(temp_dir, exist_ok=True)
-        os.chdir(destination_path)
-        for file in files_list:
-            shutil.copy(file, temp_dir)
-        os.chdir(self.default_path)
+        destination_path = self._resolve_destination(destination_path)
+        with self._open_tar_stream(archive_file_path) as tar:
+            for member in tar:
+                self._extract_tar_member(tar, member, destination_path)
+
+    @staticmethod
+    def _extract_tar_member(tar: tarfile.TarFile, member: tarfile.TarInfo, destination_path: str) -> None:
+        """
+        Extracts a member of a tar archive, refusing the members that could write outside of the destination.
+
+        The 'data' extraction filter is used when available. Without it (before Python 3.11.4) only the files
+        and folders are extracted, after checking that their path stays inside the destination, and the
+        setuid, setgid, sticky and group or others write bits are cleared, like the 'data' filter does.
+
+        Params:
+            tar (tarfile.TarFile): The archive, opened for reading.
+            member (tarfile.TarInfo): The member to extract.
+            destination_path (str): The absolute path of the destination folder.
+        """
+        if TAR_FILTERS_SUPPORTED:
+            tar.extract(member, destination_path, filter='data')
+            return
 
-    def clean_files(self, file_list: list[str], targeted_path: str = '') -> None:
+        real_destination_path = os.path.realpath(destination_path)
+        target_path = os.path.realpath(os.path.join(real_destination_path, member.name))
+        if os.path.isabs(member.name) or \
+                os.path.commonpath([real_destination_path, target_path]) != real_destination_path:
+            raise ValueError(f'{member.name} would be extracted outside of {destination_path}.')
+        if not (member.isfile() or member.isdir()):
+            raise ValueError(f'{member.name} is a link or a special file.')
+        member = copy.copy(member)
+        member.mode = member.mode & 0o755 | (0o700 if member.isdir() else 0o600)
+        tar.extract(member, destination_path)
+
+    @contextlib.contextmanager
+    def _open_tar_stream(self, archive_file_path: str) -> Iterator[tarfile.TarFile]:
         """
-        Clean the files that are present in a folder based on a specified list of files.
+        Opens a compressed tar archive (format chosen by extension) for reading its members in order.
 
         Params:
-            files_list (list[str]): The list of files to be cleaned.
-            targeted_path (str, optional): The folder path where the files are located.
+            archive_file_path (str): The path of the archive or of the first volume of a split archive.
+
+        Returns:
+            Iterator[tarfile.TarFile]: The archive, opened in stream mode.
+        """
+        archive_format = self.tar_format(archive_file_path)
+        if archive_format is None:
+            raise ValueError(f'{archive_file_path} is not a supported tar archive.')
+
+        if archive_format == 'tar.zst':
+            self._require_zstandard()
+            with open_archive_file(archive_file_path) as archive_file, \
+                    zstandard.ZstdDecompressor().stream_reader(archive_file) as decompressed_stream, \
+                    tarfile.open(fileobj=decompressed_stream, mode='r|') as tar:
+                yield tar
+            return
+
+        with open_archive_file(archive_file_path) as archive_file, \
+                tarfile.open(fileobj=archive_file, mode='r|' + archive_format.split('.')[1]) as tar:
+            yield tar
+
+    @staticmethod
+    def _rar_program() -> str:
+        """
+        Provides the program used for reading RAR archives ('unrar', or 'rar' if 'unrar' isn't installed).
+
+        Returns:
+            str: The path of the program.
+        """
+        rar_program = shutil.which('unrar') or shutil.which('rar')
+        if rar_program is None:
+            raise FileNotFoundError('The RAR program is required for reading RAR archives.')
+        return rar_program
+
+    @staticmethod
+    def member_matcher(pattern: str, use_regex: bool = False) -> Callable[[str], bool]:
+        """
+        Provides the function selecting the members of an archive by name.
+
+        Params:
+            pattern (str): A shell-style pattern (e.g. 'logs/*.txt') or a regular expression.
+            use_regex (bool, optional): Flag indicating whether the pattern is a regular expression
+                (searched anywhere in the name) instead of a shell-style pattern (matching the whole name).
+
+        Returns:
+            Callable[[str], bool]: The function telling whether a member name is selected.
+        """
+        if use_regex:
+            return re.compile(pattern).search
+        return lambda member_name: fnmatch.fnmatchcase(member_name, pattern)
+
+    def list_contents(self, archive_file_path: str) -> list[tuple[str, int]]:
+        """
+        Lists the files contained in an archive, without extracting them.
+
+        Only the index of the archive is read: the central directory of a ZIP archive, the technical listing
+        of a RAR archive, and the headers of a tar archive (a compressed tar archive has no index, so it is
+        decompressed as a stream, but the content of the members is skipped). The files of an incremental
+        ZIP archive are those of its whole chain, as replayed from the manifests.
+
+        Params:
+            archive_file_path (str): The path of the archive or of the first volume of a split archive.
+
+        Returns:
+            list[tuple[str, int]]: The name inside the archive and the size of every file.
+        """
+        if self.tar_format(archive_file_path):
+            with self._open_tar_stream(archive_file_path) as tar:
+                return [(member.name, member.size) for member in tar if member.isfile()]
+
+        if archive_file_path.lower().endswith('.rar'):
+            listing = subprocess.run([self._rar_program(), 'lt', '-c-', '--', os.path.abspath(archive_file_path)],
+                                     check=True, capture_output=True, text=True).stdout
+            contents = []
+            member_name, member_type = '', ''
+            for line in listing.splitlines():
+                field, _, value = line.strip().partition(': ')
+                if field == 'Name':
+                    member_name = value
+                elif field == 'Type':
+                    member_type = value
+                elif field == 'Size' and member_type == 'File':
+                    contents.append((member_name, int(value)))
+            return contents
+
+        # The files of an incremental archive are those of its chain, without the manifest
+        if self.is_incremental_archive(archive_file_path):
+            return [(entry['arcname'], entry['size']) for entry in replay_manifests(archive_file_path).values()]
+
+        with open_archive_file(archive_file_path) as archive_file, zipfile.ZipFile(archive_file, 'r') as zipf:
+            return [(info.filename, info.file_size) for info in zipf.infolist() if not info.is_dir()]
+
+    def extract_members(self, archive_file_path: str, pattern: str, destination_path: str = '',
+                        use_regex: bool = False) -> list[str]:
+        """
+        Extracts only the files of an archive whose name matches a pattern.
+
+        The members are located through the index of the archive and their content is streamed straight
+        to disk, so the other members are never decompressed (except for compressed tar archives, which
+        can only be read from their start). The paths of the members are validated like for a full
+        extraction, so no file is written outside of the destination folder. The files of an incremental
+        ZIP archive are extracted from the archives of its chain holding their latest version.
+
+        Params:
+            archive_file_path (str): The path of the archive or of the first volume of a split archive.
+            pattern (str): A shell-style pattern (e.g. 'logs/*.txt') or a regular expression.
+            destination_path (str, optional): The destination folder for the extracted files.
                 Defaults to the default path if none is specified.
+            use_regex (bool, optional): Flag indicating whether the pattern is a regular expression.
 
-        Notes:
-            Recommended to be used in conjunction with the 'transfer_to_temporary_folder' function.
-            Should be used together in the following order:
-                A: temporary transfer the files
-                B: start compressing
-                C: clean the folder of the copies
+        Returns:
+            list[str]: The names inside the archive of the extracted files.
         """
-        if not targeted_path:
-            targeted_path = self.default_path
-        targeted_path = os.path.join(targeted_path, 'archives')
+        destination_path = self._resolve_destination(destination_path)
+        is_selected = self.member_matcher(pattern, use_regex)
 
-        try:
-            os.chdir(targeted_path)
-        except FileNotFoundError as fnfe:
-            print('Changing directory Error: \n\t' + str(fnfe))
+        if self.tar_format(archive_file_path):
+            extracted_members = []
+            with self._open_tar_stream(archive_file_path) as tar:
+                for member in tar:
+                    if member.isfile() and is_selected(member.name):
+                        self._extract_tar_member(tar, member, destination_path)
+                        extracted_members.append(member.name)
+            return extracted_members
 
-        for file in file_list:
-            print(file)
-            try:
-                os.remove(file)
-            except FileNotFoundError as fnfe:
-                print('Removing file Error: \n\t' + str(fnfe))
+        if archive_file_path.lower().endswith('.rar'):
+            extracted_members = [member_name for member_name, _ in self.list_contents(archive_file_path)
+                                 if is_selected(member_name)]
+            if extracted_members:
+                subprocess.run([self._rar_program(), 'x', '-y', '-c-', '--', os.path.abspath(archive_file_path),
+                                *extracted_members, destination_path + os.sep],
+                               check=True, stdout=subprocess.DEVNULL)
+            return extracted_members
 
-        os.chdir(self.default_path)
+        if self.is_incremental_archive(archive_file_path):
+            return self.restore_incremental_zip(archive_file_path, destination_path, is_selected)
 
-        try:
-            files = os.listdir(targeted_path)
-            if len(files) == 0:
-                os.rmdir(targeted_path)
-        except FileNotFoundError as fnfe:
-            print('Changing directory Error: \n\t' + str(fnfe))
+        with open_archive_file(archive_file_path) as archive_file, zipfile.ZipFile(archive_file, 'r') as zipf:
+            selected_members = [info.filename for info in zipf.infolist()
+                                if not info.is_dir() and is_selected(info.filename)]
+        return extract_parallel_zip(archive_file_path, destination_path, selected_members)
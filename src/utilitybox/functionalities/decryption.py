@@ -1,8 +1,79 @@
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import BinaryIO, Iterator
 
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet
 
+from src.utilitybox.auxiliar.atomic_writes import replace_file_contents
+from src.utilitybox.auxiliar.key_derivation import derive_file_key
+from src.utilitybox.auxiliar.keystore import KeyStore
 from src.utilitybox.auxiliar.project_paths import get_project_keys_path
+from src.utilitybox.auxiliar.stream_cipher import decrypt_stream, is_stream_encrypted, read_stream_header, verify_stream
+
+"""
+Batch decryption and verification Params (number of files handed to a worker process at once).
+"""
+BATCH_CHUNK_SIZE = 8
+
+# Location displayed for the keys that are derived from a passphrase instead of being stored
+DERIVED_KEY_LOCATION = 'None (derived from the passphrase)'
+
+
+def _decrypt_fernet_token(key: bytes, source: BinaryIO, destination: BinaryIO) -> None:
+    """
+    Decrypts a file encrypted as a single Fernet token (format used before the stream encryption).
+
+    Params:
+        key (bytes): The encryption key as bytes.
+        source (BinaryIO): The encrypted file.
+        destination (BinaryIO): The file receiving the decrypted contents.
+    """
+    destination.write(Fernet(key).decrypt(source.read()))
+
+
+def _decrypt_single_file(file_path: str, passphrase: str = '', keystore_path: str = '') -> tuple[str, str | None]:
+    """
+    Loads the key of a file and decrypts it (runs in the worker processes of a batch).
+
+    Params:
+        file_path (str): The path of the file to be decrypted.
+        passphrase (str, optional): The passphrase the keys of the files encrypted with a passphrase are derived from.
+        keystore_path (str, optional): The path of the keystore database containing the key.
+
+    Returns:
+        tuple[str, str | None]: The path of the file and the location of its deleted key, or None if the
+            decryption failed.
+    """
+    try:
+        decryption = Decryption(file_path, keystore_path, passphrase)
+        decryption.decrypt_file(decryption.load_key())
+        return file_path, next(iter(decryption.file_key_pair.values()))
+    except Exception as e:
+        print('Decryption Error: \n\t' + (str(e) or type(e).__name__))
+        return file_path, None
+
+
+def _verify_single_file(file_path: str, passphrase: str = '', keystore_path: str = '') -> tuple[str, str | None]:
+    """
+    Loads the key of a file and verifies that it matches the file (runs in the worker processes of a batch).
+
+    Params:
+        file_path (str): The path of the file to be verified.
+        passphrase (str, optional): The passphrase the keys of the files encrypted with a passphrase are derived from.
+        keystore_path (str, optional): The path of the keystore database containing the key.
+
+    Returns:
+        tuple[str, str | None]: The path of the file and the location of its key, or None if the verification failed.
+    """
+    try:
+        decryption = Decryption(file_path, keystore_path, passphrase)
+        decryption.verify_file(decryption.load_key())
+        return file_path, next(iter(decryption.file_key_pair.values()))
+    except Exception as e:
+        print('Verification Error: \n\t' + file_path + ': ' + (str(e) or type(e).__name__))
+        return file_path, None
 
 
 class Decryption:
@@ -11,52 +82,182 @@ class Decryption:
 
     Attributes:
         self.file_path (str): The file path of the encrypted file.
-        self.file_key_pair (dict[str, str]): A dictionary containing the file name and its associated key file path.
+        self.file_key_pair (dict[str, str]): A dictionary containing the file name and the location of its key.
+        self.keystore_path (str): The path of the keystore database (the project's keystore if empty).
+        self.file_id (bytes | None): The identifier under which the key of the file is stored in the keystore,
+            or None if the key is stored in a key file (files encrypted by older versions).
+        self.passphrase (str): The passphrase the key is derived from, for the files encrypted with a passphrase.
+        self.key_derived (bool): Flag indicating whether the key was derived from the passphrase.
     """
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, keystore_path: str = '', passphrase: str = ''):
         """
         Initialize the Decryption object.
 
         Params:
             file_path (str): The file path of the encrypted file.
+            keystore_path (str, optional): The path of the keystore database containing the key.
+                Defaults to the project's keystore path if not specified.
+            passphrase (str, optional): The passphrase the key is derived from, for the files encrypted with a passphrase.
         """
         self.file_path = file_path
         self.file_key_pair = {}
+        self.keystore_path = keystore_path
+        self.file_id = None
+        self.passphrase = passphrase
+        self.key_derived = False
 
     def load_key(self) -> bytes:
         """
-        Load the encryption key associated with the file.
+        Load the encryption key associated with the file: derive it from the passphrase, or load it
+        from the keystore or from the key file named after the file (used by older versions).
         """
         file_name = os.path.splitext(os.path.basename(self.file_path))[0]
-        default_key_path = get_project_keys_path()
-        key_location = os.path.join(default_key_path, file_name + '.key')
+        with open(self.file_path, 'rb') as file:
+            stream_header = read_stream_header(file)
+        file_id, kdf_params = stream_header[3:] if stream_header else (None, None)
+
+        if kdf_params:
+            if not self.passphrase:
+                raise ValueError('The file was encrypted with a passphrase, which was not provided.')
+            self.key_derived = True
+            self.file_key_pair[file_name] = DERIVED_KEY_LOCATION
+            return derive_file_key(self.passphrase, kdf_params, file_id)
+
+        if file_id:
+            with KeyStore(self.keystore_path) as keystore:
+                key = keystore.load_key(file_id)
+                if key:
+                    self.file_id = file_id
+                    self.file_key_pair[file_name] = f'{keystore.keystore_path} (file id {file_id.hex()})'
+                    return key
+
+        key_location = os.path.join(get_project_keys_path(), file_name + '.key')
         self.file_key_pair[file_name] = key_location
-        return open(key_location, 'rb').read()
+        with open(key_location, 'rb') as key_file:
+            return key_file.read()
 
     def remove_key(self) -> None:
         """
-        Remove the encryption key file associated with the decrypted file.
+        Remove the encryption key associated with the decrypted file (the keys derived from a passphrase
+        are not stored).
         """
-        default_key_path = get_project_keys_path()
-        key_path = os.path.join(default_key_path, os.path.splitext(os.path.basename(self.file_path))[0] + '.key')
-        os.remove(key_path)
+        if self.key_derived:
+            return
+        if self.file_id:
+            with KeyStore(self.keystore_path) as keystore:
+                keystore.remove_key(self.file_id)
+        else:
+            default_key_path = get_project_keys_path()
+            key_path = os.path.join(default_key_path, os.path.splitext(os.path.basename(self.file_path))[0] + '.key')
+            os.remove(key_path)
 
     def decrypt_file(self, key: bytes) -> None:
         """
         Decrypt the file using the provided encryption key.
 
+        Files encrypted with the stream encryption format are decrypted chunk by chunk, while the
+        files encrypted as a single Fernet token by older versions are still supported.
+
         Params:
             key (bytes): The encryption key as bytes.
+
+        Notes:
+            A ValueError is raised if the key derived from the passphrase doesn't match the file.
         """
-        fernet = Fernet(key)
+        try:
+            if is_stream_encrypted(self.file_path):
+                replace_file_contents(self.file_path, decrypt_stream, key, operation_identifier='Decryption')
+            else:
+                replace_file_contents(self.file_path, _decrypt_fernet_token, key, operation_identifier='Decryption')
+        except InvalidTag as e:
+            if self.key_derived:
+                raise ValueError('The passphrase is wrong or the file was altered.') from e
+            raise
 
-        with open(self.file_path, 'rb') as file:
-            encrypted_message = file.read()
+        self.remove_key()
 
-        decrypted_message = fernet.decrypt(encrypted_message)
+    def verify_file(self, key: bytes) -> None:
+        """
+        Verify that the file matches the provided encryption key and was not altered, without writing
+        anything or removing the key.
 
-        with open(self.file_path, 'wb') as file:
-            file.write(decrypted_message)
+        The authentication tags of the files encrypted with the stream encryption format are checked
+        chunk by chunk, while only the signature of the files encrypted as a single Fernet token is checked.
 
-        self.remove_key()
+        Params:
+            key (bytes): The encryption key as bytes.
+
+        Notes:
+            cryptography.exceptions.InvalidTag (or cryptography.fernet.InvalidToken) is raised if the
+            verification fails, or a ValueError if the key derived from the passphrase doesn't match the file.
+        """
+        if is_stream_encrypted(self.file_path):
+            with open(self.file_path, 'rb') as file:
+                try:
+                    verify_stream(key, file)
+                except InvalidTag as e:
+                    if self.key_derived:
+                        raise ValueError('The passphrase is wrong or the file was altered.') from e
+                    raise
+        else:
+            with open(self.file_path, 'rb') as file:
+                Fernet(key).extract_timestamp(file.read())
+
+    @staticmethod
+    def decrypt_files(file_paths: list[str], max_workers: int | None = None, passphrase: str = '',
+                      keystore_path: str = '') -> Iterator[tuple[str, str | None]]:
+        """
+        Decrypts a batch of files, each with its own key, using a pool of processes.
+
+        Params:
+            file_paths (list[str]): The paths of the files to be decrypted.
+            max_workers (int | None, optional): The number of worker processes. Defaults to the number of CPUs.
+            passphrase (str, optional): The passphrase the keys of the files encrypted with a passphrase are derived from.
+            keystore_path (str, optional): The path of the keystore database containing the keys.
+                Defaults to the project's keystore path if not specified.
+
+        Returns:
+            Iterator[tuple[str, str | None]]: The path of every file and the location of its deleted key (None
+                if the file was not decrypted), as soon as each file is processed.
+
+        Notes:
+            The keystore is compacted after the batch if the deleted keys left enough unused space.
+        """
+        decrypt_single_file = partial(_decrypt_single_file, passphrase=passphrase, keystore_path=keystore_path)
+
+        # A single file is decrypted directly, without starting worker processes
+        if len(file_paths) <= 1:
+            yield from map(decrypt_single_file, file_paths)
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                yield from executor.map(decrypt_single_file, file_paths, chunksize=BATCH_CHUNK_SIZE)
+
+        with KeyStore(keystore_path) as keystore:
+            keystore.compact()
+
+    @staticmethod
+    def verify_files(file_paths: list[str], max_workers: int | None = None, passphrase: str = '',
+                     keystore_path: str = '') -> Iterator[tuple[str, str | None]]:
+        """
+        Verifies a batch of encrypted files against their keys, using a pool of processes.
+
+        Params:
+            file_paths (list[str]): The paths of the files to be verified.
+            max_workers (int | None, optional): The number of worker processes. Defaults to the number of CPUs.
+            passphrase (str, optional): The passphrase the keys of the files encrypted with a passphrase are derived from.
+            keystore_path (str, optional): The path of the keystore database containing the keys.
+                Defaults to the project's keystore path if not specified.
+
+        Returns:
+            Iterator[tuple[str, str | None]]: The path of every file and the location of its key (None if the
+                file failed the verification), as soon as each file is processed.
+        """
+        verify_single_file = partial(_verify_single_file, passphrase=passphrase, keystore_path=keystore_path)
+
+        # A single file is verified directly, without starting worker processes
+        if len(file_paths) <= 1:
+            yield from map(verify_single_file, file_paths)
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                yield from executor.map(verify_single_file, file_paths, chunksize=BATCH_CHUNK_SIZE)
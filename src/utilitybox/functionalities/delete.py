@@ -1,5 +1,7 @@
 import os.path
+from typing import Iterable, Iterator
 
+from src.utilitybox.auxiliar.directory_walker import walk_files
 from src.utilitybox.auxiliar.extension_operations import split_extensions
 
 
@@ -9,7 +11,10 @@ class Delete:
 
     Attributes:
         self.folder_path (str): The folder path where the deletion takes place.
-        self.files_deleted (list[str]): A list of all files that were deleted in the process.
+
+    Notes:
+        The deletion methods return iterators producing the paths of the deleted files. The files
+        are deleted lazily, as the returned iterator is consumed.
     """
 
     def __init__(self, folder_path: str):
@@ -20,23 +25,20 @@ class Delete:
             folder_path (str): The folder path where the deletion takes place.
         """
         self.folder_path = folder_path
-        self.files_deleted = []
 
-    def delete_by_single_extension(self, file_extension: str) -> None:
+    def delete_by_single_extension(self, file_extension: str) -> Iterator[str]:
         """
         Delete files with a specific extension.
 
         Params:
             file_extension (str): The file extension used for filtering and deletion.
         """
-        files = os.listdir(self.folder_path)
-        for file in files:
-            if file.endswith(file_extension):
-                file_path = os.path.join(self.folder_path, file)
-                os.remove(file_path)
-                self.files_deleted.append(file_path)
+        for entry in walk_files(self.folder_path, recursive=False):
+            if entry.name.endswith(file_extension):
+                os.remove(entry.path)
+                yield entry.path
 
-    def delete_by_multiple_extensions(self, list_of_file_extensions: str) -> None:
+    def delete_by_multiple_extensions(self, list_of_file_extensions: str) -> Iterator[str]:
         """
         Delete files with multiple specified extensions.
 
@@ -46,9 +48,9 @@ class Delete:
         """
         cleaned_list_of_file_extensions = split_extensions(list_of_file_extensions)
         for clean_extension in cleaned_list_of_file_extensions:
-            self.delete_by_single_extension(clean_extension)
+            yield from self.delete_by_single_extension(clean_extension)
 
-    def delete_by_keyword(self, name_keyword: str, list_of_file_extensions: str = '') -> None:
+    def delete_by_keyword(self, name_keyword: str, list_of_file_extensions: str = '') -> Iterator[str]:
         """
         Deleting a set of files using a specific extension provided by the user.
 
@@ -57,16 +59,30 @@ class Delete:
             list_of_file_extensions (str, optional): A string of file extensions separated by commas.
         """
         cleaned_list_of_file_extensions = split_extensions(list_of_file_extensions)
-        files = os.listdir(self.folder_path)
-        for file in files:
-            current_file_name, current_file_extension = os.path.splitext(file)
+        for entry in walk_files(self.folder_path, recursive=False):
+            current_file_name, current_file_extension = os.path.splitext(entry.name)
             if cleaned_list_of_file_extensions:
                 if name_keyword in current_file_name and current_file_extension[1:] in cleaned_list_of_file_extensions:
-                    file_path = os.path.join(self.folder_path, file)
-                    os.remove(file_path)
-                    self.files_deleted.append(file_path)
+                    os.remove(entry.path)
+                    yield entry.path
             else:
                 if name_keyword in current_file_name:
-                    file_path = os.path.join(self.folder_path, file)
-                    os.remove(file_path)
-                    self.files_deleted.append(file_path)
+                    os.remove(entry.path)
+                    yield entry.path
+
+    @staticmethod
+    def delete_files(file_paths: Iterable[str]) -> Iterator[str]:
+        """
+        Delete a set of files provided by another operation (e.g. the redundant copies found by
+        the duplicates search).
+
+        Params:
+            file_paths (Iterable[str]): The paths of the files to delete.
+        """
+        for file_path in file_paths:
+            try:
+                os.remove(file_path)
+            except FileNotFoundError as fnfe:
+                print('Removing file Error: \n\t' + str(fnfe))
+                continue
+            yield file_path
@@ -0,0 +1,189 @@
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator
+
+from src.utilitybox.auxiliar.directory_walker import walk_files
+from src.utilitybox.auxiliar.hash_cache import HashCache
+
+"""
+Duplicates finding Params (number of bytes hashed at the start and at the end of a file for the
+partial hash, size of the chunks read for the full hash and number of hashing threads).
+"""
+PARTIAL_HASH_SIZE = 4096
+FULL_HASH_CHUNK_SIZE = 1024 * 1024
+DEFAULT_MAX_WORKERS = 8
+
+
+def partial_file_hash(file_path: str) -> str | None:
+    """
+    Hashes the first and the last bytes of a file.
+
+    Params:
+        file_path (str): The path of the file.
+
+    Returns:
+        str | None: The hash of the file's edges, or None if the file can't be read.
+    """
+    try:
+        with open(file_path, 'rb') as file:
+            file_hash = hashlib.blake2b(file.read(PARTIAL_HASH_SIZE))
+            file_size = os.fstat(file.fileno()).st_size
+            if file_size > PARTIAL_HASH_SIZE:
+                file.seek(max(PARTIAL_HASH_SIZE, file_size - PARTIAL_HASH_SIZE))
+                file_hash.update(file.read(PARTIAL_HASH_SIZE))
+        return file_hash.hexdigest()
+    except OSError as ose:
+        print('Hashing file Error: \n\t' + str(ose))
+        return None
+
+
+def full_file_hash(file_path: str) -> str | None:
+    """
+    Hashes the whole content of a file, reading it in chunks.
+
+    Params:
+        file_path (str): The path of the file.
+
+    Returns:
+        str | None: The hash of the file's content, or None if the file can't be read.
+    """
+    try:
+        file_hash = hashlib.blake2b()
+        with open(file_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(FULL_HASH_CHUNK_SIZE), b''):
+                file_hash.update(chunk)
+        return file_hash.hexdigest()
+    except OSError as ose:
+        print('Hashing file Error: \n\t' + str(ose))
+        return None
+
+
+class Duplicates:
+    """
+    Utility class for finding the files with identical content located in a folder tree.
+
+    The files are compared in stages, each stage only handling the files that are still candidates:
+        A. the files are grouped by size (files with a unique size can't have duplicates);
+        B. the files of the same size are grouped by the hash of their first and last bytes;
+        C. the remaining files are grouped by the hash of their whole content.
+    The hashes are computed by a pool of threads and cached by path, size and modification time,
+    so the files that didn't change are not read again by later runs.
+
+    Attributes:
+        self.folder_path (str): The folder path where the duplicates are searched.
+        self.recursive (bool): Flag indicating whether the subfolders are searched as well.
+        self.exclude_patterns (list[str]): Shell-style patterns of file and folder names skipped.
+        self.max_workers (int): The number of threads hashing files.
+    """
+
+    def __init__(self, folder_path: str, recursive: bool = True, exclude_patterns: list[str] | None = None,
+                 max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        Initialize the Duplicates object.
+
+        Params:
+            folder_path (str): The folder path where the duplicates are searched.
+            recursive (bool, optional): Search the subfolders as well. Defaults to True.
+            exclude_patterns (list[str] | None, optional): Shell-style patterns of file and folder names skipped.
+            max_workers (int, optional): The number of threads hashing files.
+        """
+        self.folder_path = folder_path
+        self.recursive = recursive
+        self.exclude_patterns = exclude_patterns or []
+        self.max_workers = max_workers
+
+    def _group_by_size(self) -> list[list[tuple[str, int, int]]]:
+        """
+        Groups the files of the folder by size, keeping only the groups of at least two files.
+
+        Returns:
+            list[list[tuple[str, int, int]]]: The path, size and modification time of the grouped files.
+
+        Notes:
+            Empty files are ignored and hard links to the same file are only counted once.
+        """
+        files_by_size = {}
+        known_files = set()
+        for entry in walk_files(self.folder_path, self.recursive, exclude_patterns=self.exclude_patterns):
+            entry_stat = entry.stat()
+            file_identity = (entry_stat.st_dev, entry_stat.st_ino)
+            if entry_stat.st_size == 0 or (entry_stat.st_ino and file_identity in known_files):
+                continue
+            known_files.add(file_identity)
+            files_by_size.setdefault(entry_stat.st_size, []).append(
+                (entry.path, entry_stat.st_size, entry_stat.st_mtime_ns))
+
+        return [group for group in files_by_size.values() if len(group) > 1]
+
+    def _group_by_hash(self, groups: list[list[tuple[str, int, int]]], hash_kind: str,
+                       hash_function: Callable[[str], str | None],
+                       hash_cache: HashCache) -> list[list[tuple[str, int, int]]]:
+        """
+        Splits groups of files by the hash of their content, keeping only the groups of at least two files.
+
+        Params:
+            groups (list[list[tuple[str, int, int]]]): The path, size and modification time of the grouped files.
+            hash_kind (str): The kind of hash used for caching ('partial' or 'full').
+            hash_function (Callable[[str], str | None]): The function hashing a file.
+            hash_cache (HashCache): The cache of the hashes computed by previous runs.
+        """
+        candidate_files = [file for group in groups for file in group]
+        file_hashes = {}
+        uncached_files = []
+        for file_path, size, mtime_ns in candidate_files:
+            cached_hash = hash_cache.load_hash(file_path, hash_kind, size, mtime_ns)
+            if cached_hash:
+                file_hashes[file_path] = cached_hash
+            else:
+                uncached_files.append((file_path, size, mtime_ns))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            computed_hashes = executor.map(hash_function, [file_path for file_path, _, _ in uncached_files])
+            for (file_path, size, mtime_ns), file_hash in zip(uncached_files, computed_hashes):
+                if file_hash:
+                    file_hashes[file_path] = file_hash
+                    hash_cache.store_hash(file_path, hash_kind, size, mtime_ns, file_hash)
+
+        hash_groups = []
+        for group in groups:
+            files_by_hash = {}
+            for file in group:
+                if file[0] in file_hashes:
+                    files_by_hash.setdefault(file_hashes[file[0]], []).append(file)
+            hash_groups.extend(hash_group for hash_group in files_by_hash.values() if len(hash_group) > 1)
+        return hash_groups
+
+    def find_duplicates(self) -> Iterator[list[str]]:
+        """
+        Finds the groups of files with identical content.
+
+        Returns:
+            Iterator[list[str]]: The paths of the files of every group of duplicates, the oldest
+                file (by modification time) being the first of its group.
+        """
+        size_groups = self._group_by_size()
+        with HashCache() as hash_cache:
+            partial_hash_groups = self._group_by_hash(size_groups, 'partial', partial_file_hash, hash_cache)
+
+            # Files small enough to be entirely covered by the partial hash don't need a full hash
+            small_file_groups = [group for group in partial_hash_groups if group[0][1] <= 2 * PARTIAL_HASH_SIZE]
+            large_file_groups = [group for group in partial_hash_groups if group[0][1] > 2 * PARTIAL_HASH_SIZE]
+            full_hash_groups = self._group_by_hash(large_file_groups, 'full', full_file_hash, hash_cache)
+
+        for group in small_file_groups + full_hash_groups:
+            yield [file_path for file_path, _, _ in sorted(group, key=lambda file: (file[2], file[0]))]
+
+    @staticmethod
+    def redundant_files(duplicate_groups: Iterable[list[str]]) -> Iterator[str]:
+        """
+        Provides the files that can be removed while keeping one copy of every group of duplicates.
+
+        Params:
+            duplicate_groups (Iterable[list[str]]): The groups of duplicates, as returned by 'find_duplicates'.
+
+        Returns:
+            Iterator[str]: The paths of every file of a group except its first one.
+        """
+        for group in duplicate_groups:
+            yield from group[1:]
@@ -1,8 +1,45 @@
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterator
 
 from cryptography.fernet import Fernet
 
-from src.utilitybox.auxiliar.project_paths import get_project_keys_path
+from src.utilitybox.auxiliar.atomic_writes import replace_file_contents
+from src.utilitybox.auxiliar.key_derivation import derive_file_key, generate_kdf_params
+from src.utilitybox.auxiliar.keystore import KeyStore
+from src.utilitybox.auxiliar.stream_cipher import FILE_ID_SIZE, encrypt_stream
+
+"""
+Batch encryption Params (number of files handed to a worker process at once).
+"""
+BATCH_CHUNK_SIZE = 8
+
+# Location displayed for the keys that are derived from a passphrase instead of being stored
+DERIVED_KEY_LOCATION = 'None (derived from the passphrase)'
+
+
+def _encrypt_single_file(file_path: str, passphrase: str = '',
+                         kdf_params: tuple[bytes, int, int, int] | None = None) -> tuple[str, str | None]:
+    """
+    Generates a key for a file and encrypts it (runs in the worker processes of a batch).
+
+    Params:
+        file_path (str): The path of the file to be encrypted.
+        passphrase (str, optional): The passphrase the key is derived from (a random key is stored if empty).
+        kdf_params (tuple[bytes, int, int, int] | None, optional): The parameters of the passphrase derivation.
+
+    Returns:
+        tuple[str, str | None]: The path of the file and the location of its key, or None if the encryption failed.
+    """
+    try:
+        encryption = Encryption(file_path, passphrase, kdf_params)
+        encryption.generate_key()
+        encryption.encrypt_file(encryption.load_key())
+        return file_path, next(iter(encryption.file_key_pair.values()))
+    except Exception as e:
+        print('Encryption Error: \n\t' + str(e))
+        return file_path, None
 
 
 class Encryption:
@@ -12,59 +49,102 @@ class Encryption:
     Attributes:
         self.file_path (str): The path of the file to be encrypted.
         self.file_key_pair (dict[str, str]): A dictionary containing the file name of the encrypted text file
-            and the full path associated with the key that was generated in the process.
+            and the location of the key that was generated in the process.
+        self.keystore_path (str): The path of the keystore database (the project's keystore if empty).
+        self.file_id (bytes | None): The random identifier stored in the header of the encrypted file,
+            under which its key is stored in the keystore.
+        self.passphrase (str): The passphrase the key is derived from (a random key is stored if empty).
+        self.kdf_params (tuple[bytes, int, int, int] | None): The parameters of the passphrase derivation.
     """
-    # The default path where the keys are stored
-    # Keys names are a one to one match with the name of the text file for easy association
-    default_key_folder = get_project_keys_path()
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, passphrase: str = '', kdf_params: tuple[bytes, int, int, int] | None = None):
         """
         Initialize the Encryption object.
 
         Params:
             file_path (str): The path of the file to be encrypted.
+            passphrase (str, optional): Derive the key from this passphrase instead of storing a random key.
+            kdf_params (tuple[bytes, int, int, int] | None, optional): The parameters of the passphrase derivation.
+                New parameters are generated if not specified (the files sharing them share the expensive
+                part of the derivation).
         """
         self.file_path = file_path
         self.file_key_pair = {}
+        self.file_id = None
+        self.keystore_path = ''
+        self.passphrase = passphrase
+        self.kdf_params = (kdf_params or generate_kdf_params()) if passphrase else None
 
-    def generate_key(self, key_path: str = default_key_folder) -> None:
+    def generate_key(self, keystore_path: str = '') -> None:
         """
-        Generate a new encryption key and save it to a key type file.
+        Generate a new encryption key and a new file identifier, and save the key in the keystore.
+        The key derived from a passphrase is not saved.
 
         Params:
-            key_path (str, optional): The path where the encryption key file will be saved.
-                Defaults to the class's default_key_path.
+            keystore_path (str, optional): The path of the keystore database where the key will be saved.
+                Defaults to the project's keystore path if not specified.
         """
-        os.chdir(key_path)
+        self.file_id = os.urandom(FILE_ID_SIZE)
+        if self.passphrase:
+            self.file_key_pair[os.path.splitext(os.path.basename(self.file_path))[0]] = DERIVED_KEY_LOCATION
+            return
+
         key = Fernet.generate_key()
-        file_name = os.path.splitext(os.path.basename(self.file_path))[0]
-        with open(file_name + '.key', 'wb') as key_file:
-            key_file.write(key)
-        self.file_key_pair[file_name] = os.path.join(self.default_key_folder, file_name + '.key')
+        with KeyStore(keystore_path) as keystore:
+            keystore.store_key(self.file_id, key, os.path.basename(self.file_path))
+            file_name = os.path.splitext(os.path.basename(self.file_path))[0]
+            self.file_key_pair[file_name] = f'{keystore.keystore_path} (file id {self.file_id.hex()})'
+        self.keystore_path = keystore_path
 
     def load_key(self) -> bytes:
         """
-        Load the encryption key from a file.
+        Load the encryption key generated for the file from the keystore, or derive it from the passphrase.
 
         Returns:
-            bytes: The encryption key loaded from the key file.
+            bytes: The encryption key of the file.
         """
-        file_name = os.path.splitext(os.path.basename(self.file_path))[0]
-        return open(file_name + '.key', 'rb').read()
+        if self.passphrase:
+            return derive_file_key(self.passphrase, self.kdf_params, self.file_id)
+        with KeyStore(self.keystore_path) as keystore:
+            return keystore.load_key(self.file_id)
 
     def encrypt_file(self, key: bytes) -> None:
         """
         Encrypt the contents of the file using the provided encryption key.
 
+        The file is encrypted chunk by chunk with the stream encryption format, so the memory used
+        doesn't depend on the size of the file.
+
         Params:
             key (bytes): The encryption key associated with a specific file.
         """
-        fernet = Fernet(key)
+        self.file_id = replace_file_contents(self.file_path, partial(encrypt_stream, file_id=self.file_id,
+                                                                     kdf_params=self.kdf_params),
+                                             key, operation_identifier='Encryption')
+
+    @staticmethod
+    def encrypt_files(file_paths: list[str], max_workers: int | None = None,
+                      passphrase: str = '') -> Iterator[tuple[str, str | None]]:
+        """
+        Encrypts a batch of files, each with its own key, using a pool of processes.
 
-        with open(self.file_path, 'rb') as file:
-            data_from_file = file.read()
+        Params:
+            file_paths (list[str]): The paths of the files to be encrypted.
+            max_workers (int | None, optional): The number of worker processes. Defaults to the number of CPUs.
+            passphrase (str, optional): Derive the keys from this passphrase instead of storing random keys.
+                The files of the batch share the same derivation parameters, so decrypting them together
+                only runs the expensive part of the derivation once per process.
+
+        Returns:
+            Iterator[tuple[str, str | None]]: The path of every file and the location of its key (None if the
+                file was not encrypted), as soon as each file is processed.
+        """
+        encrypt_single_file = partial(_encrypt_single_file, passphrase=passphrase,
+                                      kdf_params=generate_kdf_params() if passphrase else None)
 
-        encrypted_data = fernet.encrypt(data_from_file)
-        with open(self.file_path, 'wb') as file:
-            file.write(encrypted_data)
+        # A single file is encrypted directly, without starting worker processes
+        if len(file_paths) <= 1:
+            yield from map(encrypt_single_file, file_paths)
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                yield from executor.map(encrypt_single_file, file_paths, chunksize=BATCH_CHUNK_SIZE)
@@ -1,4 +1,99 @@
+import mmap
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Iterator
+
+from src.utilitybox.auxiliar.directory_walker import is_excluded, walk_files
+from src.utilitybox.auxiliar.extension_operations import iterate_in_batches
+from src.utilitybox.auxiliar.file_index import FileIndex
+
+"""
+Content search Params (size of the sniffed file start, minimum size of memory-mapped files,
+size of the chunks used when counting lines and number of files handed to the process pool at once).
+"""
+BINARY_SNIFF_SIZE = 8192
+MMAP_MIN_FILE_SIZE = 1024 * 1024
+LINE_COUNT_CHUNK_SIZE = 1024 * 1024
+CONTENT_SEARCH_BATCH_SIZE = 256
+
+
+def _count_new_lines(content, start: int, end: int) -> int:
+    """
+    Counts the line breaks located between two offsets of a file's content.
+
+    Params:
+        content (bytes | mmap.mmap): The content of the file.
+        start (int): The offset where the counting starts.
+        end (int): The offset where the counting ends (excluded).
+    """
+    new_lines = 0
+    for chunk_start in range(start, end, LINE_COUNT_CHUNK_SIZE):
+        new_lines += content[chunk_start:min(chunk_start + LINE_COUNT_CHUNK_SIZE, end)].count(b'\n')
+    return new_lines
+
+
+def _find_matches(content, pattern: bytes, is_regex: bool) -> list[tuple[int, int]]:
+    """
+    Finds the occurrences of a literal or regular expression in a file's content.
+
+    Params:
+        content (bytes | mmap.mmap): The content of the file.
+        pattern (bytes): The literal or regular expression searched.
+        is_regex (bool): Flag indicating whether the pattern is a regular expression.
+
+    Returns:
+        list[tuple[int, int]]: The line number and the byte offset of every occurrence.
+    """
+    if is_regex:
+        offsets = (match.start() for match in re.finditer(pattern, content, re.MULTILINE))
+    else:
+        def find_literal():
+            offset = content.find(pattern)
+            while offset != -1:
+                yield offset
+                offset = content.find(pattern, offset + len(pattern))
+        offsets = find_literal()
+
+    matches = []
+    line_number, previous_offset = 1, 0
+    for offset in offsets:
+        line_number += _count_new_lines(content, previous_offset, offset)
+        previous_offset = offset
+        matches.append((line_number, offset))
+    return matches
+
+
+def _scan_file_content(file_path: str, pattern: bytes, is_regex: bool) -> list[tuple[int, int]]:
+    """
+    Searches a literal or regular expression inside a file (runs in the worker processes).
+
+    Params:
+        file_path (str): The path of the file.
+        pattern (bytes): The literal or regular expression searched.
+        is_regex (bool): Flag indicating whether the pattern is a regular expression.
+
+    Returns:
+        list[tuple[int, int]]: The line number and the byte offset of every occurrence.
+
+    Notes:
+        Files containing a null byte in their first bytes are considered binary and skipped.
+        Large files are memory-mapped instead of being read in memory.
+    """
+    try:
+        with open(file_path, 'rb') as file:
+            if b'\0' in file.read(BINARY_SNIFF_SIZE):
+                return []
+            file_size = os.fstat(file.fileno()).st_size
+            if file_size >= MMAP_MIN_FILE_SIZE:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    return _find_matches(content, pattern, is_regex)
+            file.seek(0)
+            return _find_matches(file.read(), pattern, is_regex)
+    except OSError as ose:
+        print('Reading file Error: \n\t' + str(ose))
+        return []
 
 
 class Search:
@@ -7,21 +102,68 @@ class Search:
     criteria tailored to the user's needs.
 
     Attributes:
-        self.files_found (list[str]): A list of files found when searching by name or by both
-            name and extension.
+        self.folder_path (str): The folder path where the search takes place.
+        self.recursive (bool): Flag indicating whether the subfolders are searched as well.
+        self.max_depth (int | None): The maximum depth of subfolders searched (None means no limit).
+        self.exclude_patterns (list[str]): Shell-style patterns of file and folder names skipped by the search.
+        self.use_index (bool): Flag indicating whether the search is answered from the persistent file index.
+
+    Notes:
+        The search methods return iterators producing the files found (paths relative to the searched
+        folder) as the search advances, so the results are never accumulated in memory.
     """
 
-    def __init__(self, folder_path: str):
+    def __init__(self, folder_path: str, recursive: bool = False, max_depth: int | None = None,
+                 exclude_patterns: list[str] | None = None, use_index: bool = False):
         """
         Initialize the Search object.
 
         Params:
             folder_path (str): The folder path where the search takes place.
+            recursive (bool, optional): Search the subfolders as well. Defaults to False.
+            max_depth (int | None, optional): The maximum depth of subfolders searched when recursive
+                (0 means only the folder itself). Defaults to no limit.
+            exclude_patterns (list[str] | None, optional): Shell-style patterns (e.g. '.git', '*.tmp')
+                matched against file and folder names that are skipped by the search.
+            use_index (bool, optional): Answer the search from the persistent file index, which is
+                incrementally refreshed before searching. Defaults to False.
         """
         self.folder_path = folder_path
-        self.files_found = []
+        self.recursive = recursive
+        self.max_depth = max_depth
+        self.exclude_patterns = exclude_patterns or []
+        self.use_index = use_index
 
-    def search_by_name(self, file_name: str, file_extension: str) -> None:
+    def _is_in_scope(self, relative_path: str) -> bool:
+        """
+        Checks if a file found in the index respects the depth limit and the exclude patterns.
+
+        Params:
+            relative_path (str): The path of the file, relative to the searched folder.
+        """
+        path_parts = relative_path.split(os.sep)
+        if self.max_depth is not None and len(path_parts) - 1 > self.max_depth:
+            return False
+        return not any(is_excluded(path_part, self.exclude_patterns) for path_part in path_parts)
+
+    def _open_refreshed_index(self) -> FileIndex:
+        """
+        Opens the persistent file index (with its trigram index of the file names) and brings
+        the searched folder up to date in it.
+        """
+        file_index = FileIndex(use_trigrams=True)
+        file_index.refresh(self.folder_path, self.recursive)
+        return file_index
+
+    def _scan_files(self) -> Iterator[str]:
+        """
+        Yields the files located in the searched folder as paths relative to it.
+        """
+        prefix_length = len(os.path.join(self.folder_path, ''))
+        for entry in walk_files(self.folder_path, self.recursive, self.max_depth, self.exclude_patterns):
+            yield entry.path[prefix_length:]
+
+    def search_by_name(self, file_name: str, file_extension: str) -> Iterator[str]:
         """
         Finds a file or a series of files based on the information provided by the user
         in the search functionality additional window.
@@ -38,23 +180,70 @@ class Search:
             B. Searching by both name and extension will ensure a single finding since both the
             name and the extension are ensuring the uniqueness of the file.
         """
-        files = os.listdir(self.folder_path)
-        for file in files:
-            if ((os.path.splitext(file)[0] == file_name or file_name in os.path.splitext(file)[0])
+        if self.use_index:
+            with self._open_refreshed_index() as file_index:
+                for file in file_index.search_by_name(self.folder_path, file_name, file_extension, self.recursive):
+                    if self._is_in_scope(file):
+                        yield file
+            return
+
+        for file in self._scan_files():
+            current_file_name = os.path.splitext(os.path.basename(file))[0]
+            if ((current_file_name == file_name or file_name in current_file_name)
                     and (not file_extension or file.endswith('.' + file_extension))):
-                self.files_found.append(file)
+                yield file
 
-    def search_by_extension(self, file_extension: str) -> None:
+    def search_by_extension(self, file_extension: str) -> Iterator[str]:
         """
         Finds all the files with the specified extension, regardless of their names.
 
         Params:
             file_extension (str): The extension of the file/files.
+        """
+        if self.use_index:
+            with self._open_refreshed_index() as file_index:
+                for file in file_index.search_by_extension(self.folder_path, file_extension, self.recursive):
+                    if self._is_in_scope(file):
+                        yield file
+            return
+
+        for file in self._scan_files():
+            if file.endswith('.' + file_extension):
+                yield file
+
+    def search_by_content(self, text: str, is_regex: bool = False, file_extension: str = '',
+                          max_workers: int | None = None) -> Iterator[tuple[str, int, int]]:
+        """
+        Finds the occurrences of a text or a regular expression inside the files of the searched folder.
+
+        Params:
+            text (str): The text (or regular expression) searched inside the files.
+            is_regex (bool, optional): Treat the text as a regular expression. Defaults to False.
+            file_extension (str, optional): Only search inside the files with this extension.
+            max_workers (int | None, optional): The number of processes scanning files.
+                Defaults to the number of processors.
 
         Returns:
-            bool: True if the list is not empty, False otherwise.
+            Iterator[tuple[str, int, int]]: The file (relative to the searched folder), line number
+                and byte offset of every occurrence found.
+
+        Notes:
+            The files are scanned in parallel by a pool of processes, binary files are skipped and
+            large files are memory-mapped. The text is matched against the UTF-8 encoded content.
         """
-        files = os.listdir(self.folder_path)
-        for file in files:
-            if file.endswith('.' + file_extension):
-                self.files_found.append(file)
+        pattern = text.encode('utf-8')
+        if not pattern:
+            return
+        if is_regex:
+            re.compile(pattern)
+
+        candidate_files = (file for file in self._scan_files()
+                           if not file_extension or file.endswith('.' + file_extension))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for batch in iterate_in_batches(candidate_files, CONTENT_SEARCH_BATCH_SIZE):
+                file_paths = [os.path.join(self.folder_path, file) for file in batch]
+                files_matches = executor.map(_scan_file_content, file_paths, repeat(pattern), repeat(is_regex),
+                                             chunksize=16)
+                for file, file_matches in zip(batch, files_matches):
+                    for line_number, offset in file_matches:
+                        yield file, line_number, offset
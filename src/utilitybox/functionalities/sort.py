@@ -1,7 +1,9 @@
 import os
 import os.path
 import shutil
+from typing import Iterator
 
+from src.utilitybox.auxiliar.directory_walker import walk_files
 from src.utilitybox.auxiliar.extension_operations import split_extensions
 
 
@@ -11,7 +13,10 @@ class Sort:
 
     Attributes:
         self.folder_path (str): The folder path where the sorting takes place.
-        self.files_moved (list[str]): A list of file paths that were moved during the sorting process.
+
+    Notes:
+        The sorting methods return iterators producing the original paths of the moved files. The files
+        are moved lazily, as the returned iterator is consumed.
     """
 
     def __init__(self, folder_path: str):
@@ -22,7 +27,6 @@ class Sort:
             folder_path (str): The folder path where the sorting takes place.
         """
         self.folder_path = folder_path
-        self.files_moved = []
 
     @staticmethod
     def move_file(old_path: str, new_path: str) -> None:
@@ -47,7 +51,7 @@ class Sort:
         if not os.path.exists(searched_folder):
             os.mkdir(searched_folder)
 
-    def index_single_extension(self, file_extension: str) -> None:
+    def index_single_extension(self, file_extension: str) -> Iterator[str]:
         """
         Indexes a single type of files by a specific extension.
         Creates folders as needed.
@@ -55,30 +59,67 @@ class Sort:
         Params:
             file_extension (str): The file extension for sorting.
         """
-        files = os.listdir(self.folder_path)
-
-        for file in files:
-            _, current_file_extension = os.path.splitext(file)
-            if file.endswith(file_extension) and current_file_extension:
-                current_file_path = os.path.join(self.folder_path, file)
+        for entry in walk_files(self.folder_path, recursive=False):
+            _, current_file_extension = os.path.splitext(entry.name)
+            if entry.name.endswith(file_extension) and current_file_extension:
                 destination_folder = os.path.join(self.folder_path, file_extension)
                 self.check_folder_existence(destination_folder)
-                self.move_file(current_file_path, os.path.join(destination_folder, file))
-                self.files_moved.append(current_file_path)
+                self.move_file(entry.path, os.path.join(destination_folder, entry.name))
+                yield entry.path
 
-    def index_multiple_extensions(self, file_extensions: str) -> None:
+    def index_multiple_extensions(self, file_extensions: str) -> Iterator[str]:
         """
         Sorts multiple types of files by a set of specific extensions.
         Creates folders as needed.
 
+        The folder is listed once for all the extensions (see 'plan_multiple_extensions') and the folder
+        of every extension is created once, before its files are moved.
+
         Params:
             file_extensions (list[str]): A string of file extensions.
         """
-        list_of_file_extensions = split_extensions(file_extensions)
-        for extension in list_of_file_extensions:
-            self.index_single_extension(extension)
+        planned_moves = self.plan_multiple_extensions(split_extensions(file_extensions))
+        for extension, file_names in planned_moves.items():
+            if not file_names:
+                continue
+            destination_folder = os.path.join(self.folder_path, extension)
+            self.check_folder_existence(destination_folder)
+            for file_name in file_names:
+                file_path = os.path.join(self.folder_path, file_name)
+                self.move_file(file_path, os.path.join(destination_folder, file_name))
+                yield file_path
+
+    def plan_multiple_extensions(self, list_of_file_extensions: list[str]) -> dict[str, list[str]]:
+        """
+        Plans the sorting of multiple types of files with a single listing of the folder.
 
-    def sort_and_index_by_keyword(self, name_keyword: str, file_extension: str, new_name: str):
+        Every file goes to the first extension of the list its name ends with, like when the extensions
+        are sorted one after the other. The ending of every name is looked up in a dictionary of the
+        extensions (once per distinct extension length), instead of being compared with every extension.
+
+        Params:
+            list_of_file_extensions (list[str]): The file extensions, by priority (empty extensions are ignored).
+
+        Returns:
+            dict[str, list[str]]: The names of the files to move into the folder of every extension.
+        """
+        extension_priorities = {}
+        for priority, extension in enumerate(list_of_file_extensions):
+            if extension:
+                extension_priorities.setdefault(extension, priority)
+        extension_lengths = {len(extension) for extension in extension_priorities}
+
+        planned_moves = {extension: [] for extension in extension_priorities}
+        for entry in walk_files(self.folder_path, recursive=False):
+            if not os.path.splitext(entry.name)[1]:
+                continue
+            matching_extensions = [entry.name[-length:] for length in extension_lengths
+                                   if entry.name[-length:] in extension_priorities]
+            if matching_extensions:
+                planned_moves[min(matching_extensions, key=extension_priorities.get)].append(entry.name)
+        return planned_moves
+
+    def sort_and_index_by_keyword(self, name_keyword: str, file_extension: str, new_name: str) -> Iterator[str]:
         """
         Sorts and indexes a set of files using a specific extension provided by the user.
         Renames files based on the provided name keyword and their order in the folder.
@@ -96,18 +137,16 @@ class Sort:
                     an index to it.
                 - Moves the renamed files to a folder with the 'new_name' as its name.
         """
-        files = os.listdir(self.folder_path)
         destination_folder = os.path.join(self.folder_path, new_name)
 
         self.check_folder_existence(destination_folder)
 
         file_index = 1
-        for file in files:
-            current_file_name, current_file_extension = os.path.splitext(file)
-            if name_keyword in current_file_name and file.endswith(file_extension):
+        for entry in walk_files(self.folder_path, recursive=False):
+            current_file_name, current_file_extension = os.path.splitext(entry.name)
+            if name_keyword in current_file_name and entry.name.endswith(file_extension):
                 new_file_name = f"{new_name}_{file_index}{current_file_extension}"
-                old_path = os.path.join(self.folder_path, file)
                 new_path = os.path.join(destination_folder, new_file_name)
-                os.rename(old_path, new_path)
-                self.files_moved.append(old_path)
+                os.rename(entry.path, new_path)
+                yield entry.path
                 file_index += 1
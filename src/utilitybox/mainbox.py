@@ -2,7 +2,10 @@ import os.path
 
 import customtkinter as ctk
 
+from src.utilitybox.auxiliar.atomic_writes import recover_interrupted_writes
 from src.utilitybox.auxiliar.folders_configure import FoldersConfigure
+from src.utilitybox.auxiliar.job_executor import JobExecutor
+from src.utilitybox.auxiliar.operations_messages import log_rolled_back_writes
 from src.utilitybox.auxiliar.project_paths import get_project_icons_path
 
 __author__ = 'Dragos-Gabriel Enache'
@@ -85,12 +88,22 @@ class MainBox(ctk.CTk):
         self.clear_log_button = ctk.CTkButton(self.operation_frame, text='Clear log', font=('Helvetica', 12, 'bold'),
                                               fg_color='#00539C', text_color='white',
                                               command=lambda: self.update_log(False))
-        self.clear_log_button.grid(row=8, column=0, pady=(145, 0))
+        self.clear_log_button.grid(row=8, column=0, pady=(60, 0))
+
+        self.progress_text = ctk.CTkLabel(self.operation_frame, text='', font=('Helvetica', 11))
+        self.progress_text.grid(row=6, column=0, pady=(35, 0))
+        self.progress_bar = ctk.CTkProgressBar(self.operation_frame, width=140, progress_color='#00539C')
+        self.progress_bar.set(0)
+        self.progress_bar.grid(row=7, column=0, pady=(5, 0))
 
         self.log_frame = ctk.CTkScrollableFrame(master=self, width=580, height=360, corner_radius=20,
                                                 border_width=1, border_color='#474B4F')
         self.log_frame.grid(row=0, column=2, padx=15, pady=(13, 0))
 
+        # Operations run in the background so the window stays responsive
+        self.job_executor = JobExecutor(self)
+        self.protocol('WM_DELETE_WINDOW', self.close_application)
+
     # Create each window from
     def create_search_window(self):
         from frames.search_window import SearchWindow
@@ -152,10 +165,29 @@ class MainBox(ctk.CTk):
                 widget.destroy()
             self.number_entries = 0
 
+    def update_progress(self, progress_message: str, progress_fraction: float) -> None:
+        """
+        Updates the progress display of the running operations.
+
+        Parameters:
+            progress_message (str): The message describing the progress.
+            progress_fraction (float): The completed fraction of the work (between 0 and 1).
+        """
+        self.progress_text.configure(text=progress_message)
+        self.progress_bar.set(progress_fraction)
+
+    def close_application(self) -> None:
+        """
+        Closes the application. The operations that already started are completed in the background.
+        """
+        self.job_executor.shutdown()
+        self.destroy()
+
 
 if __name__ == '__main__':
     folder_configure = FoldersConfigure()
     folder_configure.check_folders_setup()
+    log_rolled_back_writes(recover_interrupted_writes())
 
     mainbox = MainBox()
     mainbox.mainloop()
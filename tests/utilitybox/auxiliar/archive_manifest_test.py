@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+import zipfile
+
+from src.utilitybox.auxiliar.archive_manifest import archive_chain, read_manifest, replay_manifests, write_manifest
+
+
+class TestArchiveManifest(unittest.TestCase):
+    """
+    Unit tests for the Archive Manifest module.
+    """
+
+    def setUp(self):
+        """
+        Create a chain of three incremental archives in a temporary folder.
+
+        The first archive stores 'a' and 'b', the second one changes 'a' and deletes 'b', and the third one
+        only records a new modification time for 'a' and adds 'c'.
+        """
+        self.temporary_folder = tempfile.TemporaryDirectory()
+        self.archive_paths = [os.path.join(self.temporary_folder.name, f'backup_{number}.zip') for number in range(3)]
+        manifests = [
+            ({'/data/a': self._entry('a', 1, True), '/data/b': self._entry('b', 1, True)}, []),
+            ({'/data/a': self._entry('a', 2, True)}, ['/data/b']),
+            ({'/data/a': self._entry('a', 3, False), '/data/c': self._entry('c', 1, True)}, []),
+        ]
+        previous_archive_path = ''
+        for archive_path, (files, deleted) in zip(self.archive_paths, manifests):
+            zipfile.ZipFile(archive_path, 'w').close()
+            write_manifest(archive_path, files, deleted, previous_archive_path)
+            previous_archive_path = archive_path
+
+    def tearDown(self):
+        self.temporary_folder.cleanup()
+
+    @staticmethod
+    def _entry(arcname: str, mtime_ns: int, stored: bool) -> dict:
+        return {'arcname': arcname, 'size': 1, 'mtime_ns': mtime_ns, 'hash': arcname, 'stored': stored}
+
+    def test_read_manifest(self):
+        """
+        Test the read_manifest function.
+
+        This method checks that the previous archive is linked by relative path and that archives
+        without a manifest are not incremental archives.
+        """
+        self.assertEqual(read_manifest(self.archive_paths[1])['previous'], 'backup_0.zip')
+        self.assertEqual(read_manifest(self.archive_paths[1])['deleted'], ['/data/b'])
+
+        plain_archive_path = os.path.join(self.temporary_folder.name, 'plain.zip')
+        zipfile.ZipFile(plain_archive_path, 'w').close()
+        self.assertIsNone(read_manifest(plain_archive_path))
+
+    def test_archive_chain(self):
+        """
+        Test the archive_chain function.
+
+        This method checks that the chain is returned from its first archive.
+        """
+        self.assertEqual([archive_path for archive_path, _ in archive_chain(self.archive_paths[2])],
+                         self.archive_paths)
+        self.assertEqual([archive_path for archive_path, _ in archive_chain(self.archive_paths[0])],
+                         self.archive_paths[:1])
+
+    def test_replay_manifests(self):
+        """
+        Test the replay_manifests function.
+
+        This method checks that the tombstones remove the deleted files, that the changed files point to
+        their latest archive and that the files whose content didn't change keep pointing to the archive
+        holding their content.
+        """
+        files_state = replay_manifests(self.archive_paths[2])
+
+        self.assertEqual(sorted(files_state), ['/data/a', '/data/c'])
+        self.assertEqual(files_state['/data/a']['archive'], self.archive_paths[1])
+        self.assertEqual(files_state['/data/a']['mtime_ns'], 3)
+        self.assertEqual(files_state['/data/c']['archive'], self.archive_paths[2])
+        self.assertIn('/data/b', replay_manifests(self.archive_paths[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src.utilitybox.auxiliar.atomic_writes import recover_interrupted_writes, replace_file_contents
+
+
+def _uppercase(source, destination):
+    destination.write(source.read().upper())
+    return 'completed'
+
+
+def _failing_transform(source, destination):
+    destination.write(b'partial contents')
+    raise ValueError('Transform failed')
+
+
+class TestAtomicWrites(unittest.TestCase):
+    """
+    Unit tests for the Atomic Writes module.
+    """
+
+    def setUp(self):
+        """
+        Create a file and a journal folder in a temporary folder.
+        """
+        self.temporary_folder = tempfile.TemporaryDirectory()
+        self.files_folder = os.path.join(self.temporary_folder.name, 'files')
+        self.journal_folder = os.path.join(self.temporary_folder.name, 'journal')
+        os.makedirs(self.files_folder)
+        self.file_path = os.path.join(self.files_folder, 'data.txt')
+        with open(self.file_path, 'wb') as file:
+            file.write(b'content')
+
+    def tearDown(self):
+        self.temporary_folder.cleanup()
+
+    def test_replace_file_contents(self):
+        """
+        Test the replace_file_contents function.
+
+        This method checks that the file is rewritten, that the result of the transform is returned
+        and that neither temporary files nor journal entries are left behind.
+        """
+        result = replace_file_contents(self.file_path, _uppercase, journal_folder=self.journal_folder)
+
+        self.assertEqual(result, 'completed')
+        with open(self.file_path, 'rb') as file:
+            self.assertEqual(file.read(), b'CONTENT')
+        self.assertEqual(os.listdir(self.files_folder), ['data.txt'])
+        self.assertEqual(os.listdir(self.journal_folder), [])
+
+    def test_replace_file_contents_failure(self):
+        """
+        Test the replace_file_contents function when the transform fails.
+
+        This method checks that the original file is left intact and that the temporary file is removed.
+        """
+        with self.assertRaises(ValueError):
+            replace_file_contents(self.file_path, _failing_transform, journal_folder=self.journal_folder)
+
+        with open(self.file_path, 'rb') as file:
+            self.assertEqual(file.read(), b'content')
+        self.assertEqual(os.listdir(self.files_folder), ['data.txt'])
+        self.assertEqual(os.listdir(self.journal_folder), [])
+
+    def test_recover_interrupted_writes(self):
+        """
+        Test the recover_interrupted_writes function after a simulated crash.
+
+        This method checks that the temporary file of an interrupted rewrite is removed, that a completed
+        rewrite is not reported, and that the journal is emptied.
+        """
+        os.makedirs(self.journal_folder)
+        temporary_path = os.path.join(self.files_folder, '.ubtmp_interrupted')
+        with open(temporary_path, 'wb') as temporary_file:
+            temporary_file.write(b'partial contents')
+        entries = {'interrupted.json': {'file_path': self.file_path, 'temporary_path': temporary_path,
+                                        'operation': 'Encryption'},
+                   'completed.json': {'file_path': self.file_path,
+                                      'temporary_path': os.path.join(self.files_folder, '.ubtmp_completed'),
+                                      'operation': 'Decryption'}}
+        for journal_name, entry in entries.items():
+            with open(os.path.join(self.journal_folder, journal_name), 'w') as journal_file:
+                json.dump(entry, journal_file)
+        with open(os.path.join(self.journal_folder, 'incomplete.json'), 'w') as journal_file:
+            journal_file.write('{"file_path": ')
+
+        self.assertEqual(recover_interrupted_writes(self.journal_folder), [('Encryption', self.file_path)])
+        self.assertEqual(os.listdir(self.files_folder), ['data.txt'])
+        self.assertEqual(os.listdir(self.journal_folder), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
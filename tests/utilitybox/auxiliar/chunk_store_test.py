@@ -0,0 +1,124 @@
+import io
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from src.utilitybox.auxiliar import chunk_store
+from src.utilitybox.auxiliar.chunk_store import MAX_CHUNK_SIZE, MIN_CHUNK_SIZE, ChunkStore, iter_chunks
+
+
+class TestChunkStore(unittest.TestCase):
+    """
+    Unit tests for the Chunk Store module.
+    """
+
+    def setUp(self):
+        """
+        Create a source file and a chunk store in a temporary folder.
+        """
+        self.temporary_folder = tempfile.TemporaryDirectory()
+        self.content = random.Random(0).randbytes(1024 * 1024)
+        self.source_path = os.path.join(self.temporary_folder.name, 'project.bin')
+        self._write_source(self.content)
+        self.chunk_store = ChunkStore(os.path.join(self.temporary_folder.name, 'backups.ubstore'))
+
+    def tearDown(self):
+        self.chunk_store.close()
+        self.temporary_folder.cleanup()
+
+    def _write_source(self, content: bytes) -> None:
+        with open(self.source_path, 'wb') as file:
+            file.write(content)
+
+    def _restored_content(self, snapshot_name: str = '') -> bytes:
+        destination_path = os.path.join(self.temporary_folder.name, 'restored_' + snapshot_name)
+        self.assertEqual(self.chunk_store.restore_snapshot(destination_path, snapshot_name), ['project.bin'])
+        with open(os.path.join(destination_path, 'project.bin'), 'rb') as file:
+            return file.read()
+
+    def test_iter_chunks(self):
+        """
+        Test the iter_chunks function.
+
+        This method checks that the chunks rebuild the data, respect the size bounds, and that inserting
+        bytes at the start of the data only changes the first chunk.
+        """
+        chunks = list(iter_chunks(io.BytesIO(self.content)))
+        shifted_chunks = list(iter_chunks(io.BytesIO(b'inserted' + self.content)))
+
+        self.assertEqual(b''.join(chunks), self.content)
+        self.assertTrue(all(MIN_CHUNK_SIZE <= len(chunk) <= MAX_CHUNK_SIZE for chunk in chunks[:-1]))
+        self.assertGreater(len(chunks), 4)
+        self.assertEqual(chunks[1:], shifted_chunks[1:])
+
+    def test_snapshots_share_chunks(self):
+        """
+        Test the create_snapshot method for a file changed between two snapshots.
+
+        This method checks that only the changed chunks are stored by the second snapshot, and that
+        both snapshots are restored with their own content.
+        """
+        stored_chunks, _ = self.chunk_store.create_snapshot('first', [(self.source_path, 'project.bin')])
+        changed_content = self.content[:500000] + b'changed' + self.content[500000:]
+        self._write_source(changed_content)
+
+        changed_chunks, changed_bytes = self.chunk_store.create_snapshot('second', [(self.source_path, 'project.bin')])
+
+        self.assertLessEqual(changed_chunks, 2)
+        self.assertLess(changed_bytes, len(self.content) // 2)
+        self.assertGreater(stored_chunks, changed_chunks)
+        self.assertEqual([name for name, _ in self.chunk_store.list_snapshots()], ['first', 'second'])
+        self.assertEqual(self._restored_content('first'), self.content)
+        self.assertEqual(self._restored_content(), changed_content)
+
+    def test_unchanged_file_not_read(self):
+        """
+        Test the create_snapshot method for a file that didn't change since the previous snapshot.
+
+        This method checks that the file isn't chunked again.
+        """
+        self.chunk_store.create_snapshot('first', [(self.source_path, 'project.bin')])
+
+        with mock.patch.object(chunk_store, 'iter_chunks') as mocked_iter_chunks:
+            self.assertEqual(self.chunk_store.create_snapshot('second', [(self.source_path, 'project.bin')]), (0, 0))
+        mocked_iter_chunks.assert_not_called()
+        self.assertEqual(self._restored_content('second'), self.content)
+
+    def test_packs_rotated(self):
+        """
+        Test the create_snapshot method when the chunks don't fit in a single pack.
+
+        This method checks that a new pack is started once the current one reaches the pack size, both
+        within a snapshot and for the next snapshot, and that the content is restored from all the packs.
+        """
+        packs_path = os.path.join(self.temporary_folder.name, 'backups.ubstore.packs')
+        with mock.patch.object(chunk_store, 'PACK_SIZE', 3 * MAX_CHUNK_SIZE // 4):
+            self.chunk_store.create_snapshot('first', [(self.source_path, 'project.bin')])
+            first_packs = sorted(os.listdir(packs_path))
+            self._write_source(random.Random(1).randbytes(512 * 1024))
+            self.chunk_store.create_snapshot('second', [(self.source_path, 'project.bin')])
+
+        pack_sizes = [os.path.getsize(os.path.join(packs_path, pack)) for pack in sorted(os.listdir(packs_path))]
+        self.assertGreater(len(first_packs), 1)
+        self.assertGreater(len(pack_sizes), len(first_packs))
+        self.assertTrue(all(3 * MAX_CHUNK_SIZE // 4 <= size < 7 * MAX_CHUNK_SIZE // 4 for size in pack_sizes[:-1]))
+        self.assertEqual(self._restored_content('first'), self.content)
+
+    def test_corrupted_chunk(self):
+        """
+        Test the read_chunk method for a chunk whose content was altered in its pack file.
+        """
+        self.chunk_store.create_snapshot('first', [(self.source_path, 'project.bin')])
+        pack_path = os.path.join(self.chunk_store.packs_path, os.listdir(self.chunk_store.packs_path)[0])
+        with open(pack_path, 'r+b') as pack_file:
+            pack_file.seek(10)
+            pack_file.write(b'corrupted')
+
+        with self.assertRaises(ValueError):
+            self._restored_content('first')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import os
+import tempfile
+import unittest
+
+from src.utilitybox.auxiliar.directory_walker import collect_files, is_excluded, walk_files
+
+
+class TestDirectoryWalker(unittest.TestCase):
+    """
+    Unit tests for the Directory Walker module.
+    """
+
+    def setUp(self):
+        """
+        Create a temporary folder tree with files located at different depths.
+        """
+        self.temporary_folder = tempfile.TemporaryDirectory()
+        self.root = self.temporary_folder.name
+        os.makedirs(os.path.join(self.root, 'level_1', 'level_2'))
+        os.makedirs(os.path.join(self.root, '.git'))
+        self.files = ['root.txt', os.path.join('level_1', 'first.txt'),
+                      os.path.join('level_1', 'level_2', 'second.txt'), os.path.join('.git', 'config')]
+        for relative_path in self.files:
+            with open(os.path.join(self.root, relative_path), 'w') as file:
+                file.write('content')
+
+    def tearDown(self):
+        self.temporary_folder.cleanup()
+
+    def walked_files(self, **walk_arguments) -> list[str]:
+        return sorted(os.path.relpath(entry.path, self.root) for entry in walk_files(self.root, **walk_arguments))
+
+    def test_walk_files_recursive(self):
+        """
+        Test the walk_files function over the whole tree.
+
+        This function checks that the files of every folder are yielded exactly once.
+        """
+        self.assertEqual(self.walked_files(), sorted(self.files))
+
+    def test_walk_files_not_recursive(self):
+        """
+        Test the walk_files function on a single folder.
+
+        This function checks that only the files of the walked folder are yielded.
+        """
+        self.assertEqual(self.walked_files(recursive=False), ['root.txt'])
+
+    def test_walk_files_max_depth_and_exclude_patterns(self):
+        """
+        Test the walk_files function with a depth limit and exclude patterns.
+
+        This function checks that the folders deeper than the limit and the excluded names are skipped.
+        """
+        self.assertEqual(self.walked_files(max_depth=1, exclude_patterns=['.git']),
+                         sorted(['root.txt', os.path.join('level_1', 'first.txt')]))
+
+    def test_walk_files_small_queue(self):
+        """
+        Test the walk_files function when the entries queue holds a single batch.
+
+        This function checks that the walk is not blocked by a full queue.
+        """
+        self.assertEqual(self.walked_files(max_workers=2, queue_size=1), sorted(self.files))
+
+    def test_walk_files_stopped_early(self):
+        """
+        Test the walk_files function when the iterator is closed before it is exhausted.
+
+        This function checks that closing the iterator stops the walk.
+        """
+        walk = walk_files(self.root, queue_size=1)
+        next(walk)
+        walk.close()
+
+    def test_is_excluded(self):
+        """
+        Test the is_excluded function.
+
+        This function checks that names are matched against shell-style patterns.
+        """
+        self.assertTrue(is_excluded('build.tmp', ['*.tmp']))
+        self.assertFalse(is_excluded('build.txt', ['*.tmp', '.git']))
+
+    def test_collect_files(self):
+        """
+        Test the collect_files function for a file path and for a folder path.
+
+        This function checks that a file is provided as it is, and that the files of a folder are
+        filtered by extension.
+        """
+        file_path = os.path.join(self.root, 'root.txt')
+        self.assertEqual(list(collect_files(file_path, ['csv'])), [file_path])
+        self.assertEqual(sorted(collect_files(self.root, ['txt'], recursive=False)), [file_path])
+        self.assertEqual(sorted(os.path.relpath(path, self.root) for path in collect_files(self.root, ['txt'])),
+                         sorted(self.files[:3]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 
-from src.utilitybox.auxiliar.extension_operations import split_extensions, group_files_by_extensions
+from src.utilitybox.auxiliar.extension_operations import split_extensions, group_files_by_extensions, iterate_in_batches
 
 
 class TestExtensionOperations(unittest.TestCase):
@@ -73,6 +73,45 @@ class TestExtensionOperations(unittest.TestCase):
 
         self.assertEqual(result, expected_output)
 
+    def test_group_files_by_extensions_iterator_input(self):
+        """
+        Test the group_files_by_extensions function with an iterator as input.
+
+        The files should be grouped the same way as when a list is provided.
+        """
+        files_iterator = iter(['report.txt', 'image.jpg', 'notes.txt'])
+        expected_output = {
+            'txt': ['report', 'notes'],
+            'jpg': ['image'],
+        }
+
+        result = group_files_by_extensions(files_iterator)
+
+        self.assertEqual(result, expected_output)
+
+    def test_iterate_in_batches(self):
+        """
+        Test the iterate_in_batches function.
+
+        This function splits an iterable into lists of bounded size, the last one holding the remainder.
+        """
+        files_iterator = (f'file{index}.txt' for index in range(5))
+        expected_output = [['file0.txt', 'file1.txt'], ['file2.txt', 'file3.txt'], ['file4.txt']]
+
+        result = list(iterate_in_batches(files_iterator, 2))
+
+        self.assertEqual(result, expected_output)
+
+    def test_iterate_in_batches_empty_input(self):
+        """
+        Test the iterate_in_batches function with an empty input.
+
+        An empty input should result in no batches.
+        """
+        result = list(iterate_in_batches([], 2))
+
+        self.assertEqual(result, [])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,171 @@
+import os
+import tempfile
+import unittest
+
+from src.utilitybox.auxiliar.file_index import FileIndex
+
+
+class TestFileIndex(unittest.TestCase):
+    """
+    Unit tests for the File Index module.
+    """
+
+    def setUp(self):
+        """
+        Create a temporary folder tree and an index database outside of it.
+        """
+        self.temporary_folder = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.temporary_folder.name, 'root')
+        os.makedirs(os.path.join(self.root, 'reports', '2023'))
+        for relative_path in ['notes.txt', 'data.csv', os.path.join('reports', 'report_1.txt'),
+                              os.path.join('reports', '2023', 'report_2.txt'),
+                              os.path.join('reports', '2023', 'logs.tar.gz')]:
+            with open(os.path.join(self.root, relative_path), 'w') as file:
+                file.write('content')
+        self.file_index = FileIndex(os.path.join(self.temporary_folder.name, 'index.db'))
+
+    def tearDown(self):
+        self.file_index.close()
+        self.temporary_folder.cleanup()
+
+    def test_search_by_extension(self):
+        """
+        Test the search_by_extension method.
+
+        This method checks that only the files of the searched folder are returned when not recursive,
+        and that the files of the subfolders are returned as relative paths when recursive.
+        """
+        self.file_index.refresh(self.root)
+
+        self.assertEqual(list(self.file_index.search_by_extension(self.root, 'txt')), ['notes.txt'])
+        self.assertEqual(sorted(self.file_index.search_by_extension(self.root, 'txt', recursive=True)),
+                         sorted(['notes.txt', os.path.join('reports', 'report_1.txt'),
+                                 os.path.join('reports', '2023', 'report_2.txt')]))
+        self.assertEqual(list(self.file_index.search_by_extension(self.root, 'tar.gz', recursive=True)),
+                         [os.path.join('reports', '2023', 'logs.tar.gz')])
+
+    def test_search_by_name(self):
+        """
+        Test the search_by_name method.
+
+        This method checks that the files whose name contains the keyword are found, optionally
+        filtered by extension.
+        """
+        self.file_index.refresh(self.root)
+
+        self.assertEqual(sorted(self.file_index.search_by_name(self.root, 'report', recursive=True)),
+                         sorted([os.path.join('reports', 'report_1.txt'),
+                                 os.path.join('reports', '2023', 'report_2.txt')]))
+        self.assertEqual(list(self.file_index.search_by_name(self.root, 'report', 'csv', recursive=True)), [])
+
+    def test_search_by_name_with_trigrams(self):
+        """
+        Test the search_by_name method when the trigram index is used.
+
+        This method checks that the trigram index finds the same files as a full scan, including keywords
+        shorter than a trigram, and that the trigrams of removed files are dropped on refresh.
+        """
+        self.file_index.close()
+        self.file_index = FileIndex(os.path.join(self.temporary_folder.name, 'index.db'), use_trigrams=True)
+        self.file_index.refresh(self.root)
+
+        self.assertEqual(sorted(self.file_index.search_by_name(self.root, 'port_', recursive=True)),
+                         sorted([os.path.join('reports', 'report_1.txt'),
+                                 os.path.join('reports', '2023', 'report_2.txt')]))
+        self.assertEqual(list(self.file_index.search_by_name(self.root, 'no')), ['notes.txt'])
+        self.assertEqual(list(self.file_index.search_by_name(self.root, 'Notes')), [])
+
+        os.remove(os.path.join(self.root, 'notes.txt'))
+        self.file_index.refresh(self.root)
+
+        self.assertEqual(list(self.file_index.search_by_name(self.root, 'notes')), [])
+        indexed_file_ids = {row[0] for row in self.file_index.connection.execute('SELECT id FROM files')}
+        trigram_file_ids = {row[0] for row in self.file_index.connection.execute('SELECT file_id FROM trigrams')}
+        self.assertEqual(trigram_file_ids, indexed_file_ids)
+
+    def test_trigrams_built_for_existing_index(self):
+        """
+        Test enabling the trigram index on an index that was built without it.
+
+        This method checks that the trigrams of the already indexed files are built and that
+        the trigram index stays enabled for later uses of the database.
+        """
+        self.file_index.refresh(self.root)
+        self.file_index.close()
+
+        index_path = os.path.join(self.temporary_folder.name, 'index.db')
+        with FileIndex(index_path, use_trigrams=True) as file_index:
+            self.assertEqual(list(file_index.search_by_name(self.root, 'data')), ['data.csv'])
+
+        self.file_index = FileIndex(index_path)
+        self.assertTrue(self.file_index.use_trigrams)
+
+    def test_generate_trigrams(self):
+        """
+        Test the generate_trigrams method.
+
+        This method checks that the lowercased sequences of three consecutive characters are returned.
+        """
+        self.assertEqual(FileIndex.generate_trigrams('Data'), {'dat', 'ata'})
+        self.assertEqual(FileIndex.generate_trigrams('ab'), set())
+
+    def test_refresh_is_incremental(self):
+        """
+        Test the refresh method after the folder tree changed.
+
+        This method checks that added and removed files and folders are reflected in the index.
+        """
+        self.file_index.refresh(self.root)
+
+        os.remove(os.path.join(self.root, 'notes.txt'))
+        with open(os.path.join(self.root, 'reports', 'summary.txt'), 'w') as file:
+            file.write('content')
+        os.remove(os.path.join(self.root, 'reports', '2023', 'report_2.txt'))
+        os.remove(os.path.join(self.root, 'reports', '2023', 'logs.tar.gz'))
+        os.rmdir(os.path.join(self.root, 'reports', '2023'))
+        self.file_index.refresh(self.root)
+
+        self.assertEqual(sorted(self.file_index.search_by_extension(self.root, 'txt', recursive=True)),
+                         sorted([os.path.join('reports', 'report_1.txt'), os.path.join('reports', 'summary.txt')]))
+        folders = [row[0] for row in self.file_index.connection.execute('SELECT path FROM folders')]
+        self.assertNotIn(os.path.join(self.root, 'reports', '2023'), folders)
+
+    def test_refresh_skips_unchanged_folders(self):
+        """
+        Test the refresh method when the folder tree did not change.
+
+        This method checks that unchanged folders are not listed again.
+        """
+        self.file_index.refresh(self.root)
+
+        listed_folders = []
+        original_index_folder = self.file_index._index_folder
+
+        def tracked_index_folder(folder_path, folder_mtime_ns):
+            listed_folders.append(folder_path)
+            return original_index_folder(folder_path, folder_mtime_ns)
+
+        self.file_index._index_folder = tracked_index_folder
+        self.file_index.refresh(self.root)
+
+        self.assertEqual(listed_folders, [])
+
+
+    def test_recursive_refresh_after_non_recursive_refresh(self):
+        """
+        Test a recursive search after a non-recursive refresh of the same folder.
+
+        This method checks that the subfolders found by the non-recursive refresh are listed by the
+        recursive refresh, although the searched folder itself didn't change.
+        """
+        self.file_index.refresh(self.root, recursive=False)
+        self.assertEqual(list(self.file_index.search_by_extension(self.root, 'txt', recursive=True)), ['notes.txt'])
+
+        self.file_index.refresh(self.root, recursive=True)
+
+        self.assertEqual(sorted(self.file_index.search_by_extension(self.root, 'txt', recursive=True)),
+                         sorted(['notes.txt', os.path.join('reports', 'report_1.txt'),
+                                 os.path.join('reports', '2023', 'report_2.txt')]))
+
+if __name__ == '__main__':
+    unittest.main()
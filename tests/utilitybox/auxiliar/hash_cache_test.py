@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+
+from src.utilitybox.auxiliar.hash_cache import HashCache
+
+
+class TestHashCache(unittest.TestCase):
+    """
+    Unit tests for the Hash Cache module.
+    """
+
+    def setUp(self):
+        """
+        Create a hash cache database in a temporary folder.
+        """
+        self.temporary_folder = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.temporary_folder.name, 'hash_cache.db')
+        self.hash_cache = HashCache(self.cache_path)
+
+    def tearDown(self):
+        self.hash_cache.close()
+        self.temporary_folder.cleanup()
+
+    def test_load_stored_hash(self):
+        """
+        Test the load_hash method for a file that didn't change.
+
+        This method checks that the stored hash is returned for the same kind, size and modification time.
+        """
+        self.hash_cache.store_hash('/data/file.bin', 'full', 10, 1000, 'abc')
+
+        self.assertEqual(self.hash_cache.load_hash('/data/file.bin', 'full', 10, 1000), 'abc')
+        self.assertIsNone(self.hash_cache.load_hash('/data/file.bin', 'partial', 10, 1000))
+
+    def test_load_outdated_hash(self):
+        """
+        Test the load_hash method for a file that changed since its hash was stored.
+
+        This method checks that no hash is returned when the size or the modification time differ.
+        """
+        self.hash_cache.store_hash('/data/file.bin', 'full', 10, 1000, 'abc')
+
+        self.assertIsNone(self.hash_cache.load_hash('/data/file.bin', 'full', 11, 1000))
+        self.assertIsNone(self.hash_cache.load_hash('/data/file.bin', 'full', 10, 2000))
+
+    def test_hashes_persisted(self):
+        """
+        Test that the stored hashes are available after the cache is closed and opened again.
+        """
+        self.hash_cache.store_hash('/data/file.bin', 'partial', 10, 1000, 'abc')
+        self.hash_cache.close()
+
+        self.hash_cache = HashCache(self.cache_path)
+
+        self.assertEqual(self.hash_cache.load_hash('/data/file.bin', 'partial', 10, 1000), 'abc')
+
+
+if __name__ == '__main__':
+    unittest.main()
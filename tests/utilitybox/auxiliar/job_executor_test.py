@@ -0,0 +1,60 @@
+import unittest
+from unittest.mock import Mock
+
+from src.utilitybox.auxiliar.job_executor import JobExecutor
+
+
+class TestJobExecutor(unittest.TestCase):
+    """
+    Unit tests for the Job Executor module.
+    """
+
+    def setUp(self):
+        """
+        Create a job executor for a mocked MainBox.
+        """
+        self.mainbox = Mock()
+        self.job_executor = JobExecutor(self.mainbox, max_jobs=2)
+
+    def tearDown(self):
+        self.job_executor.shutdown()
+
+    def test_messages_replayed_on_mainbox(self):
+        """
+        Test the process_messages method after an operation ran in the background.
+
+        This method checks that the MainBox is only updated by the main loop, with the messages
+        sent by the operation and the progress of the submitted operations.
+        """
+
+        def operation(mainbox, log_message):
+            mainbox.update_log(True, log_message, '#FFFFFF')
+
+        self.job_executor.submit(operation, 'Operation completed')
+        self.job_executor.executor.shutdown(wait=True)
+        self.mainbox.update_log.assert_not_called()
+
+        self.job_executor.process_messages()
+
+        self.mainbox.update_log.assert_called_once_with(True, 'Operation completed', '#FFFFFF')
+        self.mainbox.update_progress.assert_called_with('Running operations: 0', 1.0)
+        self.mainbox.after.assert_called_with(100, self.job_executor.process_messages)
+
+    def test_failed_operation_completed(self):
+        """
+        Test the submit method for an operation raising an exception.
+
+        This method checks that the failure doesn't stop the executor from running other operations.
+        """
+
+        def failing_operation(mainbox):
+            raise ValueError('Invalid parameters')
+
+        failed_job = self.job_executor.submit(failing_operation)
+        self.assertIsInstance(failed_job.exception(), ValueError)
+
+        self.assertEqual(self.job_executor.submit(lambda mainbox: 'completed').result(), 'completed')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+from src.utilitybox.auxiliar.key_derivation import derive_file_key, derive_master_key, generate_kdf_params
+
+
+class TestKeyDerivation(unittest.TestCase):
+    """
+    Unit tests for the Key Derivation module.
+    """
+
+    def setUp(self):
+        derive_master_key.cache_clear()
+        self.kdf_params = generate_kdf_params()
+
+    def test_derive_file_key(self):
+        """
+        Test the derive_file_key function.
+
+        This method checks that the derivation is deterministic, and that the key depends on the
+        passphrase, on the derivation parameters and on the file identifier.
+        """
+        file_key = derive_file_key('passphrase', self.kdf_params, b'\x01' * 16)
+
+        self.assertEqual(len(file_key), 44)
+        self.assertEqual(derive_file_key('passphrase', self.kdf_params, b'\x01' * 16), file_key)
+        self.assertNotEqual(derive_file_key('passphrase', self.kdf_params, b'\x02' * 16), file_key)
+        self.assertNotEqual(derive_file_key('other passphrase', self.kdf_params, b'\x01' * 16), file_key)
+        self.assertNotEqual(derive_file_key('passphrase', generate_kdf_params(), b'\x01' * 16), file_key)
+
+    def test_master_key_cached(self):
+        """
+        Test that the master key is only derived once for the files sharing the derivation parameters.
+        """
+        for file_index in range(100):
+            derive_file_key('passphrase', self.kdf_params, file_index.to_bytes(16, 'big'))
+
+        cache_info = derive_master_key.cache_info()
+        self.assertEqual(cache_info.misses, 1)
+        self.assertEqual(cache_info.hits, 99)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+
+from src.utilitybox.auxiliar.keystore import KeyStore
+
+
+class TestKeyStore(unittest.TestCase):
+    """
+    Unit tests for the Key Store module.
+    """
+
+    def setUp(self):
+        """
+        Create a keystore database in a temporary folder.
+        """
+        self.temporary_folder = tempfile.TemporaryDirectory()
+        self.keystore_path = os.path.join(self.temporary_folder.name, 'keystore.db')
+        self.keystore = KeyStore(self.keystore_path)
+
+    def tearDown(self):
+        self.keystore.close()
+        self.temporary_folder.cleanup()
+
+    def test_store_and_remove_key(self):
+        """
+        Test the store_key, load_key and remove_key methods.
+
+        This method checks that files with the same name keep their own keys and that a removed key
+        can no longer be loaded.
+        """
+        self.keystore.store_key(b'\x01' * 16, b'first key', 'report.txt')
+        self.keystore.store_key(b'\x02' * 16, b'second key', 'report.txt')
+
+        self.assertEqual(self.keystore.load_key(b'\x01' * 16), b'first key')
+        self.assertEqual(self.keystore.load_key(b'\x02' * 16), b'second key')
+
+        self.keystore.remove_key(b'\x01' * 16)
+
+        self.assertIsNone(self.keystore.load_key(b'\x01' * 16))
+        self.assertEqual(self.keystore.load_key(b'\x02' * 16), b'second key')
+
+    def test_export_and_import_keys(self):
+        """
+        Test the export_keys and import_keys methods.
+
+        This method checks that the exported keys are available in another keystore after the import.
+        """
+        for index in range(5):
+            self.keystore.store_key(bytes([index]) * 16, f'key {index}'.encode(), f'file_{index}.txt')
+        export_path = os.path.join(self.temporary_folder.name, 'keys.jsonl')
+
+        self.assertEqual(self.keystore.export_keys(export_path), 5)
+
+        with KeyStore(os.path.join(self.temporary_folder.name, 'other_keystore.db')) as other_keystore:
+            self.assertEqual(other_keystore.import_keys(export_path), 5)
+            self.assertEqual(other_keystore.load_key(bytes([3]) * 16), b'key 3')
+
+    def test_compact(self):
+        """
+        Test the compact method.
+
+        This method checks that the keystore is only rebuilt once enough keys were removed.
+        """
+        for index in range(2000):
+            self.keystore.store_key(index.to_bytes(16, 'big'), os.urandom(44), f'file_{index}.txt')
+
+        self.assertFalse(self.keystore.compact())
+
+        for index in range(1500):
+            self.keystore.remove_key(index.to_bytes(16, 'big'))
+
+        self.assertTrue(self.keystore.compact())
+        self.assertIsNotNone(self.keystore.load_key((1999).to_bytes(16, 'big')))
+
+
+if __name__ == '__main__':
+    unittest.main()
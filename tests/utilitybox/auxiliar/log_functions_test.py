@@ -1,8 +1,12 @@
 import logging
+import os
+import tempfile
 import unittest
+from datetime import date
 from unittest.mock import patch
 
-from src.utilitybox.auxiliar.log_functions import formatting_log, update_file_log
+from src.utilitybox.auxiliar import log_functions
+from src.utilitybox.auxiliar.log_functions import close_file_logs, formatting_log, update_file_log
 
 
 class TestLoggingFunctions(unittest.TestCase):
@@ -10,26 +14,92 @@ class TestLoggingFunctions(unittest.TestCase):
     Unit tests for the Logging Functions module.
     """
 
-    @patch('logging.basicConfig')
-    def test_formatting_log(self, mock_basic_config):
+    def setUp(self):
+        """
+        Redirect the log folders to a temporary folder.
+        """
+        self.temporary_folder = tempfile.TemporaryDirectory()
+        self.month_folder_path = os.path.join(self.temporary_folder.name, 'Month')
+        self.patches = [
+            patch('src.utilitybox.auxiliar.log_functions.FoldersConfigure.check_folders_setup'),
+            patch('src.utilitybox.auxiliar.log_functions.FoldersConfigure.generate_default_month_folder_path',
+                  return_value=self.month_folder_path),
+            patch('src.utilitybox.auxiliar.log_functions.FoldersConfigure.give_log_name',
+                  return_value='1_ublog.txt')
+        ]
+        self.mock_check_folders_setup = self.patches[0].start()
+        for other_patch in self.patches[1:]:
+            other_patch.start()
+        close_file_logs()
+        log_functions._category_loggers_date = None
+
+    def tearDown(self):
+        close_file_logs()
+        for started_patch in self.patches:
+            started_patch.stop()
+        self.temporary_folder.cleanup()
+
+    @staticmethod
+    def _get_file_handler(operation_specific_identifier):
+        category_logger = log_functions._category_loggers[operation_specific_identifier]
+        return next(handler for handler in category_logger.handlers if isinstance(handler, logging.FileHandler))
+
+    def test_formatting_log(self):
         """
         Test the formatting_log function.
 
-        This function checks if the 'formatting_log' method correctly calls 'logging.basicConfig'
-        with the provided file path, format, and default settings.
+        This function checks if the 'formatting_log' method returns a handler writing in the provided
+        file path, with the provided format and the default settings.
         """
-        file_path = '/path/to/logfile.log'
+        file_path = os.path.join(self.temporary_folder.name, 'logfile.log')
         provided_format = '%(asctime)s %(levelname)s: %(message)s'
 
-        formatting_log(file_path, provided_format)
+        file_handler = formatting_log(file_path, provided_format)
+        file_handler.close()
+
+        self.assertEqual(file_handler.baseFilename, file_path)
+        self.assertEqual(file_handler.formatter._fmt, provided_format)
+        self.assertEqual(file_handler.formatter.datefmt, '%d/%m/%Y %H:%M:%S')
+        self.assertEqual(file_handler.level, logging.INFO)
+
+    def test_update_file_log(self):
+        """
+        Test the update_file_log function.
+
+        This function checks that the messages are appended to the log file of their category and that
+        the folders setup is only checked once for several messages of the same day.
+        """
+        update_file_log('First message', 'Search')
+        update_file_log('Second message', 'Search')
+        update_file_log('Third message', 'Sort')
+        close_file_logs()
+
+        with open(os.path.join(self.month_folder_path, 'Search', '1_ublog.txt')) as log_file:
+            search_log = log_file.read()
+        with open(os.path.join(self.month_folder_path, 'Sort', '1_ublog.txt')) as log_file:
+            sort_log = log_file.read()
+        self.assertIn('INFO: First message', search_log)
+        self.assertIn('INFO: Second message', search_log)
+        self.assertNotIn('Third message', search_log)
+        self.assertIn('INFO: Third message', sort_log)
+        self.mock_check_folders_setup.assert_called_once()
+
+    def test_update_file_log_rolls_over(self):
+        """
+        Test the update_file_log function when the date changes.
+
+        This function checks that the folders setup is checked again and the log files are reopened.
+        """
+        update_file_log('First message', 'Search')
+        handler = self._get_file_handler('Search')
+
+        with patch('src.utilitybox.auxiliar.log_functions.date') as mock_date:
+            mock_date.today.return_value = date(2100, 1, 1)
+            update_file_log('Second message', 'Search')
 
-        mock_basic_config.assert_called_once_with(
-            force=True,
-            filename=file_path,
-            format=provided_format,
-            level=logging.INFO,
-            datefmt='%d/%m/%Y %H:%M:%S'
-        )
+        self.assertIsNone(handler.stream)
+        self.assertIsNot(self._get_file_handler('Search'), handler)
+        self.assertEqual(self.mock_check_folders_setup.call_count, 2)
 
 
 if __name__ == '__main__':
@@ -3,6 +3,8 @@ from unittest.mock import patch
 
 from src.utilitybox.auxiliar.operations_messages import (
     log_basic_operation_results,
+    log_streamed_operation_results,
+    log_content_search_results,
     log_compressing_results,
     log_decompressing_results,
 )
@@ -33,6 +35,82 @@ class TestOperationsMessages(unittest.TestCase):
         )
         mock_update_file_log.assert_called_once_with(expected_log_message, operation_specific_identifier)
 
+    @patch('src.utilitybox.auxiliar.operations_messages.update_file_log')
+    def test_log_streamed_operation_results(self, mock_update_file_log):
+        """
+        Test the log_streamed_operation_results function.
+
+        This function checks if the results produced by an iterator are logged in bounded batches,
+        each batch being a separate log entry, and that the success status code is returned.
+        """
+        operation_specific_identifier = 'sort'
+        files = iter(['file1.txt', 'file2.txt', 'image.jpg'])
+
+        results_id = log_streamed_operation_results(operation_specific_identifier, files, batch_size=2)
+
+        self.assertEqual(results_id, 200)
+        self.assertEqual(mock_update_file_log.call_count, 2)
+        mock_update_file_log.assert_any_call(
+            '[SORT: 200]:\n\tSorted the following files:'
+            '\n\t\tFiles of type: txt\n\t\t\tfile1\n\t\t\tfile2', operation_specific_identifier)
+        mock_update_file_log.assert_any_call(
+            '[SORT: 200]:\n\tSorted the following files:'
+            '\n\t\tFiles of type: jpg\n\t\t\timage', operation_specific_identifier)
+
+    @patch('src.utilitybox.auxiliar.operations_messages.update_file_log')
+    def test_log_streamed_operation_results_no_files(self, mock_update_file_log):
+        """
+        Test the log_streamed_operation_results function when the operation produced no results.
+
+        This function checks if a single entry is logged and the no content status code is returned.
+        """
+        results_id = log_streamed_operation_results('delete', iter([]))
+
+        self.assertEqual(results_id, 204)
+        mock_update_file_log.assert_called_once_with('[DELETE: 204]:\n\tDeleted the following files:\n\t\tNone',
+                                                     'delete')
+
+    @patch('builtins.print')
+    @patch('src.utilitybox.auxiliar.operations_messages.update_file_log')
+    def test_log_streamed_operation_results_interrupted(self, mock_update_file_log, mock_print):
+        """
+        Test the log_streamed_operation_results function when the operation fails midway.
+
+        This function checks if the files produced before the error are logged, including those of the
+        incomplete batch, and that the success status code is returned since files were already changed.
+        """
+        def delete_files():
+            yield from ['file1.txt', 'file2.txt', 'image.jpg']
+            raise PermissionError('report.pdf')
+
+        results_id = log_streamed_operation_results('delete', delete_files(), batch_size=2)
+
+        self.assertEqual(results_id, 200)
+        self.assertEqual(mock_update_file_log.call_count, 2)
+        mock_update_file_log.assert_called_with(
+            '[DELETE: 200]:\n\tDeleted the following files:'
+            '\n\t\tFiles of type: jpg\n\t\t\timage', 'delete')
+        mock_print.assert_called_once_with('Delete Error: \n\treport.pdf')
+
+    @patch('src.utilitybox.auxiliar.operations_messages.update_file_log')
+    def test_log_content_search_results(self, mock_update_file_log):
+        """
+        Test the log_content_search_results function.
+
+        This function checks if the occurrences are grouped by file and the success status code is returned.
+        """
+        matches = iter([('notes.txt', 1, 0), ('notes.txt', 4, 52), ('report.md', 2, 10)])
+
+        results_id = log_content_search_results('search', matches)
+
+        expected_log_message = (
+            '[SEARCH: 200]:\n\tFound the following matches:'
+            '\n\t\tnotes.txt\n\t\t\tLine 1 (offset 0)\n\t\t\tLine 4 (offset 52)'
+            '\n\t\treport.md\n\t\t\tLine 2 (offset 10)'
+        )
+        self.assertEqual(results_id, 200)
+        mock_update_file_log.assert_called_once_with(expected_log_message, 'search')
+
     @patch('src.utilitybox.auxiliar.operations_messages.update_file_log')
     @patch('src.utilitybox.auxiliar.project_paths.get_system_path', return_value="/default/destination")
     def test_log_compressing_results(self, mock_get_system_path, mock_update_file_log):
@@ -0,0 +1,188 @@
+import os
+import tempfile
+import unittest
+import zipfile
+import zlib
+from unittest import mock
+
+from src.utilitybox.auxiliar import parallel_zip
+from src.utilitybox.auxiliar.parallel_zip import (crc32_combine, extract_parallel_zip, member_target_path,
+                                                   write_parallel_zip)
+
+
+class TestParallelZip(unittest.TestCase):
+    """
+    Unit tests for the Parallel ZIP module.
+    """
+
+    def setUp(self):
+        """
+        Create files of various sizes in a temporary folder.
+        """
+        self.temporary_folder = tempfile.TemporaryDirectory()
+        self.files = {}
+        for file_name, file_size in [('empty.txt', 0), ('small.txt', 100), ('large.bin', 50000)]:
+            file_path = os.path.join(self.temporary_folder.name, file_name)
+            with open(file_path, 'wb') as file:
+                file.write((os.urandom(300) * (file_size // 300 + 1))[:file_size])
+            self.files[file_path] = file_name
+        self.archive_path = os.path.join(self.temporary_folder.name, 'archive.zip')
+
+    def tearDown(self):
+        self.temporary_folder.cleanup()
+
+    def test_crc32_combine(self):
+        """
+        Test the crc32_combine function.
+
+        This method checks that the combined CRC-32 is the CRC-32 of the concatenated blocks.
+        """
+        first_block, second_block = b'first block', os.urandom(5000)
+
+        self.assertEqual(crc32_combine(zlib.crc32(first_block), zlib.crc32(second_block), len(second_block)),
+                         zlib.crc32(first_block + second_block))
+
+    def test_write_parallel_zip(self):
+        """
+        Test the write_parallel_zip function for every compression method.
+
+        This method checks that the archive is valid, that the files are split in several chunks and
+        that the content and the compression method of every member are the expected ones.
+        """
+        with mock.patch.object(parallel_zip, 'CHUNK_SIZE', 4096):
+            for compression, compress_type in parallel_zip.COMPRESSION_METHODS.items():
+                with self.subTest(compression=compression):
+                    write_parallel_zip(self.archive_path, self.files.items(), compression, max_workers=3)
+
+                    with zipfile.ZipFile(self.archive_path) as archive:
+                        self.assertIsNone(archive.testzip())
+                        self.assertEqual(archive.namelist(), list(self.files.values()))
+                        for file_path, arcname in self.files.items():
+                            self.assertEqual(archive.getinfo(arcname).compress_type, compress_type)
+                            with open(file_path, 'rb') as file:
+                                self.assertEqual(archive.read(arcname), file.read())
+
+    def test_write_parallel_zip_changed_file(self):
+        """
+        Test the write_parallel_zip function when the files change size while they are compressed.
+
+        This method checks that the archive is valid and that the sizes recorded for every member are the
+        ones of the content actually compressed, whether the file grew or shrank after it was examined.
+        """
+        member_jobs = parallel_zip._member_jobs
+        large_file_path = os.path.join(self.temporary_folder.name, 'large.bin')
+        small_file_path = os.path.join(self.temporary_folder.name, 'small.txt')
+
+        def change_file_then_compress(executor, file_path, *args):
+            # The member was already examined, so its size changes before its content is read
+            if file_path == large_file_path:
+                with open(file_path, 'ab') as file:
+                    file.write(os.urandom(10000))
+            elif file_path == small_file_path:
+                os.truncate(file_path, 40)
+            return member_jobs(executor, file_path, *args)
+
+        with mock.patch.object(parallel_zip, 'CHUNK_SIZE', 4096), \
+                mock.patch.object(parallel_zip, '_member_jobs', side_effect=change_file_then_compress):
+            for compression in parallel_zip.COMPRESSION_METHODS:
+                with self.subTest(compression=compression):
+                    original_sizes = {file_path: os.path.getsize(file_path) for file_path in self.files}
+                    write_parallel_zip(self.archive_path, self.files.items(), compression, max_workers=3)
+
+                    with zipfile.ZipFile(self.archive_path) as archive:
+                        self.assertIsNone(archive.testzip())
+                        for file_path, arcname in self.files.items():
+                            with open(file_path, 'rb') as file:
+                                content = file.read()
+                            self.assertEqual(archive.getinfo(arcname).file_size, len(content))
+                            self.assertEqual(archive.read(arcname), content)
+                    self.assertGreater(os.path.getsize(large_file_path), original_sizes[large_file_path])
+
+    def test_write_parallel_zip_failure(self):
+        """
+        Test the write_parallel_zip function when a file can't be read.
+
+        This method checks that the error is raised and that no partial archive is left.
+        """
+        members = list(self.files.items()) + [(os.path.join(self.temporary_folder.name, 'missing'), 'missing')]
+
+        with self.assertRaises(FileNotFoundError):
+            write_parallel_zip(self.archive_path, members)
+        self.assertFalse(os.path.exists(self.archive_path))
+
+    def test_write_parallel_zip_split(self):
+        """
+        Test the write_parallel_zip function when the archive is split in volumes.
+
+        This method checks that the volumes have the requested size and that the archive is read and
+        extracted from its first volume.
+        """
+        volume_paths = write_parallel_zip(self.archive_path, self.files.items(), 'stored', volume_size=20000)
+
+        self.assertEqual(volume_paths, [f'{self.archive_path}.00{number}' for number in (1, 2, 3)])
+        self.assertEqual([os.path.getsize(volume) for volume in volume_paths[:-1]], [20000, 20000])
+        self.assertFalse(os.path.exists(self.archive_path))
+        destination_path = os.path.join(self.temporary_folder.name, 'extracted')
+        self.assertEqual(extract_parallel_zip(volume_paths[0], destination_path), list(self.files.values()))
+        for file_path, arcname in self.files.items():
+            with open(file_path, 'rb') as file, open(os.path.join(destination_path, arcname), 'rb') as extracted:
+                self.assertEqual(extracted.read(), file.read())
+
+    def test_extract_parallel_zip(self):
+        """
+        Test the extract_parallel_zip function.
+
+        This method checks that every member is extracted with its folders, that the selected members
+        only are extracted when specified, and that the names are returned in archive order.
+        """
+        members = [(file_path, 'folder/' + arcname) for file_path, arcname in self.files.items()]
+        write_parallel_zip(self.archive_path, members)
+        destination_path = os.path.join(self.temporary_folder.name, 'extracted')
+
+        extracted_members = extract_parallel_zip(self.archive_path, destination_path, max_workers=3)
+
+        self.assertEqual(extracted_members, [arcname for _, arcname in members])
+        for file_path, arcname in members:
+            with open(file_path, 'rb') as file, open(os.path.join(destination_path, arcname), 'rb') as extracted:
+                self.assertEqual(extracted.read(), file.read())
+
+        selected_destination_path = os.path.join(self.temporary_folder.name, 'selected')
+        self.assertEqual(extract_parallel_zip(self.archive_path, selected_destination_path, ['folder/small.txt']),
+                         ['folder/small.txt'])
+        self.assertEqual(os.listdir(os.path.join(selected_destination_path, 'folder')), ['small.txt'])
+
+    def test_member_target_path(self):
+        """
+        Test the member_target_path function.
+
+        This method checks that absolute paths and '..' components can't lead outside of the destination.
+        """
+        destination_path = os.path.join(self.temporary_folder.name, 'extracted')
+
+        self.assertEqual(member_target_path(destination_path, '../../etc/passwd'),
+                         os.path.join(destination_path, 'etc', 'passwd'))
+        self.assertEqual(member_target_path(destination_path, '/absolute/./file.txt'),
+                         os.path.join(destination_path, 'absolute', 'file.txt'))
+
+    @unittest.skipIf(os.name == 'nt', 'Creating symbolic links requires privileges on Windows.')
+    def test_extract_parallel_zip_through_link(self):
+        """
+        Test the extract_parallel_zip function when a folder of the destination links outside of it.
+
+        This method checks that the extraction is refused before any member is written.
+        """
+        write_parallel_zip(self.archive_path, [(file_path, 'linked/' + arcname)
+                                               for file_path, arcname in self.files.items()])
+        destination_path = os.path.join(self.temporary_folder.name, 'extracted')
+        outside_path = os.path.join(self.temporary_folder.name, 'outside')
+        os.makedirs(destination_path)
+        os.makedirs(outside_path)
+        os.symlink(outside_path, os.path.join(destination_path, 'linked'))
+
+        with self.assertRaises(ValueError):
+            extract_parallel_zip(self.archive_path, destination_path)
+        self.assertEqual(os.listdir(outside_path), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,7 +3,16 @@ from unittest.mock import patch
 from pathlib import Path
 import os
 
-from src.utilitybox.auxiliar.project_paths import get_system_path, get_project_folder, get_project_keys_path, get_project_icons_path
+from src.utilitybox.auxiliar.project_paths import (
+    get_system_path,
+    get_project_folder,
+    get_project_keys_path,
+    get_project_icons_path,
+    get_project_index_path,
+    get_project_hash_cache_path,
+    get_project_keystore_path,
+    get_project_journal_path
+)
 
 
 class TestProjectPaths(unittest.TestCase):
@@ -44,6 +53,54 @@ class TestProjectPaths(unittest.TestCase):
         expected_path = os.path.join('/mocked/project/folder', 'resources', 'results', 'keys')
         self.assertEqual(project_keys_path, expected_path)
 
+    @patch('src.utilitybox.auxiliar.project_paths.get_project_folder', return_value='/mocked/project/folder')
+    def test_get_project_index_path(self, mock_get_project_folder):
+        """
+        Test the get_project_index_path function.
+
+        This function checks if the get_project_index_path method correctly combines the project folder path,
+        'resources', 'results', and the name of the index database.
+        """
+        project_index_path = get_project_index_path()
+        expected_path = os.path.join('/mocked/project/folder', 'resources', 'results', 'file_index.db')
+        self.assertEqual(project_index_path, expected_path)
+
+    @patch('src.utilitybox.auxiliar.project_paths.get_project_folder', return_value='/mocked/project/folder')
+    def test_get_project_hash_cache_path(self, mock_get_project_folder):
+        """
+        Test the get_project_hash_cache_path function.
+
+        This function checks if the get_project_hash_cache_path method correctly combines the project folder path,
+        'resources', 'results', and the name of the hash cache database.
+        """
+        project_hash_cache_path = get_project_hash_cache_path()
+        expected_path = os.path.join('/mocked/project/folder', 'resources', 'results', 'hash_cache.db')
+        self.assertEqual(project_hash_cache_path, expected_path)
+
+    @patch('src.utilitybox.auxiliar.project_paths.get_project_folder', return_value='/mocked/project/folder')
+    def test_get_project_keystore_path(self, mock_get_project_folder):
+        """
+        Test the get_project_keystore_path function.
+
+        This function checks if the get_project_keystore_path method correctly combines the project folder path,
+        'resources', 'results', 'keys', and the name of the keystore database.
+        """
+        project_keystore_path = get_project_keystore_path()
+        expected_path = os.path.join('/mocked/project/folder', 'resources', 'results', 'keys', 'keystore.db')
+        self.assertEqual(project_keystore_path, expected_path)
+
+    @patch('src.utilitybox.auxiliar.project_paths.get_project_folder', return_value='/mocked/project/folder')
+    def test_get_project_journal_path(self, mock_get_project_folder):
+        """
+        Test the get_project_journal_path function.
+
+        This function checks if the get_project_journal_path method correctly combines the project folder path,
+        'resources', 'results', and 'journal'.
+        """
+        project_journal_path = get_project_journal_path()
+        expected_path = os.path.join('/mocked/project/folder', 'resources', 'results', 'journal')
+        self.assertEqual(project_journal_path, expected_path)
+
     @patch('src.utilitybox.auxiliar.project_paths.get_project_folder', return_value='/mocked/project/folder')
     def test_get_project_icons_path(self, mock_get_project_folder):
         """
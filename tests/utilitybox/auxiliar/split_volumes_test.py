@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+
+from src.utilitybox.auxiliar.split_volumes import (SplitVolumeWriter, base_archive_path, is_split_archive,
+                                                   open_archive_file, volume_path)
+
+
+class TestSplitVolumes(unittest.TestCase):
+    """
+    Unit tests for the Split Volumes module.
+    """
+
+    def setUp(self):
+        self.temporary_folder = tempfile.TemporaryDirectory()
+        self.archive_path = os.path.join(self.temporary_folder.name, 'archive.zip')
+        self.content = os.urandom(2500)
+
+    def tearDown(self):
+        self.temporary_folder.cleanup()
+
+    def test_volume_paths(self):
+        """
+        Test the volume_path, is_split_archive and base_archive_path functions.
+        """
+        self.assertEqual(volume_path(self.archive_path, 12), self.archive_path + '.012')
+        self.assertTrue(is_split_archive(self.archive_path + '.001'))
+        self.assertFalse(is_split_archive(self.archive_path))
+        self.assertEqual(base_archive_path(self.archive_path + '.001'), self.archive_path)
+        self.assertEqual(base_archive_path(self.archive_path), self.archive_path)
+
+    def test_split_volume_writer(self):
+        """
+        Test the SplitVolumeWriter class.
+
+        This method checks that every volume but the last one has the volume size, that every volume is
+        finalized before the next one is written, and that the volumes give back the written content.
+        """
+        finalized_volumes = []
+
+        def on_volume_finalized(finalized_volume_path: str) -> None:
+            finalized_volumes.append((finalized_volume_path, os.path.getsize(finalized_volume_path),
+                                      os.path.exists(volume_path(self.archive_path, len(finalized_volumes) + 2))))
+
+        with SplitVolumeWriter(self.archive_path, 1000, on_volume_finalized) as writer:
+            for start in range(0, len(self.content), 300):
+                writer.write(self.content[start:start + 300])
+            self.assertEqual(writer.tell(), len(self.content))
+
+        self.assertEqual(writer.volume_paths, [volume_path(self.archive_path, number) for number in (1, 2, 3)])
+        self.assertEqual(finalized_volumes, [(writer.volume_paths[0], 1000, False),
+                                             (writer.volume_paths[1], 1000, False),
+                                             (writer.volume_paths[2], 500, False)])
+        with open_archive_file(writer.volume_paths[0]) as archive_file:
+            self.assertEqual(archive_file.read(), self.content)
+
+    def test_split_volume_reader_seek(self):
+        """
+        Test the reading of a split archive at positions spanning several volumes.
+        """
+        with SplitVolumeWriter(self.archive_path, 1000) as writer:
+            writer.write(self.content)
+
+        with open_archive_file(self.archive_path + '.001') as archive_file:
+            archive_file.seek(950)
+            self.assertEqual(archive_file.read(1100), self.content[950:2050])
+            archive_file.seek(-10, os.SEEK_END)
+            self.assertEqual(archive_file.read(), self.content[-10:])
+
+    def test_remove_volumes(self):
+        """
+        Test the remove_volumes method of the SplitVolumeWriter class.
+        """
+        writer = SplitVolumeWriter(self.archive_path, 1000)
+        writer.write(self.content)
+        writer.remove_volumes()
+
+        self.assertEqual(os.listdir(self.temporary_folder.name), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
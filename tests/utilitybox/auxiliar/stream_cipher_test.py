@@ -0,0 +1,113 @@
+import io
+import os
+import tempfile
+import unittest
+
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet
+
+from src.utilitybox.auxiliar.stream_cipher import (HEADER_SIZE, TAG_SIZE, decrypt_stream, encrypt_stream,
+                                                   is_stream_encrypted, read_file_id, read_kdf_params,
+                                                   verify_stream)
+
+
+class TestStreamCipher(unittest.TestCase):
+    """
+    Unit tests for the Stream Cipher module.
+    """
+
+    def setUp(self):
+        self.key = Fernet.generate_key()
+
+    def _round_trip(self, data, chunk_size):
+        encrypted = io.BytesIO()
+        encrypt_stream(self.key, io.BytesIO(data), encrypted, chunk_size)
+        decrypted = io.BytesIO()
+        decrypt_stream(self.key, io.BytesIO(encrypted.getvalue()), decrypted)
+        return encrypted.getvalue(), decrypted.getvalue()
+
+    def test_round_trip(self):
+        """
+        Test the encrypt_stream and decrypt_stream functions.
+
+        This method checks that the data is recovered for empty data, data fitting in one chunk,
+        data filling exactly several chunks and data ending with a partial chunk, and that the
+        encrypted size is only increased by the header and the authentication tags.
+        """
+        for data in [b'', b'short', os.urandom(64), os.urandom(100)]:
+            encrypted, decrypted = self._round_trip(data, 32)
+            chunks_count = max(1, -(-len(data) // 32))
+            self.assertEqual(decrypted, data)
+            self.assertEqual(len(encrypted), HEADER_SIZE + len(data) + chunks_count * TAG_SIZE)
+
+    def test_altered_stream_rejected(self):
+        """
+        Test the decrypt_stream function for altered encrypted data.
+
+        This method checks that a modified byte, a truncated stream and a wrong key fail the authentication.
+        """
+        encrypted, _ = self._round_trip(os.urandom(100), 32)
+
+        altered = bytearray(encrypted)
+        altered[HEADER_SIZE + 5] ^= 1
+        truncated = encrypted[:HEADER_SIZE + 32 + TAG_SIZE]
+        for encrypted_data, key in [(bytes(altered), self.key), (truncated, self.key),
+                                    (encrypted, Fernet.generate_key())]:
+            with self.assertRaises(InvalidTag):
+                decrypt_stream(key, io.BytesIO(encrypted_data), io.BytesIO())
+
+    def test_verify_stream(self):
+        """
+        Test the verify_stream function.
+
+        This method checks that an intact stream is verified and that an altered stream is rejected.
+        """
+        encrypted, _ = self._round_trip(os.urandom(100), 32)
+        verify_stream(self.key, io.BytesIO(encrypted))
+
+        altered = bytearray(encrypted)
+        altered[-1] ^= 1
+        with self.assertRaises(InvalidTag):
+            verify_stream(self.key, io.BytesIO(bytes(altered)))
+
+    def test_stream_header_detection(self):
+        """
+        Test the is_stream_encrypted and read_file_id functions.
+
+        This method checks that the identifier passed to the encryption is read from the header,
+        and that files without the header are not detected as stream encrypted.
+        """
+        with tempfile.TemporaryDirectory() as temporary_folder:
+            encrypted_path = os.path.join(temporary_folder, 'encrypted.bin')
+            plain_path = os.path.join(temporary_folder, 'plain.txt')
+            with open(encrypted_path, 'wb') as encrypted_file:
+                encrypt_stream(self.key, io.BytesIO(b'content'), encrypted_file, file_id=b'\x07' * 16)
+            with open(plain_path, 'wb') as plain_file:
+                plain_file.write(b'content')
+
+            self.assertTrue(is_stream_encrypted(encrypted_path))
+            self.assertEqual(read_file_id(encrypted_path), b'\x07' * 16)
+            self.assertFalse(is_stream_encrypted(plain_path))
+            self.assertIsNone(read_file_id(plain_path))
+
+    def test_derived_key_header(self):
+        """
+        Test the encryption of a stream with key derivation parameters.
+
+        This method checks that the parameters are read back from the header and that the data is recovered.
+        """
+        kdf_params = (b'\x05' * 16, 15, 8, 1)
+        with tempfile.TemporaryDirectory() as temporary_folder:
+            encrypted_path = os.path.join(temporary_folder, 'encrypted.bin')
+            with open(encrypted_path, 'wb') as encrypted_file:
+                encrypt_stream(self.key, io.BytesIO(b'content'), encrypted_file, kdf_params=kdf_params)
+
+            self.assertEqual(read_kdf_params(encrypted_path), kdf_params)
+            decrypted = io.BytesIO()
+            with open(encrypted_path, 'rb') as encrypted_file:
+                decrypt_stream(self.key, encrypted_file, decrypted)
+            self.assertEqual(decrypted.getvalue(), b'content')
+
+
+if __name__ == '__main__':
+    unittest.main()
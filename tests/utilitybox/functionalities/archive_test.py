@@ -0,0 +1,574 @@
+import io
+import os
+import tarfile
+import tempfile
+import unittest
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from src.utilitybox.functionalities import archive as archive_module
+from src.utilitybox.functionalities.archive import Archive
+
+
+class TestArchiveConcurrency(unittest.TestCase):
+    """
+    Concurrency tests for the Archive module.
+
+    Many compression and extraction jobs run at the same time, like the jobs started from the
+    application, and every job must only touch its own destination folder.
+    """
+
+    JOBS_COUNT = 24
+
+    def setUp(self):
+        """
+        Create source files (two of them sharing a name) in a temporary folder.
+        """
+        self.temporary_folder = tempfile.TemporaryDirectory()
+        self.source_folder = os.path.join(self.temporary_folder.name, 'sources')
+        os.makedirs(os.path.join(self.source_folder, 'nested'))
+        self.files = {}
+        for relative_path, content in [('report.txt', b'report ' * 2000), ('data.bin', os.urandom(70000)),
+                                       (os.path.join('nested', 'report.txt'), b'nested report'),
+                                       ('empty.log', b'')]:
+            file_path = os.path.join(self.source_folder, relative_path)
+            with open(file_path, 'wb') as file:
+                file.write(content)
+            self.files[file_path] = content
+        self.archive = Archive()
+        self.archive_formats = ['zip', 'tar.gz', 'tar.xz']
+        if archive_module.zstandard is not None:
+            self.archive_formats.append('tar.zst')
+
+    def tearDown(self):
+        self.temporary_folder.cleanup()
+
+    def _compress_and_extract(self, job_number: int) -> tuple[str, dict[str, bytes]]:
+        """
+        Compress the source files and extract the archive, in folders specific to the job.
+
+        Params:
+            job_number (int): The number of the job.
+
+        Returns:
+            tuple[str, dict[str, bytes]]: The archive format and the content of every extracted file.
+        """
+        archive_format = self.archive_formats[job_number % len(self.archive_formats)]
+        archive_folder = os.path.join(self.temporary_folder.name, f'archives_{job_number}')
+        extraction_folder = os.path.join(self.temporary_folder.name, f'extracted_{job_number}')
+        os.makedirs(archive_folder)
+        os.makedirs(extraction_folder)
+
+        files_list = list(self.files)
+        if archive_format == 'zip':
+            self.archive.compress_zip_files(f'job_{job_number}', files_list, archive_folder, max_workers=2)
+            self.archive.decompress_zip_files(os.path.join(archive_folder, f'job_{job_number}.zip'),
+                                              extraction_folder)
+        else:
+            self.archive.compress_tar_files(f'job_{job_number}', files_list, archive_folder, archive_format)
+            self.archive.decompress_tar_files(os.path.join(archive_folder, f'job_{job_number}.{archive_format}'),
+                                              extraction_folder)
+
+        extracted_files = {}
+        for file_name in os.listdir(extraction_folder):
+            with open(os.path.join(extraction_folder, file_name), 'rb') as file:
+                extracted_files[file_name] = file.read()
+        return archive_format, extracted_files
+
+    def test_concurrent_compress_and_extract(self):
+        """
+        Test many compression and extraction jobs running at the same time.
+
+        This method checks that every job extracts exactly the compressed files, that the files sharing
+        a name are both kept, that the working directory is never changed and that no temporary copies
+        are left next to the archives.
+        """
+        working_directory = os.getcwd()
+        expected_files = {Archive.build_arcnames(list(self.files))[file_path]: content
+                          for file_path, content in self.files.items()}
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(self._compress_and_extract, range(self.JOBS_COUNT)))
+
+        self.assertEqual(os.getcwd(), working_directory)
+        self.assertEqual(len(expected_files), 4)
+        for archive_format, extracted_files in results:
+            with self.subTest(archive_format=archive_format):
+                self.assertEqual(extracted_files, expected_files)
+        for job_number in range(self.JOBS_COUNT):
+            self.assertEqual(len(os.listdir(os.path.join(self.temporary_folder.name, f'archives_{job_number}'))), 1)
+
+    def test_relative_destination_resolved_once(self):
+        """
+        Test that a relative destination is resolved against the working directory when the operation starts.
+        """
+        self.assertEqual(self.archive._resolve_destination('output'), os.path.abspath('output'))
+        self.assertEqual(self.archive._resolve_destination(''), os.path.abspath(self.archive.default_path))
+
+
+class TestArchiveCompression(unittest.TestCase):
+    """
+    Unit tests for compressing files straight from their location.
+    """
+
+    def setUp(self):
+        """
+        Create source files in two folders, two of them sharing a name.
+        """
+        self.temporary_folder = tempfile.TemporaryDirectory()
+        self.files = {}
+        for relative_path, content in [(os.path.join('first', 'report.txt'), b'first report'),
+                                       (os.path.join('second', 'report.txt'), b'second report'),
+                                       (os.path.join('second', 'data'), b'data')]:
+            file_path = os.path.join(self.temporary_folder.name, relative_path)
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, 'wb') as file:
+                file.write(content)
+            self.files[file_path] = content
+        self.destination_folder = os.path.join(self.temporary_folder.name, 'destination')
+        os.makedirs(self.destination_folder)
+        self.archive = Archive()
+
+    def tearDown(self):
+        self.temporary_folder.cleanup()
+
+    def test_build_arcnames(self):
+        """
+        Test the build_arcnames method.
+
+        This method checks that the files are stored under their base names, suffixed with a counter when
+        the name is already used by another file or reserved.
+        """
+        files_list = list(self.files)
+
+        self.assertEqual(Archive.build_arcnames(files_list),
+                         {files_list[0]: 'report.txt', files_list[1]: 'report (1).txt', files_list[2]: 'data'})
+        self.assertEqual(Archive.build_arcnames(files_list[2:], {'data', 'data (1)'}),
+                         {files_list[2]: 'data (2)'})
+
+    def test_compress_zip_files(self):
+        """
+        Test the compress_zip_files method.
+
+        This method checks that the archive is created directly in the destination folder from the
+        source files, which are left untouched, and that no temporary copy is made.
+        """
+        archive_paths = self.archive.compress_zip_files('archive', list(self.files), self.destination_folder)
+
+        self.assertEqual(archive_paths, [os.path.join(self.destination_folder, 'archive.zip')])
+        self.assertEqual(os.listdir(self.destination_folder), ['archive.zip'])
+        with zipfile.ZipFile(archive_paths[0]) as zipf:
+            self.assertEqual({arcname: zipf.read(arcname) for arcname in zipf.namelist()},
+                             {'report.txt': b'first report', 'report (1).txt': b'second report', 'data': b'data'})
+        for file_path, content in self.files.items():
+            with open(file_path, 'rb') as file:
+                self.assertEqual(file.read(), content)
+
+    def test_compress_rar_files(self):
+        """
+        Test the compress_rar_files method.
+
+        This method checks that the RAR program is called with the source files, that files sharing a
+        name are refused and that a missing RAR program is reported.
+        """
+        files_list = [file_path for file_path in self.files if not file_path.startswith(
+            os.path.join(self.temporary_folder.name, 'first'))]
+        with mock.patch.object(archive_module.shutil, 'which', return_value='/usr/bin/rar'), \
+                mock.patch.object(archive_module.subprocess, 'run') as mock_run:
+            self.archive.compress_rar_files('archive', files_list, self.destination_folder)
+
+            mock_run.assert_called_once()
+            self.assertEqual(mock_run.call_args.args[0],
+                             ['/usr/bin/rar', 'a', '-y', '-ep1', '-m5', '--',
+                              os.path.join(self.destination_folder, 'archive.rar'), *files_list])
+
+            with self.assertRaises(ValueError):
+                self.archive.compress_rar_files('archive', list(self.files), self.destination_folder)
+            self.assertEqual(mock_run.call_count, 1)
+
+        with mock.patch.object(archive_module.shutil, 'which', return_value=None):
+            with self.assertRaises(FileNotFoundError):
+                self.archive.compress_rar_files('archive', files_list, self.destination_folder)
+
+
+class TestArchiveMembers(unittest.TestCase):
+    """
+    Unit tests for listing the contents of archives and extracting some of their files.
+    """
+
+    def setUp(self):
+        """
+        Create a ZIP archive and a tar.gz archive containing files in folders.
+        """
+        self.temporary_folder = tempfile.TemporaryDirectory()
+        self.destination_folder = os.path.join(self.temporary_folder.name, 'extracted')
+        self.zip_path = os.path.join(self.temporary_folder.name, 'archive.zip')
+        self.members = {'logs/app.log': b'app log', 'logs/db.log': b'db log', 'notes.txt': b'notes'}
+        with zipfile.ZipFile(self.zip_path, 'w') as zipf:
+            zipf.mkdir('logs')
+            for member_name, content in self.members.items():
+                zipf.writestr(member_name, content)
+
+        files_list = []
+        for member_name, content in self.members.items():
+            file_path = os.path.join(self.temporary_folder.name, 'sources', os.path.basename(member_name))
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, 'wb') as file:
+                file.write(content)
+            files_list.append(file_path)
+        self.archive = Archive()
+        self.archive.compress_tar_files('archive', files_list, self.temporary_folder.name, 'tar.gz')
+        self.tar_path = os.path.join(self.temporary_folder.name, 'archive.tar.gz')
+
+    def tearDown(self):
+        self.temporary_folder.cleanup()
+
+    def test_list_contents(self):
+        """
+        Test the list_contents method.
+
+        This method checks that the name and size of every file are listed, without the folders.
+        """
+        self.assertEqual(self.archive.list_contents(self.zip_path),
+                         [(member_name, len(content)) for member_name, content in self.members.items()])
+        self.assertEqual(self.archive.list_contents(self.tar_path),
+                         [('app.log', 7), ('db.log', 6), ('notes.txt', 5)])
+        self.assertFalse(os.path.exists(self.destination_folder))
+
+    def test_extract_members_by_glob(self):
+        """
+        Test the extract_members method with a shell-style pattern.
+
+        This method checks that only the matching files are extracted, keeping their folders.
+        """
+        extracted_members = self.archive.extract_members(self.zip_path, 'logs/*', self.destination_folder)
+
+        self.assertEqual(extracted_members, ['logs/app.log', 'logs/db.log'])
+        self.assertEqual(os.listdir(self.destination_folder), ['logs'])
+        with open(os.path.join(self.destination_folder, 'logs', 'db.log'), 'rb') as file:
+            self.assertEqual(file.read(), b'db log')
+
+    def test_extract_members_by_regex(self):
+        """
+        Test the extract_members method with a regular expression, for ZIP and tar archives.
+        """
+        self.assertEqual(self.archive.extract_members(self.zip_path, r'^notes', self.destination_folder,
+                                                      use_regex=True), ['notes.txt'])
+        self.assertEqual(self.archive.extract_members(self.tar_path, r'app|db', self.destination_folder,
+                                                      use_regex=True), ['app.log', 'db.log'])
+        self.assertEqual(sorted(os.listdir(self.destination_folder)), ['app.log', 'db.log', 'notes.txt'])
+
+    def test_extract_members_outside_destination(self):
+        """
+        Test the extract_members method for a member whose path leads outside of the destination.
+
+        This method checks that the member is written inside the destination folder.
+        """
+        with zipfile.ZipFile(self.zip_path, 'a') as zipf:
+            zipf.writestr('../escaped.txt', b'escaped')
+
+        self.archive.extract_members(self.zip_path, '*escaped*', self.destination_folder)
+
+        self.assertFalse(os.path.exists(os.path.join(self.temporary_folder.name, 'escaped.txt')))
+        self.assertTrue(os.path.exists(os.path.join(self.destination_folder, 'escaped.txt')))
+
+
+class TestTarArchive(unittest.TestCase):
+    """
+    Unit tests for the safety of the tar archives.
+    """
+
+    def setUp(self):
+        """
+        Prepare the paths of a tar.gz archive and of its extraction folder in a temporary folder.
+        """
+        self.temporary_folder = tempfile.TemporaryDirectory()
+        self.destination_folder = os.path.join(self.temporary_folder.name, 'extracted')
+        self.tar_path = os.path.join(self.temporary_folder.name, 'archive.tar.gz')
+        self.archive = Archive()
+
+    def tearDown(self):
+        self.temporary_folder.cleanup()
+
+    def _write_tar(self, members: list[tarfile.TarInfo]) -> None:
+        with tarfile.open(self.tar_path, 'w:gz') as tar:
+            for member in members:
+                tar.addfile(member, io.BytesIO(b'content') if member.isfile() else None)
+
+    @staticmethod
+    def _member(name: str, member_type: bytes = tarfile.REGTYPE, mode: int = 0o644) -> tarfile.TarInfo:
+        member = tarfile.TarInfo(name)
+        member.type, member.mode = member_type, mode
+        if member.isfile():
+            member.size = len(b'content')
+        else:
+            member.linkname = '/etc/passwd'
+        return member
+
+    def test_extract_without_filters(self):
+        """
+        Test the extraction of tar archives when the extraction filters are not available.
+
+        This method checks that the files are extracted with their unsafe mode bits cleared, and that
+        members leading outside of the destination and links are refused.
+        """
+        with mock.patch.object(archive_module, 'TAR_FILTERS_SUPPORTED', False):
+            self._write_tar([self._member('folder/file.txt', mode=0o4777)])
+            self.archive.decompress_tar_files(self.tar_path, self.destination_folder)
+            extracted_path = os.path.join(self.destination_folder, 'folder', 'file.txt')
+            with open(extracted_path, 'rb') as file:
+                self.assertEqual(file.read(), b'content')
+            if os.name != 'nt':
+                self.assertEqual(os.stat(extracted_path).st_mode & 0o7777, 0o755)
+
+            for member in [self._member('../escaped.txt'), self._member('/absolute.txt'),
+                           self._member('link', tarfile.SYMTYPE)]:
+                with self.subTest(member=member.name):
+                    self._write_tar([member])
+                    with self.assertRaises(ValueError):
+                        self.archive.decompress_tar_files(self.tar_path, self.destination_folder)
+            self.assertFalse(os.path.exists(os.path.join(self.temporary_folder.name, 'escaped.txt')))
+            self.assertFalse(os.path.lexists(os.path.join(self.destination_folder, 'link')))
+
+    def test_compress_failure(self):
+        """
+        Test the compress_tar_files method when a file can't be read.
+
+        This method checks that no partial archive is left.
+        """
+        source_path = os.path.join(self.temporary_folder.name, 'source.txt')
+        with open(source_path, 'wb') as file:
+            file.write(b'content')
+
+        with self.assertRaises(FileNotFoundError):
+            self.archive.compress_tar_files('archive', [source_path, source_path + '.missing'],
+                                            self.temporary_folder.name)
+        self.assertFalse(os.path.exists(self.tar_path))
+
+
+class TestSplitArchive(unittest.TestCase):
+    """
+    Unit tests for archives split in volumes of a fixed size.
+    """
+
+    def setUp(self):
+        """
+        Create source files that don't compress in a temporary folder.
+        """
+        self.temporary_folder = tempfile.TemporaryDirectory()
+        self.files = {}
+        for file_name in ['first.bin', 'second.bin']:
+            file_path = os.path.join(self.temporary_folder.name, file_name)
+            self.files[file_path] = os.urandom(60000)
+            with open(file_path, 'wb') as file:
+                file.write(self.files[file_path])
+        self.archive = Archive()
+        self.destination_folder = os.path.join(self.temporary_folder.name, 'extracted')
+
+    def tearDown(self):
+        self.temporary_folder.cleanup()
+
+    def _assert_extracted(self) -> None:
+        for file_path, content in self.files.items():
+            with open(os.path.join(self.destination_folder, os.path.basename(file_path)), 'rb') as file:
+                self.assertEqual(file.read(), content)
+
+    def test_split_zip(self):
+        """
+        Test the compress_zip_files method with a volume size.
+
+        This method checks that every volume is reported once complete, and that the archive is listed
+        and extracted from its first volume.
+        """
+        finalized_volumes = []
+        volume_paths = self.archive.compress_zip_files('archive', list(self.files), self.temporary_folder.name,
+                                                       volume_size=50000, on_volume_finalized=finalized_volumes.append)
+
+        self.assertEqual(len(volume_paths), 3)
+        self.assertEqual(finalized_volumes, volume_paths)
+        self.assertEqual(self.archive.list_contents(volume_paths[0]), [('first.bin', 60000), ('second.bin', 60000)])
+        self.assertFalse(Archive.is_incremental_archive(volume_paths[0]))
+        self.archive.decompress_zip_files(volume_paths[0], self.destination_folder)
+        self._assert_extracted()
+
+    def test_split_zip_rewritten(self):
+        """
+        Test the compress_zip_files method when a split archive is created again with fewer volumes.
+
+        This method checks that the volumes of the earlier archive are removed, so only the new content is read.
+        """
+        files_list = list(self.files)
+        self.archive.compress_zip_files('archive', files_list, self.temporary_folder.name, volume_size=50000)
+
+        volume_paths = self.archive.compress_zip_files('archive', files_list[:1], self.temporary_folder.name,
+                                                       compression='stored', volume_size=100000)
+
+        self.assertEqual(len(volume_paths), 1)
+        self.assertFalse(os.path.exists(os.path.join(self.temporary_folder.name, 'archive.zip.002')))
+        self.assertEqual(self.archive.list_contents(volume_paths[0]), [('first.bin', 60000)])
+
+    def test_split_tar(self):
+        """
+        Test the compress_tar_files method with a volume size, for every tar format.
+        """
+        archive_formats = ['tar.gz', 'tar.xz']
+        if archive_module.zstandard is not None:
+            archive_formats.append('tar.zst')
+        for archive_format in archive_formats:
+            with self.subTest(archive_format=archive_format):
+                volume_paths = self.archive.compress_tar_files('archive', list(self.files),
+                                                               self.temporary_folder.name, archive_format,
+                                                               volume_size=50000)
+
+                self.assertEqual(len(volume_paths), 3)
+                self.assertEqual(Archive.tar_format(volume_paths[0]), archive_format)
+                self.archive.decompress_tar_files(volume_paths[0], self.destination_folder)
+                self._assert_extracted()
+
+    def test_split_tar_failure(self):
+        """
+        Test the compress_tar_files method with a volume size when a file can't be read.
+
+        This method checks that no volume is left.
+        """
+        files_list = list(self.files) + [os.path.join(self.temporary_folder.name, 'missing.bin')]
+
+        with self.assertRaises(FileNotFoundError):
+            self.archive.compress_tar_files('archive', files_list, self.temporary_folder.name, volume_size=50000)
+        self.assertFalse(any(name.startswith('archive') for name in os.listdir(self.temporary_folder.name)))
+
+
+class TestIncrementalArchive(unittest.TestCase):
+    """
+    Unit tests for the incremental archives (chains of ZIP archives and deduplicated snapshots).
+    """
+
+    def setUp(self):
+        """
+        Create source files in a temporary folder.
+        """
+        self.temporary_folder = tempfile.TemporaryDirectory()
+        self.source_folder = os.path.join(self.temporary_folder.name, 'sources')
+        self.archives_folder = os.path.join(self.temporary_folder.name, 'archives')
+        os.makedirs(self.source_folder)
+        os.makedirs(self.archives_folder)
+        self.files = []
+        for file_name in ['kept.txt', 'changed.txt', 'removed.txt']:
+            self.files.append(self._write_source(file_name, file_name.encode()))
+        self.archive = Archive()
+
+    def tearDown(self):
+        self.temporary_folder.cleanup()
+
+    def _write_source(self, file_name: str, content: bytes) -> str:
+        file_path = os.path.join(self.source_folder, file_name)
+        with open(file_path, 'wb') as file:
+            file.write(content)
+        return file_path
+
+    def _read_restored(self, destination_path: str) -> dict[str, bytes]:
+        restored_files = {}
+        for file_name in os.listdir(destination_path):
+            with open(os.path.join(destination_path, file_name), 'rb') as file:
+                restored_files[file_name] = file.read()
+        return restored_files
+
+    def test_incremental_chain(self):
+        """
+        Test the compress_incremental_zip and restore_incremental_zip methods.
+
+        This method checks that the second archive only contains the changed and new files, that the
+        removed file is recorded as deleted, and that every archive of the chain restores the files
+        as they were when it was created.
+        """
+        kept_path, changed_path, removed_path = self.files
+        first_archive_path = os.path.join(self.archives_folder, 'nightly_1.zip')
+        second_archive_path = os.path.join(self.archives_folder, 'nightly_2.zip')
+
+        stored_files, deleted_files = self.archive.compress_incremental_zip('nightly_1', self.files,
+                                                                            self.archives_folder)
+        self.assertEqual((stored_files, deleted_files), (self.files, []))
+
+        self._write_source('changed.txt', b'changed content')
+        added_path = self._write_source('added.txt', b'added')
+        os.remove(removed_path)
+        stored_files, deleted_files = self.archive.compress_incremental_zip(
+            'nightly_2', [kept_path, changed_path, added_path], self.archives_folder, first_archive_path)
+
+        self.assertEqual((stored_files, deleted_files), ([changed_path, added_path], [removed_path]))
+        with zipfile.ZipFile(second_archive_path) as zipf:
+            self.assertEqual(zipf.namelist(), ['changed.txt', 'added.txt', '.utilitybox_manifest.json'])
+        self.assertTrue(Archive.is_incremental_archive(second_archive_path))
+
+        latest_folder = os.path.join(self.temporary_folder.name, 'latest')
+        self.archive.restore_incremental_zip(second_archive_path, latest_folder)
+        self.assertEqual(self._read_restored(latest_folder),
+                         {'kept.txt': b'kept.txt', 'changed.txt': b'changed content', 'added.txt': b'added'})
+
+        first_folder = os.path.join(self.temporary_folder.name, 'first')
+        self.archive.restore_incremental_zip(first_archive_path, first_folder)
+        self.assertEqual(self._read_restored(first_folder),
+                         {'kept.txt': b'kept.txt', 'changed.txt': b'changed.txt', 'removed.txt': b'removed.txt'})
+
+    def test_incremental_members(self):
+        """
+        Test the list_contents and extract_members methods for an incremental archive.
+
+        This method checks that the files of the whole chain are listed and extracted, from the archive
+        holding their latest version, without the manifest nor the deleted files.
+        """
+        kept_path, changed_path, removed_path = self.files
+        self.archive.compress_incremental_zip('nightly_1', self.files, self.archives_folder)
+        self._write_source('changed.txt', b'changed content')
+        os.remove(removed_path)
+        self.archive.compress_incremental_zip('nightly_2', [kept_path, changed_path], self.archives_folder,
+                                              os.path.join(self.archives_folder, 'nightly_1.zip'))
+        second_archive_path = os.path.join(self.archives_folder, 'nightly_2.zip')
+        destination_path = os.path.join(self.temporary_folder.name, 'extracted')
+
+        self.assertEqual(sorted(self.archive.list_contents(second_archive_path)),
+                         [('changed.txt', len(b'changed content')), ('kept.txt', len(b'kept.txt'))])
+        self.assertEqual(sorted(self.archive.extract_members(second_archive_path, '*', destination_path)),
+                         ['changed.txt', 'kept.txt'])
+        self.assertEqual(self._read_restored(destination_path),
+                         {'kept.txt': b'kept.txt', 'changed.txt': b'changed content'})
+
+    def test_touched_file_not_stored(self):
+        """
+        Test the compress_incremental_zip method for a file whose modification time changed but not its content.
+
+        This method checks that the file isn't compressed again and is restored from the previous archive.
+        """
+        self.archive.compress_incremental_zip('nightly_1', self.files, self.archives_folder)
+        file_stat = os.stat(self.files[0])
+        os.utime(self.files[0], ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 10 ** 9))
+
+        stored_files, _ = self.archive.compress_incremental_zip(
+            'nightly_2', self.files, self.archives_folder, os.path.join(self.archives_folder, 'nightly_1.zip'))
+
+        self.assertEqual(stored_files, [])
+        restored_folder = os.path.join(self.temporary_folder.name, 'restored')
+        self.archive.restore_incremental_zip(os.path.join(self.archives_folder, 'nightly_2.zip'), restored_folder)
+        self.assertEqual(sorted(os.listdir(restored_folder)), ['changed.txt', 'kept.txt', 'removed.txt'])
+
+    def test_deduplicated_snapshots(self):
+        """
+        Test the compress_deduplicated and restore_deduplicated methods.
+
+        This method checks that archiving the same files again stores nothing new and that the latest
+        snapshot is restored.
+        """
+        self.archive.compress_deduplicated('project', self.files, self.archives_folder, 'monday')
+        self.assertEqual(self.archive.compress_deduplicated('project', self.files, self.archives_folder), (0, 0))
+
+        restored_folder = os.path.join(self.temporary_folder.name, 'restored')
+        restored_files = self.archive.restore_deduplicated(os.path.join(self.archives_folder, 'project.ubstore'),
+                                                           restored_folder)
+
+        self.assertEqual(restored_files, ['changed.txt', 'kept.txt', 'removed.txt'])
+        self.assertEqual(self._read_restored(restored_folder)['kept.txt'], b'kept.txt')
+
+
+if __name__ == '__main__':
+    unittest.main()
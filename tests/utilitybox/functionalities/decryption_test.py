@@ -0,0 +1,206 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet
+
+from src.utilitybox.auxiliar.keystore import KeyStore
+from src.utilitybox.auxiliar.stream_cipher import read_file_id
+from src.utilitybox.functionalities.decryption import DERIVED_KEY_LOCATION, Decryption
+from src.utilitybox.functionalities.encryption import Encryption
+
+
+class TestDecryption(unittest.TestCase):
+    """
+    Unit tests for the Decryption module.
+    """
+
+    def setUp(self):
+        """
+        Encrypt a file with a key saved in a keystore located in a temporary folder (with the journal of the
+        file rewrites and the folder of the key files).
+        """
+        self.temporary_folder = tempfile.TemporaryDirectory()
+        journal_patcher = mock.patch('src.utilitybox.auxiliar.atomic_writes.get_project_journal_path',
+                                     return_value=os.path.join(self.temporary_folder.name, 'journal'))
+        journal_patcher.start()
+        self.addCleanup(journal_patcher.stop)
+        self.keys_path = os.path.join(self.temporary_folder.name, 'keys')
+        os.makedirs(self.keys_path)
+        keys_patcher = mock.patch('src.utilitybox.functionalities.decryption.get_project_keys_path',
+                                  return_value=self.keys_path)
+        keys_patcher.start()
+        self.addCleanup(keys_patcher.stop)
+        self.keystore_path = os.path.join(self.temporary_folder.name, 'keystore.db')
+        self.file_path = os.path.join(self.temporary_folder.name, 'secret.txt')
+        with open(self.file_path, 'wb') as file:
+            file.write(b'secret content')
+        encryption = Encryption(self.file_path)
+        encryption.generate_key(self.keystore_path)
+        encryption.encrypt_file(encryption.load_key())
+
+    def tearDown(self):
+        self.temporary_folder.cleanup()
+
+    def test_decrypt_files_with_keystore(self):
+        """
+        Test the decrypt_files method with a keystore other than the project's keystore.
+
+        This method checks that the file is decrypted with the key of the given keystore and that the
+        given keystore is the one compacted after the batch.
+        """
+        with mock.patch.object(KeyStore, 'compact', autospec=True) as mock_compact:
+            batch_results = list(Decryption.decrypt_files([self.file_path], keystore_path=self.keystore_path))
+
+        self.assertEqual(batch_results[0][0], self.file_path)
+        self.assertIsNotNone(batch_results[0][1])
+        with open(self.file_path, 'rb') as file:
+            self.assertEqual(file.read(), b'secret content')
+        mock_compact.assert_called_once()
+        self.assertEqual(mock_compact.call_args.args[0].keystore_path, self.keystore_path)
+
+    def test_decrypt_legacy_file(self):
+        """
+        Test the decrypt_file and decrypt_files methods with files encrypted as a single Fernet token.
+
+        This method checks that the key is read from the key file named after the file, that the original
+        content is restored and that the key file is removed.
+        """
+        for use_batch in (False, True):
+            with self.subTest(use_batch=use_batch):
+                legacy_file_path = os.path.join(self.temporary_folder.name, 'legacy.txt')
+                key_path = os.path.join(self.keys_path, 'legacy.key')
+                key = Fernet.generate_key()
+                with open(key_path, 'wb') as key_file:
+                    key_file.write(key)
+                with open(legacy_file_path, 'wb') as file:
+                    file.write(Fernet(key).encrypt(b'legacy content'))
+
+                if use_batch:
+                    batch_results = list(Decryption.decrypt_files([legacy_file_path],
+                                                                  keystore_path=self.keystore_path))
+                    self.assertEqual(batch_results, [(legacy_file_path, key_path)])
+                else:
+                    decryption = Decryption(legacy_file_path, self.keystore_path)
+                    decryption.decrypt_file(decryption.load_key())
+                    self.assertEqual(decryption.file_key_pair, {'legacy': key_path})
+
+                with open(legacy_file_path, 'rb') as file:
+                    self.assertEqual(file.read(), b'legacy content')
+                self.assertFalse(os.path.exists(key_path))
+
+    def assert_verification_left_untouched(self, file_path: str, encrypted_content: bytes, file_id: bytes):
+        """
+        Asserts that a verification left the encrypted file and the key of the keystore as they were.
+        """
+        with open(file_path, 'rb') as file:
+            self.assertEqual(file.read(), encrypted_content)
+        with KeyStore(self.keystore_path) as keystore:
+            self.assertIsNotNone(keystore.load_key(file_id))
+
+    def test_verify_file(self):
+        """
+        Test the verify_file and verify_files methods with the key of the file, a tampered file, a missing
+        key and a wrong passphrase.
+
+        This method checks that only the file matching its key passes the verification, and that the file
+        and the key in the keystore are left untouched in every case.
+        """
+        file_id = read_file_id(self.file_path)
+        with open(self.file_path, 'rb') as file:
+            encrypted_content = file.read()
+        with KeyStore(self.keystore_path) as keystore:
+            key_location = f'{keystore.keystore_path} (file id {file_id.hex()})'
+
+        with self.subTest(case='matching key'):
+            decryption = Decryption(self.file_path, self.keystore_path)
+            decryption.verify_file(decryption.load_key())
+            self.assertEqual(list(Decryption.verify_files([self.file_path], keystore_path=self.keystore_path)),
+                             [(self.file_path, key_location)])
+            self.assert_verification_left_untouched(self.file_path, encrypted_content, file_id)
+
+        with self.subTest(case='tampered chunk'):
+            tampered_file_path = os.path.join(self.temporary_folder.name, 'tampered.txt')
+            # The byte is in the ciphertext of the chunk, before its authentication tag
+            tampered_content = bytearray(encrypted_content)
+            tampered_content[-20] ^= 0xFF
+            with open(tampered_file_path, 'wb') as file:
+                file.write(tampered_content)
+            decryption = Decryption(tampered_file_path, self.keystore_path)
+            with self.assertRaises(InvalidTag):
+                decryption.verify_file(decryption.load_key())
+            self.assertEqual(list(Decryption.verify_files([tampered_file_path], keystore_path=self.keystore_path)),
+                             [(tampered_file_path, None)])
+            self.assert_verification_left_untouched(tampered_file_path, bytes(tampered_content), file_id)
+
+        with self.subTest(case='missing key'):
+            other_keystore_path = os.path.join(self.temporary_folder.name, 'other_keystore.db')
+            decryption = Decryption(self.file_path, other_keystore_path)
+            with self.assertRaises(FileNotFoundError):
+                decryption.verify_file(decryption.load_key())
+            self.assertEqual(list(Decryption.verify_files([self.file_path], keystore_path=other_keystore_path)),
+                             [(self.file_path, None)])
+            self.assert_verification_left_untouched(self.file_path, encrypted_content, file_id)
+
+        with self.subTest(case='wrong passphrase'):
+            protected_file_path = os.path.join(self.temporary_folder.name, 'protected.txt')
+            with open(protected_file_path, 'wb') as file:
+                file.write(b'protected content')
+            list(Encryption.encrypt_files([protected_file_path], passphrase='right passphrase'))
+            with open(protected_file_path, 'rb') as file:
+                protected_content = file.read()
+            decryption = Decryption(protected_file_path, self.keystore_path, 'wrong passphrase')
+            with self.assertRaises(ValueError):
+                decryption.verify_file(decryption.load_key())
+            self.assertEqual(list(Decryption.verify_files([protected_file_path], passphrase='wrong passphrase',
+                                                          keystore_path=self.keystore_path)),
+                             [(protected_file_path, None)])
+            with open(protected_file_path, 'rb') as file:
+                self.assertEqual(file.read(), protected_content)
+            self.assert_verification_left_untouched(self.file_path, encrypted_content, file_id)
+
+    def test_decrypt_with_passphrase(self):
+        """
+        Test the Encryption and Decryption classes with a key derived from a passphrase.
+
+        This method checks that the file is restored with the right passphrase, that a wrong passphrase is
+        rejected without altering the file and that the derived key is neither written to the keys folder
+        nor to the keystore.
+        """
+        protected_file_path = os.path.join(self.temporary_folder.name, 'protected.txt')
+        project_keystore_path = os.path.join(self.temporary_folder.name, 'project_keystore.db')
+        with open(protected_file_path, 'wb') as file:
+            file.write(b'protected content')
+
+        with mock.patch('src.utilitybox.auxiliar.keystore.get_project_keystore_path',
+                        return_value=project_keystore_path):
+            encryption = Encryption(protected_file_path, 'right passphrase')
+            encryption.generate_key()
+            encryption.encrypt_file(encryption.load_key())
+            with open(protected_file_path, 'rb') as file:
+                encrypted_content = file.read()
+            self.assertNotIn(b'protected content', encrypted_content)
+
+            decryption = Decryption(protected_file_path, passphrase='wrong passphrase')
+            with self.assertRaises(ValueError):
+                decryption.decrypt_file(decryption.load_key())
+            with open(protected_file_path, 'rb') as file:
+                self.assertEqual(file.read(), encrypted_content)
+
+            decryption = Decryption(protected_file_path, passphrase='right passphrase')
+            decryption.decrypt_file(decryption.load_key())
+            with open(protected_file_path, 'rb') as file:
+                self.assertEqual(file.read(), b'protected content')
+
+        self.assertEqual(encryption.file_key_pair, {'protected': DERIVED_KEY_LOCATION})
+        self.assertEqual(decryption.file_key_pair, {'protected': DERIVED_KEY_LOCATION})
+        self.assertEqual(os.listdir(self.keys_path), [])
+        self.assertFalse(os.path.exists(project_keystore_path))
+        with KeyStore(self.keystore_path) as keystore:
+            self.assertEqual(keystore.connection.execute('SELECT COUNT(*) FROM keys').fetchone()[0], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
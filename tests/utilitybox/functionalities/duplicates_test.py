@@ -0,0 +1,115 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.utilitybox.functionalities import duplicates as duplicates_module
+from src.utilitybox.functionalities.delete import Delete
+from src.utilitybox.functionalities.duplicates import PARTIAL_HASH_SIZE, Duplicates
+
+
+class TestDuplicates(unittest.TestCase):
+    """
+    Unit tests for the Duplicates module and the deletion of the redundant copies.
+    """
+
+    def setUp(self):
+        """
+        Create groups of duplicates (small and large files, with different modification times) and files
+        that only look like duplicates in a temporary folder, the hash cache being kept in the same folder.
+        """
+        self.temporary_folder = tempfile.TemporaryDirectory()
+        self.folder_path = os.path.join(self.temporary_folder.name, 'files')
+        os.makedirs(os.path.join(self.folder_path, 'nested'))
+        cache_patcher = mock.patch('src.utilitybox.auxiliar.hash_cache.get_project_hash_cache_path',
+                                   return_value=os.path.join(self.temporary_folder.name, 'hash_cache.db'))
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+
+        large_content = os.urandom(3 * PARTIAL_HASH_SIZE)
+        # Same size, first and last bytes as the large files, but a different middle
+        altered_content = large_content[:PARTIAL_HASH_SIZE] + os.urandom(PARTIAL_HASH_SIZE) + \
+            large_content[-PARTIAL_HASH_SIZE:]
+        self.small_copies = [self._write_file('notes.txt', b'notes', 300),
+                             self._write_file(os.path.join('nested', 'notes copy.txt'), b'notes', 100),
+                             self._write_file('notes (2).txt', b'notes', 200)]
+        self.large_copies = [self._write_file('video.bin', large_content, 100),
+                             self._write_file(os.path.join('nested', 'video.bin'), large_content, 200)]
+        self._write_file('altered.bin', altered_content, 50)
+        self._write_file('other.txt', b'other', 50)
+        self._write_file('empty.txt', b'', 50)
+        self._write_file(os.path.join('nested', 'empty.txt'), b'', 50)
+
+    def tearDown(self):
+        self.temporary_folder.cleanup()
+
+    def _write_file(self, relative_path: str, content: bytes, mtime: int) -> str:
+        file_path = os.path.join(self.folder_path, relative_path)
+        with open(file_path, 'wb') as file:
+            file.write(content)
+        os.utime(file_path, (mtime, mtime))
+        return file_path
+
+    def test_find_duplicates(self):
+        """
+        Test the find_duplicates method.
+
+        This method checks that only the files with identical content are grouped (not the files sharing
+        their size or their first and last bytes, nor the empty files), the oldest file first.
+        """
+        duplicate_groups = sorted(Duplicates(self.folder_path).find_duplicates(), key=len)
+
+        self.assertEqual(duplicate_groups, [self.large_copies, [self.small_copies[1], self.small_copies[2],
+                                                                self.small_copies[0]]])
+
+    def test_full_hash_only_for_large_files(self):
+        """
+        Test the find_duplicates method for files entirely covered by the partial hash.
+
+        This method checks that only the large files with the same partial hash are fully hashed.
+        """
+        with mock.patch.object(duplicates_module, 'full_file_hash',
+                               wraps=duplicates_module.full_file_hash) as mock_full_file_hash:
+            list(Duplicates(self.folder_path).find_duplicates())
+
+        self.assertEqual(sorted(call.args[0] for call in mock_full_file_hash.call_args_list),
+                         sorted(self.large_copies + [os.path.join(self.folder_path, 'altered.bin')]))
+
+    def test_hard_links_skipped(self):
+        """
+        Test the find_duplicates method for hard links to the same file.
+
+        This method checks that a hard link is not reported as a duplicate, since deleting it frees nothing.
+        """
+        linked_path = os.path.join(self.folder_path, 'other link.txt')
+        try:
+            os.link(os.path.join(self.folder_path, 'other.txt'), linked_path)
+        except OSError:
+            self.skipTest('Hard links are not supported by the file system.')
+
+        duplicate_groups = list(Duplicates(self.folder_path).find_duplicates())
+
+        self.assertEqual(len(duplicate_groups), 2)
+        self.assertFalse(any(linked_path in group for group in duplicate_groups))
+
+    def test_delete_duplicates(self):
+        """
+        Test the deletion of the redundant copies (the 'Delete duplicates' option).
+
+        This method checks that the oldest copy of every group is kept, the other copies being deleted,
+        and that the copies already removed are skipped.
+        """
+        duplicate_groups = list(Duplicates(self.folder_path).find_duplicates())
+        os.remove(self.small_copies[0])
+
+        with mock.patch('builtins.print'):
+            deleted_files = list(Delete.delete_files(Duplicates.redundant_files(duplicate_groups)))
+
+        self.assertEqual(sorted(deleted_files), sorted([self.small_copies[2], self.large_copies[1]]))
+        self.assertTrue(os.path.exists(self.small_copies[1]))
+        self.assertTrue(os.path.exists(self.large_copies[0]))
+        self.assertFalse(any(os.path.exists(file_path) for file_path in deleted_files))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.utilitybox.auxiliar.stream_cipher import read_file_id
+from src.utilitybox.functionalities.decryption import Decryption
+from src.utilitybox.functionalities.encryption import Encryption
+
+
+class TestEncryption(unittest.TestCase):
+    """
+    Unit tests for the Encryption module.
+    """
+
+    def setUp(self):
+        """
+        Create files in a temporary folder, which also holds the keystore and the journal of the file rewrites.
+        """
+        self.temporary_folder = tempfile.TemporaryDirectory()
+        self.keystore_path = os.path.join(self.temporary_folder.name, 'keystore.db')
+        for target, patched_path in (('src.utilitybox.auxiliar.atomic_writes.get_project_journal_path', 'journal'),
+                                     ('src.utilitybox.auxiliar.keystore.get_project_keystore_path', 'keystore.db')):
+            patcher = mock.patch(target, return_value=os.path.join(self.temporary_folder.name, patched_path))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.contents = {}
+        for file_number in range(4):
+            file_path = os.path.join(self.temporary_folder.name, f'file_{file_number}.txt')
+            self.contents[file_path] = f'content of the file {file_number}'.encode() * (file_number * 1000 + 1)
+            with open(file_path, 'wb') as file:
+                file.write(self.contents[file_path])
+
+    def tearDown(self):
+        self.temporary_folder.cleanup()
+
+    def test_encrypt_files(self):
+        """
+        Test the encrypt_files method with several files encrypted in a single batch.
+
+        This method checks that every file is returned with the location of its own key in the keystore,
+        that its content is encrypted and that it decrypts back to its original content.
+        """
+        file_paths = list(self.contents)
+
+        batch_results = list(Encryption.encrypt_files(file_paths, max_workers=2))
+
+        self.assertEqual([file_path for file_path, _ in batch_results], file_paths)
+        file_ids = set()
+        for file_path, key_location in batch_results:
+            file_id = read_file_id(file_path)
+            self.assertIsNotNone(file_id)
+            file_ids.add(file_id)
+            self.assertEqual(key_location, f'{self.keystore_path} (file id {file_id.hex()})')
+            with open(file_path, 'rb') as file:
+                self.assertNotEqual(file.read(), self.contents[file_path])
+        self.assertEqual(len(file_ids), len(file_paths))
+
+        for file_path in file_paths:
+            decryption = Decryption(file_path, self.keystore_path)
+            decryption.decrypt_file(decryption.load_key())
+            with open(file_path, 'rb') as file:
+                self.assertEqual(file.read(), self.contents[file_path])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.utilitybox.functionalities import search as search_module
+from src.utilitybox.functionalities.search import Search, _find_matches, _scan_file_content
+
+
+class TestSearch(unittest.TestCase):
+    """
+    Unit tests for searching files by name and extension in a folder tree.
+    """
+
+    def setUp(self):
+        """
+        Create a folder tree three levels deep, with an excluded folder and excluded files.
+        """
+        self.temporary_folder = tempfile.TemporaryDirectory()
+        self.folder_path = self.temporary_folder.name
+        for relative_path in ['report.txt', 'draft.tmp', os.path.join('level_1', 'report_1.txt'),
+                              os.path.join('level_1', 'level_2', 'report_2.txt'),
+                              os.path.join('level_1', 'level_2', 'level_3', 'report_3.txt'),
+                              os.path.join('.git', 'report_git.txt'), os.path.join('level_1', 'report_1.tmp')]:
+            file_path = os.path.join(self.folder_path, relative_path)
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, 'w') as file:
+                file.write(relative_path)
+
+    def tearDown(self):
+        self.temporary_folder.cleanup()
+
+    def test_search_depth(self):
+        """
+        Test the search_by_extension method with and without a depth limit.
+
+        This method checks that only the searched folder is searched when not recursive, and that the
+        subfolders deeper than the depth limit are not searched.
+        """
+        self.assertEqual(list(Search(self.folder_path).search_by_extension('txt')), ['report.txt'])
+        self.assertEqual(sorted(Search(self.folder_path, recursive=True, max_depth=1).search_by_extension('txt')),
+                         [os.path.join('.git', 'report_git.txt'), os.path.join('level_1', 'report_1.txt'),
+                          'report.txt'])
+        self.assertEqual(len(list(Search(self.folder_path, recursive=True).search_by_extension('txt'))), 5)
+
+    def test_search_exclusions(self):
+        """
+        Test the search_by_name method with exclude patterns.
+
+        This method checks that the excluded files and the files of the excluded folders are not found.
+        """
+        search = Search(self.folder_path, recursive=True, max_depth=2, exclude_patterns=['.git', '*.tmp'])
+
+        self.assertEqual(sorted(search.search_by_name('report', '')),
+                         [os.path.join('level_1', 'level_2', 'report_2.txt'), os.path.join('level_1', 'report_1.txt'),
+                          'report.txt'])
+        self.assertEqual(list(search.search_by_name('draft', '')), [])
+
+
+class TestSearchByContent(unittest.TestCase):
+    """
+    Unit tests for searching text inside files.
+    """
+
+    def setUp(self):
+        """
+        Create text files and a binary file containing the searched text in a temporary folder.
+        """
+        self.temporary_folder = tempfile.TemporaryDirectory()
+        self.folder_path = self.temporary_folder.name
+        self._write_file('notes.txt', b'first line\nerror: disk full\nok\nerror: timeout error\n')
+        self._write_file('report.md', b'no problem here\n')
+        self._write_file('image.bin', b'\0\x01error\n')
+
+    def tearDown(self):
+        self.temporary_folder.cleanup()
+
+    def _write_file(self, file_name: str, content: bytes) -> str:
+        file_path = os.path.join(self.folder_path, file_name)
+        with open(file_path, 'wb') as file:
+            file.write(content)
+        return file_path
+
+    def test_find_matches(self):
+        """
+        Test the _find_matches function.
+
+        This method checks that the line number and byte offset of every occurrence are found, for
+        literals and regular expressions (where '^' matches the start of every line).
+        """
+        content = b'first line\nerror: disk full\nok\nerror: timeout error\n'
+
+        self.assertEqual(_find_matches(content, b'error', False), [(2, 11), (4, 31), (4, 46)])
+        self.assertEqual(_find_matches(content, rb'^error: \w+', True), [(2, 11), (4, 31)])
+        self.assertEqual(_find_matches(content, b'missing', False), [])
+
+    def test_scan_file_content(self):
+        """
+        Test the _scan_file_content function.
+
+        This method checks that binary files are skipped and that large files, which are memory-mapped,
+        give the same results.
+        """
+        self.assertEqual(_scan_file_content(os.path.join(self.folder_path, 'image.bin'), b'error', False), [])
+
+        with mock.patch.object(search_module, 'MMAP_MIN_FILE_SIZE', 1):
+            self.assertEqual(_scan_file_content(os.path.join(self.folder_path, 'notes.txt'), b'error', False),
+                             [(2, 11), (4, 31), (4, 46)])
+
+    def test_search_by_content(self):
+        """
+        Test the search_by_content method with a literal and with a regular expression.
+
+        This method checks that the occurrences are returned with the file, the line number and the byte
+        offset, and that the binary file and the files of other extensions are not searched.
+        """
+        search = Search(self.folder_path)
+
+        self.assertEqual(list(search.search_by_content('error', max_workers=2)),
+                         [('notes.txt', 2, 11), ('notes.txt', 4, 31), ('notes.txt', 4, 46)])
+        self.assertEqual(sorted(search.search_by_content(r'problem|timeout', is_regex=True, max_workers=2)),
+                         [('notes.txt', 4, 38), ('report.md', 1, 3)])
+        self.assertEqual(list(search.search_by_content('error', file_extension='md', max_workers=2)), [])
+
+    def test_search_by_content_many_files(self):
+        """
+        Test the search_by_content method for more files than the files handed to the processes at once.
+
+        This method checks that the occurrences of every batch are returned.
+        """
+        file_names = {f'file_{number}.log' for number in range(search_module.CONTENT_SEARCH_BATCH_SIZE + 50)}
+        for file_name in file_names:
+            self._write_file(file_name, b'header\nneedle\n')
+
+        matches = list(Search(self.folder_path).search_by_content('needle', file_extension='log', max_workers=2))
+
+        self.assertEqual(len(matches), len(file_names))
+        self.assertEqual({file for file, _, _ in matches}, file_names)
+        self.assertTrue(all((line_number, offset) == (2, 7) for _, line_number, offset in matches))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+
+from src.utilitybox.functionalities.sort import Sort
+
+
+class TestSort(unittest.TestCase):
+    """
+    Unit tests for the Sort module.
+    """
+
+    def setUp(self):
+        """
+        Create files of several types (some of them matching more than one extension) in a temporary folder.
+        """
+        self.temporary_folder = tempfile.TemporaryDirectory()
+        self.folder_path = self.temporary_folder.name
+        for file_name in ['a.txt', 'b.txt', 'photo.jpg', 'backup.tar.gz', 'notes.gz', 'readme', 'song.mp3']:
+            with open(os.path.join(self.folder_path, file_name), 'w') as file:
+                file.write(file_name)
+        self.sort = Sort(self.folder_path)
+
+    def tearDown(self):
+        self.temporary_folder.cleanup()
+
+    def _folder_content(self, folder_name: str) -> list[str]:
+        return sorted(os.listdir(os.path.join(self.folder_path, folder_name)))
+
+    def test_plan_multiple_extensions(self):
+        """
+        Test the plan_multiple_extensions method.
+
+        This method checks that every file is planned for the first extension its name ends with, and
+        that nothing is moved while planning.
+        """
+        planned_moves = self.sort.plan_multiple_extensions(['tar.gz', 'txt', '', 'gz', 'pdf'])
+
+        self.assertEqual({extension: sorted(file_names) for extension, file_names in planned_moves.items()},
+                         {'tar.gz': ['backup.tar.gz'], 'txt': ['a.txt', 'b.txt'], 'gz': ['notes.gz'], 'pdf': []})
+        self.assertEqual(len(os.listdir(self.folder_path)), 7)
+
+    def test_index_multiple_extensions(self):
+        """
+        Test the index_multiple_extensions method.
+
+        This method checks that the files are moved like when sorting one extension after the other, and
+        that no folder is created for the extensions without files.
+        """
+        moved_files = list(self.sort.index_multiple_extensions('gz, txt,jpg,pdf'))
+
+        self.assertEqual(sorted(moved_files), sorted(os.path.join(self.folder_path, file_name) for file_name in
+                                                     ['a.txt', 'b.txt', 'photo.jpg', 'backup.tar.gz', 'notes.gz']))
+        self.assertEqual(self._folder_content('gz'), ['backup.tar.gz', 'notes.gz'])
+        self.assertEqual(self._folder_content('txt'), ['a.txt', 'b.txt'])
+        self.assertEqual(self._folder_content('jpg'), ['photo.jpg'])
+        self.assertFalse(os.path.exists(os.path.join(self.folder_path, 'pdf')))
+        self.assertEqual(sorted(os.listdir(self.folder_path)), ['gz', 'jpg', 'readme', 'song.mp3', 'txt'])
+
+
+if __name__ == '__main__':
+    unittest.main()